@@ -28,6 +28,8 @@ import math
 import random
 from typing import List
 
+import numpy as np
+
 
 class Rect:
 	"""Rectangle helper class for dungeon room placement and collision detection.
@@ -134,9 +136,9 @@ class Dungeon:
 	Attributes:
 		w (int): Width in tiles
 		h (int): Height in tiles
-		tiles (List[List[int]]): 2D grid of tile type constants
-		materials (List[List[int]]): 2D grid of material type constants
-		doors (List[List[int]]): 2D grid of door states (-1 means no door)
+		tiles (np.ndarray): uint8 (w, h) grid of tile type constants
+		materials (np.ndarray): uint8 (w, h) grid of material type constants
+		doors (np.ndarray): int8 (w, h) grid of door states (-1 means no door)
 		rooms (List[Rect]): List of rectangular room areas
 	"""
 	def __init__(self, w: int, h: int):
@@ -148,12 +150,13 @@ class Dungeon:
 		"""
 		self.w = w
 		self.h = h
+		# Grids are indexed [x, y]; each is one contiguous array so renderers can slice them directly
 		# Initialize all walls (tile types, not display chars)
-		self.tiles: List[List[int]] = [[TILE_WALL for _ in range(h)] for _ in range(w)]
+		self.tiles: np.ndarray = np.full((w, h), TILE_WALL, dtype=np.uint8)
 		# Materials grid, default to brick (matches initial walls)
-		self.materials: List[List[int]] = [[MAT_BRICK for _ in range(h)] for _ in range(w)]
+		self.materials: np.ndarray = np.full((w, h), MAT_BRICK, dtype=np.uint8)
 		# Doors grid, stores DOOR_OPEN, DOOR_CLOSED, etc. A value of -1 means no door.
-		self.doors: List[List[int]] = [[-1 for _ in range(h)] for _ in range(w)]
+		self.doors: np.ndarray = np.full((w, h), -1, dtype=np.int8)
 		self.rooms: List[Rect] = []
 		self.start_room_index: int = 0  # Index of the start room (always first room)
 		self.throne_room_index: int = -1  # Index of the throne room/exit (always last room)
@@ -164,6 +167,25 @@ class Dungeon:
 		self._large_width_requirement: int = MIN_LARGE_ROOM_WIDTH
 		self._large_height_requirement: int = MIN_LARGE_ROOM_HEIGHT
 		self._max_hallway_segment: int = MAX_HALLWAY_SEGMENT
+		# Derived per-tile fields, rebuilt lazily after the grid changes
+		self._wall_normals: tuple[np.ndarray, np.ndarray] | None = None
+		self._floor_labels: np.ndarray | None = None
+		self._floor_regions: list[frozenset[tuple[int, int]]] = []
+		self._total_bricks: int | None = None
+		# Bumped on every grid change so callers can key their own caches on it
+		self.version: int = 0
+
+	def invalidate_caches(self) -> None:
+		"""Drop derived per-tile fields so they are rebuilt on next access.
+
+		Also bumps ``version``. Call after writing to ``tiles`` or ``materials`` directly; the
+		carve/door/prefab helpers already do this themselves.
+		"""
+		self._wall_normals = None
+		self._floor_labels = None
+		self._floor_regions = []
+		self._total_bricks = None
+		self.version += 1
 
 	def carve_room(self, room: Rect) -> None:
 		"""Carve out a rectangular room in the dungeon.
@@ -174,23 +196,25 @@ class Dungeon:
 		Args:
 			room (Rect): Rectangle defining the room area
 		"""
-		for x in range(room.x1 + 1, room.x2 - 1):
-			for y in range(room.y1 + 1, room.y2 - 1):
-				if 0 <= x < self.w and 0 <= y < self.h:
-					self.tiles[x][y] = TILE_FLOOR
-					self.materials[x][y] = MAT_COBBLE
+		self.invalidate_caches()
+		interior = (slice(max(0, room.x1 + 1), max(0, min(self.w, room.x2 - 1))),
+			slice(max(0, room.y1 + 1), max(0, min(self.h, room.y2 - 1))))
+		self.tiles[interior] = TILE_FLOOR
+		self.materials[interior] = MAT_COBBLE
 
 	def carve_h_tunnel(self, x1: int, x2: int, y: int):
-		for x in range(min(x1, x2), max(x1, x2) + 1):
-			if 0 <= x < self.w and 0 <= y < self.h:
-				self.tiles[x][y] = TILE_FLOOR
-				self.materials[x][y] = MAT_COBBLE
+		self.invalidate_caches()
+		if 0 <= y < self.h:
+			run = slice(max(0, min(x1, x2)), max(0, min(self.w, max(x1, x2) + 1)))
+			self.tiles[run, y] = TILE_FLOOR
+			self.materials[run, y] = MAT_COBBLE
 
 	def carve_v_tunnel(self, y1: int, y2: int, x: int):
-		for y in range(min(y1, y2), max(y1, y2) + 1):
-			if 0 <= x < self.w and 0 <= y < self.h:
-				self.tiles[x][y] = TILE_FLOOR
-				self.materials[x][y] = MAT_COBBLE
+		self.invalidate_caches()
+		if 0 <= x < self.w:
+			run = slice(max(0, min(y1, y2)), max(0, min(self.h, max(y1, y2) + 1)))
+			self.tiles[x, run] = TILE_FLOOR
+			self.materials[x, run] = MAT_COBBLE
 
 	def _is_large_room(self, room: Rect) -> bool:
 		width = room.x2 - room.x1
@@ -285,20 +309,21 @@ class Dungeon:
 		"""Places a door at (x,y) if it's a valid wall location between floors."""
 		if not (0 < x < self.w - 1 and 0 < y < self.h - 1):
 			return False
-		if self.tiles[x][y] != TILE_WALL:
+		if self.tiles[x, y] != TILE_WALL:
 			return False
 
 		# Check for horizontal passage (floor left/right, wall above/below)
-		is_horizontal = (self.tiles[x-1][y] == TILE_FLOOR and self.tiles[x+1][y] == TILE_FLOOR and
-						 self.tiles[x][y-1] == TILE_WALL and self.tiles[x][y+1] == TILE_WALL)
+		is_horizontal = (self.tiles[x-1, y] == TILE_FLOOR and self.tiles[x+1, y] == TILE_FLOOR and
+						 self.tiles[x, y-1] == TILE_WALL and self.tiles[x, y+1] == TILE_WALL)
 		# Check for vertical passage
-		is_vertical = (self.tiles[x][y-1] == TILE_FLOOR and self.tiles[x][y+1] == TILE_FLOOR and
-					   self.tiles[x-1][y] == TILE_WALL and self.tiles[x+1][y] == TILE_WALL)
+		is_vertical = (self.tiles[x, y-1] == TILE_FLOOR and self.tiles[x, y+1] == TILE_FLOOR and
+					   self.tiles[x-1, y] == TILE_WALL and self.tiles[x+1, y] == TILE_WALL)
 
 		if is_horizontal or is_vertical:
-			self.tiles[x][y] = TILE_DOOR
-			self.doors[x][y] = DOOR_LOCKED if locked else DOOR_CLOSED
-			self.materials[x][y] = MAT_WOOD
+			self.invalidate_caches()
+			self.tiles[x, y] = TILE_DOOR
+			self.doors[x, y] = DOOR_LOCKED if locked else DOOR_CLOSED
+			self.materials[x, y] = MAT_WOOD
 			return True
 		return False
 
@@ -315,7 +340,7 @@ class Dungeon:
 		Returns:
 			True if this wall position is a valid room entrance
 		"""
-		if self.tiles[x][y] != TILE_WALL:
+		if self.tiles[x, y] != TILE_WALL:
 			return False
 			
 		# Check if this wall position is adjacent to any room interior
@@ -327,7 +352,7 @@ class Dungeon:
 		
 		for dx, dy in directions:
 			nx, ny = x + dx, y + dy
-			if 0 <= nx < self.w and 0 <= ny < self.h and self.tiles[nx][ny] == TILE_FLOOR:
+			if 0 <= nx < self.w and 0 <= ny < self.h and self.tiles[nx, ny] == TILE_FLOOR:
 				room_containing_neighbor = self._find_room_containing(nx, ny)
 				
 				if room_containing_neighbor is not None:
@@ -397,11 +422,21 @@ class Dungeon:
 		self._setup_throne_room()
 		
 		# After all rooms and corridors are carved, place doors at room entrances only.
+		# Only inner walls with a floor 4-neighbour can be entrances; mask those first and
+		# visit them in the same row-by-row order as a y-then-x scan
+		floor = self.tiles == TILE_FLOOR
+		near_floor = np.zeros_like(floor)
+		near_floor[1:, :] |= floor[:-1, :]
+		near_floor[:-1, :] |= floor[1:, :]
+		near_floor[:, 1:] |= floor[:, :-1]
+		near_floor[:, :-1] |= floor[:, 1:]
+		maybe_entrance = (self.tiles == TILE_WALL) & near_floor
+		maybe_entrance[[0, -1], :] = False
+		maybe_entrance[:, [0, -1]] = False
 		door_candidates = []
-		for y in range(1, self.h - 1):
-			for x in range(1, self.w - 1):
-				if self.tiles[x][y] == TILE_WALL and self._is_room_entrance(x, y):
-					door_candidates.append((x, y))
+		for y, x in np.argwhere(maybe_entrance.T).tolist():
+			if self._is_room_entrance(x, y):
+				door_candidates.append((x, y))
 
 		# Place doors at a random subset of room entrance candidates
 		placed_doors = 0
@@ -482,14 +517,15 @@ class Dungeon:
 			# Give the throne room special materials (marble for a royal look)
 			for x in range(throne_room.x1 + 1, throne_room.x2 - 1):
 				for y in range(throne_room.y1 + 1, throne_room.y2 - 1):
-					if 0 <= x < self.w and 0 <= y < self.h and self.tiles[x][y] == TILE_FLOOR:
-						self.materials[x][y] = MAT_MARBLE
+					if 0 <= x < self.w and 0 <= y < self.h and self.tiles[x, y] == TILE_FLOOR:
+						self.materials[x, y] = MAT_MARBLE
 			
 			# Make throne room walls also special (darker/more imposing)
 			for x in range(throne_room.x1, throne_room.x2):
 				for y in range(throne_room.y1, throne_room.y2):
-					if 0 <= x < self.w and 0 <= y < self.h and self.tiles[x][y] == TILE_WALL:
-						self.materials[x][y] = MAT_IRON  # Dark iron walls for throne room
+					if 0 <= x < self.w and 0 <= y < self.h and self.tiles[x, y] == TILE_WALL:
+						self.materials[x, y] = MAT_IRON  # Dark iron walls for throne room
+			self.invalidate_caches()
 
 	def is_throne_room(self, room_index: int) -> bool:
 		"""Check if the given room index is the throne room."""
@@ -944,12 +980,137 @@ class Dungeon:
 
 	def is_wall(self, x: int, y: int) -> bool:
 		if 0 <= x < self.w and 0 <= y < self.h:
-			return self.tiles[x][y] == TILE_WALL
+			return bool(self.tiles[x, y] == TILE_WALL)
 		return True
 
+	def total_bricks(self) -> int:
+		"""Return the number of brick wall tiles, cached until the grid is modified.
+
+		Returns:
+			int: Count of wall tiles with MAT_BRICK material
+		"""
+		if self._total_bricks is None:
+			self._total_bricks = int(np.count_nonzero((self.tiles == TILE_WALL) & (self.materials == MAT_BRICK)))
+		return self._total_bricks
+
+	def wall_normals(self) -> tuple[np.ndarray, np.ndarray]:
+		"""Return per-tile unit normals pointing from walls toward open space.
+
+		The field is computed for the whole map in one vectorized pass and
+		cached until the grid is modified. Non-wall tiles, and walls with no
+		open 4-neighbour (or with open space on opposite sides), get (0, 0).
+		Out-of-bounds neighbours count as closed.
+
+		Returns:
+			tuple[np.ndarray, np.ndarray]: (nx, ny) float arrays of shape (w, h)
+		"""
+		if self._wall_normals is None:
+			walls = self.tiles == TILE_WALL
+			open_padded = np.pad(~walls, 1, constant_values=False)
+			open_l = open_padded[:-2, 1:-1]
+			open_r = open_padded[2:, 1:-1]
+			open_u = open_padded[1:-1, :-2]
+			open_d = open_padded[1:-1, 2:]
+			nx = open_r.astype(np.float64) - open_l
+			ny = open_d.astype(np.float64) - open_u
+			length = np.hypot(nx, ny)
+			has_normal = walls & (length > 1e-6)
+			safe_len = np.where(has_normal, length, 1.0)
+			nx = np.where(has_normal, nx / safe_len, 0.0)
+			ny = np.where(has_normal, ny / safe_len, 0.0)
+			self._wall_normals = (nx, ny)
+		return self._wall_normals
+
+	def floor_region(self, x: int, y: int) -> frozenset[tuple[int, int]]:
+		"""Return the 4-connected region of floor tiles containing (x, y).
+
+		Regions are flood-filled the first time any of their tiles is asked
+		for and labelled in a per-tile array, so later queries from anywhere
+		in the same region return the cached set. The cache is dropped when
+		the grid is modified.
+
+		Args:
+			x (int): Tile X coordinate
+			y (int): Tile Y coordinate
+
+		Returns:
+			frozenset[tuple[int, int]]: Floor tiles in the region, or an empty
+			set if (x, y) is out of bounds or not a floor
+		"""
+		if not (0 <= x < self.w and 0 <= y < self.h) or self.tiles[x, y] != TILE_FLOOR:
+			return frozenset()
+		if self._floor_labels is None:
+			self._floor_labels = np.zeros((self.w, self.h), dtype=np.int32)
+		labels = self._floor_labels
+		label = int(labels[x, y])
+		if label:
+			return self._floor_regions[label - 1]
+		label = len(self._floor_regions) + 1
+		# Scanline fill: each seed expands to its whole vertical run of floor
+		# (``tiles[x]`` is one contiguous column), and only the first cell of
+		# every floor run beside it is pushed. Plain lists are much cheaper
+		# than ndarray scalars for this cell-by-cell walk.
+		tiles = self.tiles.tolist()
+		region: set[tuple[int, int]] = set()
+		seeds = [(x, y)]
+		while seeds:
+			cx, cy = seeds.pop()
+			if (cx, cy) in region:
+				continue
+			col = tiles[cx]
+			y0 = cy
+			while y0 > 0 and col[y0 - 1] == TILE_FLOOR:
+				y0 -= 1
+			y1 = cy
+			while y1 < self.h - 1 and col[y1 + 1] == TILE_FLOOR:
+				y1 += 1
+			region.update([(cx, ry) for ry in range(y0, y1 + 1)])
+			for nx in (cx - 1, cx + 1):
+				if not (0 <= nx < self.w):
+					continue
+				ncol = tiles[nx]
+				in_run = False
+				for ry in range(y0, y1 + 1):
+					if ncol[ry] == TILE_FLOOR:
+						if not in_run and (nx, ry) not in region:
+							seeds.append((nx, ry))
+						in_run = True
+					else:
+						in_run = False
+		labels[tuple(np.array(list(region)).T)] = label
+		frozen = frozenset(region)
+		self._floor_regions.append(frozen)
+		return frozen
+
+	def floor_region_mask(self, region: frozenset[tuple[int, int]]) -> np.ndarray:
+		"""Return a boolean (w, h) mask of the tiles in a floor region.
+
+		Regions returned by floor_region() are read straight from the label
+		array; any other set of tiles is scattered into a fresh mask.
+
+		Args:
+			region (frozenset[tuple[int, int]]): Tiles to mark, normally a
+				region returned by floor_region()
+
+		Returns:
+			np.ndarray: Boolean array of shape (w, h)
+		"""
+		if region and self._floor_labels is not None:
+			x, y = next(iter(region))
+			if 0 <= x < self.w and 0 <= y < self.h:
+				label = int(self._floor_labels[x, y])
+				if label and self._floor_regions[label - 1] is region:
+					return self._floor_labels == label
+		mask = np.zeros((self.w, self.h), dtype=np.bool_)
+		if region:
+			xs, ys = np.array(list(region)).T
+			inside = (xs >= 0) & (xs < self.w) & (ys >= 0) & (ys < self.h)
+			mask[xs[inside], ys[inside]] = True
+		return mask
+
 	def material_at(self, x: int, y: int) -> int:
 		if 0 <= x < self.w and 0 <= y < self.h:
-			return self.materials[x][y]
+			return int(self.materials[x, y])
 		return MAT_BRICK
 
 	def stamp_prefab(self, px: int, py: int, cells: List[str], legend: dict):
@@ -975,6 +1136,7 @@ class Dungeon:
 			'marble': MAT_MARBLE,
 			'wood': MAT_WOOD,
 		}
+		self.invalidate_caches()
 		h = len(cells)
 		w = len(cells[0]) if h else 0
 		for y in range(h):
@@ -996,8 +1158,8 @@ class Dungeon:
 					mat_name = 'cobble'
 				t = tile_map.get(tile_name, TILE_FLOOR)
 				m = mat_map.get(mat_name, MAT_COBBLE)
-				self.tiles[dx][dy] = t
-				self.materials[dx][dy] = m
+				self.tiles[dx, dy] = t
+				self.materials[dx, dy] = m
 
 
 def generate_dungeon(
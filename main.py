@@ -4,7 +4,11 @@ import time
 import random
 import math
 import re
-from typing import Callable, List, Dict, Optional, Tuple
+from functools import lru_cache
+from itertools import chain
+from typing import Callable, List, Dict, NamedTuple, Optional, Tuple
+
+import numpy as np
 
 # Windows-specific: enable ANSI escape processing for colors/cursor control
 msvcrt = None  # ensure defined on all platforms
@@ -19,13 +23,37 @@ if os.name == "nt":
 			kernel32.SetConsoleMode(handle, mode.value | 0x0004)  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
 	except Exception:
 		msvcrt = None
+# Bound once so the per-frame input poll skips the module attribute lookups
+_kbhit = msvcrt.kbhit if msvcrt is not None else None
+_getwch = msvcrt.getwch if msvcrt is not None else None
 
 
 # ---------------------------
 # Config
 # ---------------------------
+import base64
 import json
 
+# Optional fast JSON codec for saves; without it the stdlib writes the same compact documents
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+
+def dumps_save_json(data) -> bytes:
+	"""Serialize a save payload to compact UTF-8 JSON bytes, using orjson when installed."""
+	if orjson is not None:
+		return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+	return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def loads_save_json(raw: bytes):
+	"""Parse UTF-8 JSON save bytes, using orjson when installed."""
+	if orjson is not None:
+		return orjson.loads(raw)
+	return json.loads(raw)
+
 
 def load_settings(path: str) -> dict:
 	"""Load game settings from JSON file with fallback to defaults.
@@ -88,7 +116,13 @@ def load_settings(path: str) -> dict:
 		return defaults
 
 
-SETTINGS = load_settings(os.path.join(os.path.dirname(__file__), 'settings.json'))
+# Resource locations, resolved once at import
+BASE_DIR = os.path.dirname(__file__)
+PREFABS_DIR = os.path.join(BASE_DIR, 'prefabs')
+_blocky_font_file = os.path.join(BASE_DIR, "Blocky Sketch.ttf")
+BLOCKY_FONT_PATH: Optional[str] = _blocky_font_file if os.path.isfile(_blocky_font_file) else None
+
+SETTINGS = load_settings(os.path.join(BASE_DIR, 'settings.json'))
 
 FLOOR_CH = SETTINGS.get('floor', ' ')
 WALL_CH = SETTINGS.get('wall', '#')
@@ -96,11 +130,15 @@ PLAYER_CH = SETTINGS.get('player', '@')
 DARK_CH = SETTINGS.get('dark', ' ')
 
 # Save directory
-SAVE_DIR = os.path.join(os.path.dirname(__file__), 'saves')
+SAVE_DIR = os.path.join(BASE_DIR, 'saves')
 LAST_CHARACTER_FILE = os.path.join(SAVE_DIR, 'last_character.json')
+# Characters a save name may contain; runs of anything else collapse to '_'
+SAVE_NAME_CHAR_RE = re.compile(r"[A-Za-z0-9_-]")
+_SAVE_NAME_INVALID_RE = re.compile(r"[^A-Za-z0-9_-]+")
 
 LIGHT_RADIUS = 5  # tiles
 FPS = 30
+INPUT_POLL_INTERVAL = 0.005  # seconds between key checks while the terminal waits for its next frame
 
 # Pygame rendering base configuration
 BASE_GRID_W = 100
@@ -121,6 +159,7 @@ FLOOR_BROWN = (100, 75, 45)    # kept for minimap
 INK_DARK = (40, 28, 18)        # for accents and text
 PLAYER_GREEN = (60, 240, 90)   # bright green for player '@'
 VOID_BG = (12, 12, 14)         # distinct background for outside dungeon
+TRANSPARENT_COLORKEY = (255, 0, 255)  # colour key for undrawn cells in minimap surfaces (never a tile colour)
 
 # New tile palette for block rendering (greys)
 # Per request: walls very dark grey, floors light grey (slightly lighter)
@@ -143,7 +182,7 @@ TORCH_FLAME_COLOR = (255, 196, 112)
 TORCH_EMBER_COLOR = (255, 140, 60)
 TORCH_SCONCE_COLOR = (120, 90, 60)
 
-# Material -> base color mapping (render-agnostic; used by all renderers)
+# Material colour helpers (render-agnostic; used by all renderers); their tables follow the imports below
 def base_color_for_material(mat: int) -> tuple[int, int, int]:
 	"""Get the base RGB color for a material type.
 	
@@ -153,28 +192,7 @@ def base_color_for_material(mat: int) -> tuple[int, int, int]:
 	Returns:
 		tuple[int, int, int]: RGB color tuple (0-255 range)
 	"""
-	if mat == MAT_BRICK:
-		return WALL_MED_GREY
-	if mat == MAT_DIRT:
-		return DIRT_BROWN
-	if mat == MAT_MOSS:
-		return MOSS_GREEN
-	if mat == MAT_SAND:
-		return SAND_TAN
-	if mat == MAT_IRON:
-		return IRON_GREY
-	if mat == MAT_GRASS:
-		return GRASS_GREEN
-	if mat == MAT_WATER:
-		return WATER_BLUE
-	if mat == MAT_LAVA:
-		return LAVA_ORANGE
-	if mat == MAT_MARBLE:
-		return MARBLE_WHITE
-	if mat == MAT_WOOD:
-		return WOOD_BROWN
-	# default floors
-	return FLOOR_DARK_GREY
+	return MATERIAL_BASE_COLORS.get(mat, FLOOR_DARK_GREY)
 
 def lit_color_for_material(mat: int, t: float) -> tuple[int, int, int]:
 	"""Get the illuminated color for a material based on distance from light source.
@@ -187,14 +205,8 @@ def lit_color_for_material(mat: int, t: float) -> tuple[int, int, int]:
 		tuple[int, int, int]: RGB color tuple brightened based on light intensity
 	"""
 	# t in [0,1], near 1 close to player
-	base = base_color_for_material(mat)
-	if mat == MAT_BRICK or mat == MAT_IRON:
-		f = 0.6 + 0.4 * t  # Darker materials get less brightness variation
-	elif mat == MAT_WATER:
-		f = 0.5 + 0.3 * t  # Water has moderate brightness range
-	else:
-		f = 0.45 + 0.35 * t  # Default materials have standard brightness range
-	return scale_color(base, f)
+	offset, slope = MATERIAL_LIT_RANGES.get(mat, DEFAULT_LIT_RANGE)
+	return scale_color(base_color_for_material(mat), offset + slope * t)
 
 def dimmed_color_for_material(mat: int, alpha: float) -> tuple[int, int, int]:
 	"""Calculate fog-of-war dimmed color for a material.
@@ -209,34 +221,9 @@ def dimmed_color_for_material(mat: int, alpha: float) -> tuple[int, int, int]:
 	Returns:
 		tuple[int, int, int]: RGB color tuple dimmed for fog-of-war effect
 	"""
-	base = base_color_for_material(mat)
-
-	def fow_scale_for_material(m: int, a: float) -> float:
-		"""Calculate fog-of-war brightness scaling factor for a material.
-		
-		Args:
-			m (int): Material constant
-			a (float): Alpha value [0,1] for reveal progress
-			
-		Returns:
-			float: Scaling factor for color brightness in fog-of-war
-		"""
-		a = clamp(a, 0.0, 1.0)
-		# Nearly black for walls/iron bars (very dark FoW)
-		if m == MAT_BRICK or m == MAT_IRON:
-			s_min, s_max = 0.03, 0.10
-		elif m == MAT_WATER:
-			s_min, s_max = 0.04, 0.12
-		elif m in (MAT_LAVA, MAT_MARBLE, MAT_WOOD, MAT_SAND, MAT_MOSS, MAT_DIRT, MAT_GRASS):
-			# Non-wall surfaces (treat like floors, very dark FoW)
-			s_min, s_max = 0.12, 0.22
-		else:
-			# Default floors (e.g., cobble, very dark FoW)
-			s_min, s_max = 0.12, 0.22
-		return s_min + a * (s_max - s_min)
-
-	scale = fow_scale_for_material(mat, alpha)
-	return scale_color(base, scale)
+	s_min, s_max = MATERIAL_FOW_RANGES.get(mat, DEFAULT_FOW_RANGE)
+	a = max(0.0, min(1.0, alpha))
+	return scale_color(base_color_for_material(mat), s_min + a * (s_max - s_min))
 
 def scale_color(color: tuple[int, int, int], factor: float) -> tuple[int, int, int]:
 	"""Scale RGB color by a brightness factor.
@@ -265,7 +252,7 @@ def lerp_color(c1: tuple[int, int, int], c2: tuple[int, int, int], a: float) ->
 	Returns:
 		tuple[int, int, int]: Interpolated RGB color tuple
 	"""
-	a = clamp(a, 0.0, 1.0)
+	a = max(0.0, min(1.0, a))
 	return (
 		int(c1[0] + (c2[0] - c1[0]) * a),
 		int(c1[1] + (c2[1] - c1[1]) * a),
@@ -273,6 +260,36 @@ def lerp_color(c1: tuple[int, int, int], c2: tuple[int, int, int], a: float) ->
 	)
 
 
+def scale_color_array(colors: np.ndarray, factor) -> np.ndarray:
+	"""Vectorized scale_color() for a whole grid of colours.
+	
+	Args:
+		colors (np.ndarray): Array of RGB values with shape (..., 3)
+		factor: Scalar or array broadcastable to ``colors.shape[:-1]``; clamped to [0,1]
+		
+	Returns:
+		np.ndarray: Float array of truncated channel values, matching scale_color()
+	"""
+	f = np.clip(np.asarray(factor, dtype=np.float64), 0.0, 1.0)
+	return np.minimum(255.0, np.floor(colors * f[..., None]))
+
+
+def lerp_color_array(c1, c2: np.ndarray, a) -> np.ndarray:
+	"""Vectorized lerp_color() for a whole grid of colours.
+	
+	Args:
+		c1: Start colour, an RGB tuple or array broadcastable to ``c2``
+		c2 (np.ndarray): End colours with shape (..., 3)
+		a: Scalar or array broadcastable to ``c2.shape[:-1]``; clamped to [0,1]
+		
+	Returns:
+		np.ndarray: Float array of truncated channel values, matching lerp_color()
+	"""
+	start = np.asarray(c1, dtype=np.float64)
+	t = np.clip(np.asarray(a, dtype=np.float64), 0.0, 1.0)
+	return np.trunc(start + (c2 - start) * t[..., None])
+
+
 def get_term_size() -> tuple[int, int]:
 	"""Get terminal window size in characters.
 	
@@ -291,6 +308,8 @@ def get_term_size() -> tuple[int, int]:
 def clamp(v: float, a: float, b: float) -> float:
 	"""Clamp a value between minimum and maximum bounds.
 	
+	Per-frame colour and torch helpers inline ``max(a, min(b, v))`` instead of calling this.
+	
 	Args:
 		v (float): Value to clamp
 		a (float): Minimum bound
@@ -307,95 +326,312 @@ from prefab_loader import load_prefabs
 from parchment_renderer import ParchmentRenderer
 from sounds import get_sound_generator, get_water_drip_sfx
 from music import get_music_player
+
+# Material -> base color mapping (render-agnostic; used by all renderers); other ids are default floors
+MATERIAL_BASE_COLORS: dict[int, tuple[int, int, int]] = {
+	MAT_BRICK: WALL_MED_GREY,
+	MAT_DIRT: DIRT_BROWN,
+	MAT_MOSS: MOSS_GREEN,
+	MAT_SAND: SAND_TAN,
+	MAT_IRON: IRON_GREY,
+	MAT_GRASS: GRASS_GREEN,
+	MAT_WATER: WATER_BLUE,
+	MAT_LAVA: LAVA_ORANGE,
+	MAT_MARBLE: MARBLE_WHITE,
+	MAT_WOOD: WOOD_BROWN,
+}
+# Material -> (offset, slope) of the lit brightness factor; darker materials vary less with light
+MATERIAL_LIT_RANGES: dict[int, tuple[float, float]] = {
+	MAT_BRICK: (0.6, 0.4),
+	MAT_IRON: (0.6, 0.4),
+	MAT_WATER: (0.5, 0.3),
+}
+DEFAULT_LIT_RANGE = (0.45, 0.35)
+# Material -> (min, max) fog-of-war brightness; walls/iron bars are nearly black, other surfaces
+# (lava, marble, wood, sand, moss, dirt, grass and cobble floors) share the floor range
+MATERIAL_FOW_RANGES: dict[int, tuple[float, float]] = {
+	MAT_BRICK: (0.03, 0.10),
+	MAT_IRON: (0.03, 0.10),
+	MAT_WATER: (0.04, 0.12),
+}
+DEFAULT_FOW_RANGE = (0.12, 0.22)
+
 # ---------------------------
 # Save/Load helpers
 # ---------------------------
-def encode_tiles(dungeon: 'Dungeon') -> list[str]:
-	"""Encode dungeon tiles into a list of strings for serialization.
+def encode_tiles(dungeon: 'Dungeon') -> str:
+	"""Encode dungeon tiles as base64 of their packed wall bits for serialization.
 	
 	Args:
 		dungeon (Dungeon): The dungeon object to encode
 		
 	Returns:
-		list[str]: List of strings where each string represents a row,
-		           with '0' for floors and '1' for walls
+		str: Base64 text of ``np.packbits`` over the wall mask in x-major order
+		     (1 bit per tile, set for walls; doors and floors are stored as floors)
 	"""
-	# rows as strings of '0' floor and '1' wall
-	rows = []
-	for y in range(dungeon.h):
-		row = ['1' if dungeon.tiles[x][y] == TILE_WALL else '0' for x in range(dungeon.w)]
-		rows.append(''.join(row))
-	return rows
+	return encode_mask(dungeon.tiles == TILE_WALL)
 
 
-def decode_tiles(rows: list[str]) -> 'Dungeon':
-	"""Decode strings back into a Dungeon object.
+def decode_tiles(data, w: int = 0, h: int = 0) -> 'Dungeon':
+	"""Decode saved tiles back into a Dungeon object.
+	
+	Accepts the packed form written by encode_tiles() as well as the list of
+	'0'/'1' row strings used by older saves.
 	
 	Args:
-		rows (list[str]): List of strings where each represents a row,
-		                  with '0' for floors and '1' for walls
+		data: Base64 string from encode_tiles(), or a list of row strings with
+		      '0' for floors and '1' for walls
+		w (int): Dungeon width in tiles; required for the packed form
+		h (int): Dungeon height in tiles; required for the packed form
 		                  
 	Returns:
 		Dungeon: Reconstructed dungeon object with tiles set from encoded data
 	"""
-	h = len(rows)
-	w = len(rows[0]) if h > 0 else 0
+	if isinstance(data, str):
+		d = Dungeon(w, h)
+		d.tiles[:] = np.where(decode_mask(data, w, h), TILE_WALL, TILE_FLOOR)
+		return d
+	h = len(data)
+	w = len(data[0]) if h > 0 else 0
 	d = Dungeon(w, h)
-	for y, row in enumerate(rows):
-		for x, ch in enumerate(row):
-			d.tiles[x][y] = TILE_WALL if ch == '1' else TILE_FLOOR
+	if all(len(row) == w for row in data):
+		# Uniform rows decode as one (h, w) byte grid; anything other than '1' is a floor
+		codes = np.frombuffer(''.join(data).encode('ascii', 'replace'), dtype=np.uint8).reshape(h, w)
+		d.tiles[:] = np.where(codes.T == ord('1'), TILE_WALL, TILE_FLOOR)
+		return d
+	for y, row in enumerate(data):
+		# One byte per character; anything other than '1' is a floor
+		codes = np.frombuffer(row.encode('ascii', 'replace'), dtype=np.uint8)
+		d.tiles[:len(codes), y] = np.where(codes == ord('1'), TILE_WALL, TILE_FLOOR)
 	return d
 
-def encode_materials(dungeon: 'Dungeon') -> list[str]:
-	"""Encode dungeon materials into a list of strings for serialization.
+def encode_materials(dungeon: 'Dungeon') -> str | list[str]:
+	"""Encode dungeon materials for serialization.
 	
 	Args:
 		dungeon (Dungeon): The dungeon object whose materials to encode
 		
 	Returns:
-		list[str]: List of strings where each string represents a row,
-		           with single digit characters representing material types
+		str | list[str]: Base64 text of the material ids packed two per byte (high nibble
+		first) in x-major order, or digit row strings if an id does not fit in a nibble
 	"""
-	rows = []
-	for y in range(dungeon.h):
-		row = [str(dungeon.materials[x][y]) for x in range(dungeon.w)]
-		rows.append(''.join(row))
-	return rows
-
-def decode_materials(dungeon: 'Dungeon', rows: list[str]) -> 'Dungeon':
-	"""Decode material strings back into a Dungeon object's material grid.
+	flat = dungeon.materials.ravel()
+	if flat.max(initial=0) > 15:
+		return [''.join(map(str, row)) for row in dungeon.materials.T.tolist()]
+	if flat.size % 2:
+		flat = np.append(flat, 0)
+	packed = (flat[0::2] << 4) | flat[1::2]
+	return base64.b64encode(packed.astype(np.uint8).tobytes()).decode('ascii')
+
+def decode_materials(dungeon: 'Dungeon', data) -> 'Dungeon':
+	"""Decode saved materials back into a Dungeon object's material grid.
+	
+	Accepts the nibble-packed form written by encode_materials() as well as the
+	digit row strings used by older saves.
 	
 	Args:
 		dungeon (Dungeon): The dungeon object to update with materials
-		rows (list[str]): List of strings where each represents a row,
-		                  with single digits representing material types
+		data: Base64 string from encode_materials(), or a list of row strings
+		      with single digits representing material types
 		                  
 	Returns:
 		Dungeon: The same dungeon object with materials updated
 	"""
-	if not rows:
+	if not data:
+		return dungeon
+	dungeon.invalidate_caches()
+	if isinstance(data, str):
+		raw = np.frombuffer(base64.b64decode(data), dtype=np.uint8)
+		nibbles = np.stack([raw >> 4, raw & 0x0F], axis=1).ravel()
+		flat = dungeon.materials.ravel()
+		count = min(nibbles.size, flat.size)
+		flat[:count] = nibbles[:count]
+		dungeon.materials[...] = flat.reshape(dungeon.materials.shape)
+		return dungeon
+	rows = data[:dungeon.h]
+	if len(rows) == dungeon.h and all(len(row) == dungeon.w for row in rows):
+		# Uniform rows decode as one (h, w) digit grid
+		digits = np.frombuffer(''.join(rows).encode('ascii', 'replace'), dtype=np.uint8).reshape(dungeon.h, dungeon.w).T - ord('0')
+		valid = digits <= 9
+		dungeon.materials[valid] = digits[valid]
 		return dungeon
 	for y, row in enumerate(rows):
-		if y >= dungeon.h:
-			break
-		for x, ch in enumerate(row):
-			if x >= dungeon.w:
-				break
-			try:
-				dungeon.materials[x][y] = int(ch)
-			except Exception:
-				pass
+		# One digit per tile; characters that are not digits leave the tile unchanged
+		digits = np.frombuffer(row[:dungeon.w].encode('ascii', 'replace'), dtype=np.uint8) - ord('0')
+		valid = digits <= 9
+		dungeon.materials[:len(digits), y][valid] = digits[valid]
 	return dungeon
 
 
+# Per-tile boolean masks (shape (w, h), indexed [x, y]) for exploration tracking
+def new_tile_mask(d: Dungeon) -> np.ndarray:
+	"""Create an all-False boolean mask covering every tile of a dungeon.
+	
+	Args:
+		d (Dungeon): Dungeon whose dimensions the mask should match
+		
+	Returns:
+		np.ndarray: Boolean array of shape (d.w, d.h)
+	"""
+	return np.zeros((d.w, d.h), dtype=np.bool_)
+
+
+def mask_from_points(points, w: int, h: int) -> np.ndarray:
+	"""Build a boolean tile mask from (x, y) coordinate pairs.
+	
+	Out-of-bounds coordinates are ignored.
+	
+	Args:
+		points: Iterable of (x, y) pairs (tuples or 2-element lists from JSON)
+		w (int): Mask width in tiles
+		h (int): Mask height in tiles
+		
+	Returns:
+		np.ndarray: Boolean array of shape (w, h) with the given points set
+	"""
+	mask = np.zeros((w, h), dtype=np.bool_)
+	if not isinstance(points, (list, tuple, set, frozenset)):
+		points = list(points)
+	# Flatten straight into an int array; avoids building a temporary nested list/array per pair
+	pts = np.fromiter(chain.from_iterable(points), dtype=np.int64, count=2 * len(points)).reshape(-1, 2)
+	if pts.size:
+		xs, ys = pts[:, 0], pts[:, 1]
+		in_bounds = (xs >= 0) & (xs < w) & (ys >= 0) & (ys < h)
+		mask[xs[in_bounds], ys[in_bounds]] = True
+	return mask
+
+
+def points_from_mask(mask: np.ndarray) -> set[tuple[int, int]]:
+	"""Collect the set tiles of a boolean mask as (x, y) pairs.
+	
+	Args:
+		mask (np.ndarray): Boolean array of shape (w, h)
+		
+	Returns:
+		set[tuple[int, int]]: Coordinates of the True tiles, as plain ints
+	"""
+	xs, ys = np.nonzero(mask)
+	return set(zip(xs.tolist(), ys.tolist()))
+
+
+@lru_cache(maxsize=32)
+def disc_stencil(reach: int, limit_sq: float) -> np.ndarray:
+	"""Return the offsets within a squared distance as a read-only boolean stencil.
+	
+	Args:
+		reach (int): Half-size of the stencil in tiles
+		limit_sq (float): Largest squared distance from the centre that is included
+		
+	Returns:
+		np.ndarray: Boolean array of shape (2 * reach + 1, 2 * reach + 1) indexed [dx + reach, dy + reach]
+	"""
+	offsets = np.arange(-reach, reach + 1)
+	stencil = offsets[:, None] ** 2 + offsets[None, :] ** 2 <= limit_sq
+	stencil.flags.writeable = False
+	return stencil
+
+
+def stamp_disc(mask: np.ndarray, cx: int, cy: int, reach: int, limit_sq: float) -> None:
+	"""OR a disc around a centre into a tile mask in place, clipped to the map.
+	
+	Args:
+		mask (np.ndarray): Boolean (w, h) mask to update
+		cx (int): Centre X coordinate
+		cy (int): Centre Y coordinate
+		reach (int): Half-size of the disc's bounding square in tiles
+		limit_sq (float): Largest squared distance from the centre that is included
+	"""
+	w, h = mask.shape
+	x0, x1 = max(0, cx - reach), min(w, cx + reach + 1)
+	y0, y1 = max(0, cy - reach), min(h, cy + reach + 1)
+	if x0 >= x1 or y0 >= y1:
+		return
+	stencil = disc_stencil(reach, limit_sq)
+	mask[x0:x1, y0:y1] |= stencil[x0 - cx + reach:x1 - cx + reach, y0 - cy + reach:y1 - cy + reach]
+
+
+def encode_mask(mask: np.ndarray) -> str:
+	"""Encode a boolean tile mask as base64 of its packed bits for saving.
+	
+	Args:
+		mask (np.ndarray): Boolean array of shape (w, h)
+		
+	Returns:
+		str: Base64 text of ``np.packbits`` over the mask in x-major order (1 bit per tile)
+	"""
+	return base64.b64encode(np.packbits(mask, axis=None).tobytes()).decode('ascii')
+
+
+def decode_mask(data, w: int, h: int) -> np.ndarray:
+	"""Decode a saved tile mask.
+	
+	Accepts the packed form written by encode_mask() as well as the list of
+	[x, y] pairs used by older saves.
+	
+	Args:
+		data: Base64 string from encode_mask(), or an iterable of (x, y) pairs
+		w (int): Mask width in tiles
+		h (int): Mask height in tiles
+		
+	Returns:
+		np.ndarray: Boolean array of shape (w, h); missing trailing bits read as unset
+	"""
+	if isinstance(data, str):
+		raw = np.frombuffer(base64.b64decode(data), dtype=np.uint8)
+		return np.unpackbits(raw, count=w * h).astype(np.bool_).reshape(w, h)
+	return mask_from_points(data, w, h)
+
+
+def adjacent_to_mask(mask: np.ndarray) -> np.ndarray:
+	"""Mark tiles that have at least one 8-connected neighbour set in ``mask``.
+	
+	Args:
+		mask (np.ndarray): Boolean array of shape (w, h)
+		
+	Returns:
+		np.ndarray: Boolean array of the same shape; out-of-bounds neighbours count as unset
+	"""
+	# Separable 3x3 box count (columns then rows, four adds in place of eight shifted ORs);
+	# a tile has a set neighbour when the box holds more than the tile itself
+	padded = np.pad(mask.view(np.uint8), 1)
+	cols = padded[:-2] + padded[1:-1]
+	cols += padded[2:]
+	box = cols[:, :-2] + cols[:, 1:-1]
+	box += cols[:, 2:]
+	return box > mask
+
+
 # Reachability and exposed wall helpers
-from collections import deque
+from collections import OrderedDict, deque
+from itertools import islice, repeat
 
-def compute_reachable_floors(d: Dungeon, start_x: int, start_y: int) -> set[tuple[int, int]]:
+def find_first_open_tile(d: Dungeon, default: tuple[int, int] = (1, 1)) -> tuple[int, int]:
+	"""Find the first non-wall tile in row-major (y, then x) order.
+	
+	Used as a placement fallback when a dungeon has no rooms.
+	
+	Args:
+		d (Dungeon): The dungeon to search
+		default (tuple[int, int]): Position returned when every tile is a wall
+		
+	Returns:
+		tuple[int, int]: (x, y) of the first open tile, or ``default``
+	"""
+	# Transpose to (h, w) so argwhere's ordering matches a y-outer scan
+	open_tiles = np.argwhere(d.tiles.T != TILE_WALL)
+	if open_tiles.size == 0:
+		return default
+	y, x = open_tiles[0]
+	return int(x), int(y)
+
+def compute_reachable_floors(d: Dungeon, start_x: int, start_y: int) -> frozenset[tuple[int, int]]:
 	"""Find all floor tiles reachable from a starting position via flood fill.
 	
 	Uses 4-directional connectivity (up/down/left/right) to determine reachability.
 	If the starting position is not a floor, searches nearby for the closest floor.
+	The region itself comes from ``Dungeon.floor_region``, which is cached per
+	connected component, so repeated calls from the same area are cheap and
+	return the same set until the grid changes.
 	
 	Args:
 		d (Dungeon): The dungeon to analyze
@@ -403,19 +639,18 @@ def compute_reachable_floors(d: Dungeon, start_x: int, start_y: int) -> set[tupl
 		start_y (int): Starting Y coordinate
 		
 	Returns:
-		set[tuple[int, int]]: Set of (x, y) coordinates of all reachable floor tiles
+		frozenset[tuple[int, int]]: Set of (x, y) coordinates of all reachable floor tiles
 	"""
-	reachable = set()
 	if not (0 <= start_x < d.w and 0 <= start_y < d.h):
-		return reachable
-	if d.tiles[start_x][start_y] != TILE_FLOOR:
+		return frozenset()
+	if d.tiles[start_x, start_y] != TILE_FLOOR:
 		# find nearest floor within a small radius
 		for r in range(1, 8):
 			found = False
 			for dx in range(-r, r + 1):
 				for dy in range(-r, r + 1):
 					x, y = start_x + dx, start_y + dy
-					if 0 <= x < d.w and 0 <= y < d.h and d.tiles[x][y] == TILE_FLOOR:
+					if 0 <= x < d.w and 0 <= y < d.h and d.tiles[x, y] == TILE_FLOOR:
 						start_x, start_y = x, y
 						found = True
 						break
@@ -423,20 +658,7 @@ def compute_reachable_floors(d: Dungeon, start_x: int, start_y: int) -> set[tupl
 					break
 			if found:
 				break
-		if d.tiles[start_x][start_y] != TILE_FLOOR:
-			return reachable
-	q = deque()
-	q.append((start_x, start_y))
-	reachable.add((start_x, start_y))
-	while q:
-		x, y = q.popleft()
-		for dx, dy in ((1,0),(-1,0),(0,1),(0,-1)):
-			nx, ny = x + dx, y + dy
-			if 0 <= nx < d.w and 0 <= ny < d.h:
-				if d.tiles[nx][ny] == TILE_FLOOR and (nx, ny) not in reachable:
-					reachable.add((nx, ny))
-					q.append((nx, ny))
-	return reachable
+	return d.floor_region(start_x, start_y)
 
 def count_total_exposed_walls(d: Dungeon, reachable_floors: set[tuple[int, int]] | None = None) -> int:
 	"""Count wall tiles that are adjacent to at least one floor tile.
@@ -450,101 +672,50 @@ def count_total_exposed_walls(d: Dungeon, reachable_floors: set[tuple[int, int]]
 	Returns:
 		int: Number of wall tiles that have at least one adjacent floor tile
 	"""
-	total = 0
-	for y in range(d.h):
-		for x in range(d.w):
-			if d.tiles[x][y] != TILE_WALL:
-				continue
-			exposed = False
-			for dy in (-1, 0, 1):
-				for dx in (-1, 0, 1):
-					if dx == 0 and dy == 0:
-						continue
-					nx, ny = x + dx, y + dy
-					if 0 <= nx < d.w and 0 <= ny < d.h and d.tiles[nx][ny] == TILE_FLOOR:
-						if reachable_floors is None or (nx, ny) in reachable_floors:
-							exposed = True
-							break
-				if exposed:
-					break
-			if exposed:
-				total += 1
-	return total
+	return int(np.count_nonzero(exposed_wall_mask(d, reachable_floors)))
 
 
-def count_total_exposed_bricks(d: Dungeon, reachable_floors: set[tuple[int, int]] | None = None) -> int:
-	"""Count exposed brick walls (MAT_BRICK) adjacent to at least one floor tile.
+def exposed_wall_mask(d: Dungeon, reachable_floors: set[tuple[int, int]] | None = None) -> np.ndarray:
+	"""Mark wall tiles that are adjacent to at least one floor tile.
 	
 	Args:
 		d (Dungeon): The dungeon to analyze
-		reachable_floors (set[tuple[int, int]], optional): If provided, only count
-		                  brick walls exposed to reachable floor tiles. If None,
-		                  counts exposed to any floor (not recommended for gating).
+		reachable_floors (set[tuple[int, int]], optional): If provided, only
+		                  floors in this set expose a wall
 		                  
 	Returns:
-		int: Number of brick wall tiles that have at least one adjacent floor tile
+		np.ndarray: Boolean (w, h) mask of exposed walls
 	"""
-	total = 0
-	for y in range(d.h):
-		for x in range(d.w):
-			if d.tiles[x][y] != TILE_WALL:
-				continue
-			if d.materials[x][y] != MAT_BRICK:
-				continue
-			exposed = False
-			for dy in (-1, 0, 1):
-				for dx in (-1, 0, 1):
-					if dx == 0 and dy == 0:
-						continue
-					nx, ny = x + dx, y + dy
-					if 0 <= nx < d.w and 0 <= ny < d.h and d.tiles[nx][ny] == TILE_FLOOR:
-						if reachable_floors is None or (nx, ny) in reachable_floors:
-							exposed = True
-							break
-				if exposed:
-					break
-			if exposed:
-				total += 1
-	return total
-
-def count_exposed_bricks_touched(d: Dungeon, touched: set[tuple[int,int]], reachable_floors: set[tuple[int,int]]) -> int:
-	"""Count how many touched brick walls are exposed to reachable floor tiles.
+	tiles = d.tiles
+	floors = tiles == TILE_FLOOR
+	if isinstance(reachable_floors, frozenset):
+		floors &= d.floor_region_mask(reachable_floors)
+	elif reachable_floors is not None:
+		floors &= mask_from_points(reachable_floors, d.w, d.h)
+	return (tiles == TILE_WALL) & adjacent_to_mask(floors)
+
+def count_exposed_bricks(d: Dungeon, touched: np.ndarray, reachable_floors: set[tuple[int, int]] | None = None, exposed: np.ndarray | None = None) -> tuple[int, int]:
+	"""Count exposed brick walls, and how many of them have been touched.
 	
-	Safe against overcounting; processes all touched coordinates and validates
-	that they are still valid brick walls exposed to reachable floors.
+	Both counts come from one exposed-brick mask. Touched marks on tiles that
+	are no longer exposed bricks are ignored, so the touched count never
+	exceeds the total.
 	
 	Args:
 		d (Dungeon): The dungeon to analyze
-		touched (set[tuple[int,int]]): Set of (x,y) coordinates that have been touched
-		reachable_floors (set[tuple[int,int]]): Set of reachable floor coordinates
+		touched (np.ndarray): Boolean (w, h) mask of touched tiles
+		reachable_floors (set[tuple[int, int]], optional): If provided, only
+		                  brick walls exposed to reachable floor tiles count
+		exposed (np.ndarray, optional): exposed_wall_mask(d, reachable_floors),
+		                  when the caller already has it
 		
 	Returns:
-		int: Number of touched brick walls that are exposed to reachable floors
+		tuple[int, int]: (exposed brick walls, touched exposed brick walls)
 	"""
-	if not touched:
-		return 0
-	cnt = 0
-	for (bx, by) in touched:
-		if not (0 <= bx < d.w and 0 <= by < d.h):
-			continue
-		if d.tiles[bx][by] != TILE_WALL:
-			continue
-		if d.materials[bx][by] != MAT_BRICK:
-			continue
-		exposed = False
-		for dy in (-1, 0, 1):
-			for dx in (-1, 0, 1):
-				if dx == 0 and dy == 0:
-					continue
-				nx, ny = bx + dx, by + dy
-				if 0 <= nx < d.w and 0 <= ny < d.h and d.tiles[nx][ny] == TILE_FLOOR and (nx, ny) in reachable_floors:
-					exposed = True
-					break
-			if exposed:
-				break
-		if exposed:
-			cnt += 1
-	return cnt
+	if exposed is None:
+		exposed = exposed_wall_mask(d, reachable_floors)
+	exposed_bricks = exposed & (d.materials == MAT_BRICK)
+	return int(np.count_nonzero(exposed_bricks)), int(np.count_nonzero(touched & exposed_bricks))
 
 def count_total_bricks(d: Dungeon) -> int:
 	"""Count total number of brick wall tiles in the dungeon.
@@ -555,15 +726,7 @@ def count_total_bricks(d: Dungeon) -> int:
 	Returns:
 		int: Total count of wall tiles with MAT_BRICK material
 	"""
-	total = 0
-	for y in range(d.h):
-		for x in range(d.w):
-			try:
-				if d.tiles[x][y] == TILE_WALL and d.materials[x][y] == MAT_BRICK:
-					total += 1
-			except Exception:
-				continue
-	return total
+	return d.total_bricks()
 
 def count_total_walls(d: Dungeon) -> int:
 	"""Count total number of wall tiles in the dungeon.
@@ -574,12 +737,7 @@ def count_total_walls(d: Dungeon) -> int:
 	Returns:
 		int: Total count of wall tiles regardless of material
 	"""
-	total = 0
-	for y in range(d.h):
-		for x in range(d.w):
-			if d.tiles[x][y] == TILE_WALL:
-				total += 1
-	return total
+	return int(np.count_nonzero(d.tiles == TILE_WALL))
 
 def count_total_floors(d: Dungeon) -> int:
 	"""Count total number of floor tiles in the dungeon.
@@ -590,20 +748,15 @@ def count_total_floors(d: Dungeon) -> int:
 	Returns:
 		int: Total count of floor tiles regardless of material
 	"""
-	total = 0
-	for y in range(d.h):
-		for x in range(d.w):
-			if d.tiles[x][y] == TILE_FLOOR:
-				total += 1
-	return total
+	return int(np.count_nonzero(d.tiles == TILE_FLOOR))
 
 
-def session_to_dict(dungeon: 'Dungeon', explored: set, px: int, py: int, levels: list | None = None, current_index: int = 0) -> dict:
+def session_to_dict(dungeon: 'Dungeon', explored: np.ndarray, px: int, py: int, levels: list | None = None, current_index: int = 0) -> dict:
 	"""Convert current game session to a dictionary for serialization.
 	
 	Args:
 		dungeon (Dungeon): Current dungeon state
-		explored (set): Set of explored tile coordinates
+		explored (np.ndarray): Boolean (w, h) mask of explored tiles
 		px (int): Player X coordinate
 		py (int): Player Y coordinate
 		levels (list, optional): List of level data. If None, creates from current dungeon
@@ -620,7 +773,7 @@ def session_to_dict(dungeon: 'Dungeon', explored: set, px: int, py: int, levels:
 			'w': dungeon.w,
 			'h': dungeon.h,
 			'tiles': encode_tiles(dungeon),
-			'explored': list(sorted(explored)),
+			'explored': encode_mask(explored),
 			'materials': encode_materials(dungeon),
 			'player': [px, py],
 		}]
@@ -632,14 +785,14 @@ def session_to_dict(dungeon: 'Dungeon', explored: set, px: int, py: int, levels:
 	return data
 
 
-def dict_to_session(data: dict) -> tuple['Dungeon', set, int, int, list, int]:
+def dict_to_session(data: dict) -> tuple['Dungeon', np.ndarray, int, int, list, int]:
 	"""Convert dictionary data back to game session objects.
 	
 	Args:
 		data (dict): Dictionary containing serialized session data
 		
 	Returns:
-		tuple: (dungeon, explored_set, player_x, player_y, levels_list, current_index)
+		tuple: (dungeon, explored_mask, player_x, player_y, levels_list, current_index)
 		
 	Raises:
 		ValueError: If save data is invalid or corrupted
@@ -652,10 +805,9 @@ def dict_to_session(data: dict) -> tuple['Dungeon', set, int, int, list, int]:
 			raise ValueError('No levels in save')
 		idx = max(0, min(idx, len(levels) - 1))
 		cur = levels[idx]
-		d = decode_tiles(cur['tiles'])
+		d = decode_tiles(cur['tiles'], cur.get('w', 0), cur.get('h', 0))
 		d = decode_materials(d, cur.get('materials', []))
-		explored_list = cur.get('explored', [])
-		explored = set(tuple(e) for e in explored_list)
+		explored = decode_mask(cur.get('explored', []), d.w, d.h)
 		px, py = cur.get('player', [1, 1])
 		return d, explored, int(px), int(py), levels, idx
 	except Exception as e:
@@ -674,10 +826,23 @@ def sanitize_name(name: str) -> str:
 		str: Sanitized filename safe for filesystem use, max 40 chars
 	"""
 	name = name.strip()
-	name = re.sub(r"[^A-Za-z0-9_-]+", "_", name)
+	name = _SAVE_NAME_INVALID_RE.sub("_", name)
 	return name[:40] if name else "player"
 
 
+@lru_cache(maxsize=128)
+def save_path(name: str) -> str:
+	"""Return the save file path for a (raw, unsanitized) save name.
+	
+	Args:
+		name (str): Save name as entered by the user
+		
+	Returns:
+		str: Path of the JSON save file inside SAVE_DIR
+	"""
+	return os.path.join(SAVE_DIR, f"{sanitize_name(name)}.json")
+
+
 def set_last_character_name(name: str) -> None:
 	"""Persist the most recently used character name for quick loading.
 
@@ -726,20 +891,39 @@ def save_exists(name: str) -> bool:
 	"""Check whether a sanitized save file exists on disk."""
 	if not name:
 		return False
-	path = os.path.join(SAVE_DIR, f"{sanitize_name(name)}.json")
+	path = save_path(name)
 	return os.path.isfile(path)
 
 
+def read_save_json(path: str):
+	"""Parse a JSON save file.
+	
+	The file is read as bytes in one call and handed straight to the save codec, skipping
+	the text-mode decode.
+	
+	Args:
+		path (str): Path to the JSON file
+		
+	Returns:
+		The decoded JSON value
+		
+	Raises:
+		OSError: If the file cannot be opened or read
+		ValueError: If the file is not valid JSON
+	"""
+	with open(path, 'rb') as f:
+		return loads_save_json(f.read())
+
+
 def load_character_profile_snapshot(name: str):
 	"""Attempt to reconstruct a character profile from a saved JSON file."""
 	if not name:
 		return None
-	path = os.path.join(SAVE_DIR, f"{sanitize_name(name)}.json")
+	path = save_path(name)
 	if not os.path.isfile(path):
 		return None
 	try:
-		with open(path, 'r', encoding='utf-8') as f:
-			data = json.load(f)
+		data = read_save_json(path)
 	except Exception:
 		return None
 	if not isinstance(data, dict) or 'levels' in data:
@@ -786,17 +970,18 @@ def get_most_recent_save_name() -> Optional[str]:
 		return None
 	latest_name: Optional[str] = None
 	latest_mtime = -1.0
-	for fn in os.listdir(SAVE_DIR):
-		if not fn.lower().endswith('.json'):
-			continue
-		path = os.path.join(SAVE_DIR, fn)
-		try:
-			mtime = os.path.getmtime(path)
-		except OSError:
-			continue
-		if mtime > latest_mtime:
-			latest_mtime = mtime
-			latest_name = os.path.splitext(fn)[0]
+	# DirEntry.stat() reuses what the directory scan already fetched where the platform provides it
+	with os.scandir(SAVE_DIR) as entries:
+		for entry in entries:
+			if not entry.name.lower().endswith('.json'):
+				continue
+			try:
+				mtime = entry.stat().st_mtime
+			except OSError:
+				continue
+			if mtime > latest_mtime:
+				latest_mtime = mtime
+				latest_name = os.path.splitext(entry.name)[0]
 	return latest_name
 
 
@@ -813,13 +998,41 @@ def default_load_index(load_names: list[str]) -> int:
 	return 0
 
 
-def save_session(name: str, dungeon: 'Dungeon', explored: set, px: int, py: int, levels: list | None = None, current_index: int = 0) -> str:
+def write_save_atomic(path: str, payload: bytes) -> None:
+	"""Write a save file so that readers only ever see the old or the complete new contents.
+	
+	The payload goes to a sibling ``.tmp`` file that is flushed to disk and then
+	renamed over ``path``; an interrupted save leaves the previous file intact.
+	
+	Args:
+		path (str): Destination save file
+		payload (bytes): Serialized save data
+		
+	Raises:
+		OSError: If the temporary file cannot be written or moved into place
+	"""
+	tmp_path = path + '.tmp'
+	try:
+		with open(tmp_path, 'wb') as f:
+			f.write(payload)
+			f.flush()
+			os.fsync(f.fileno())
+		os.replace(tmp_path, path)
+	except OSError:
+		try:
+			os.remove(tmp_path)
+		except OSError:
+			pass
+		raise
+
+
+def save_session(name: str, dungeon: 'Dungeon', explored: np.ndarray, px: int, py: int, levels: list | None = None, current_index: int = 0) -> str:
 	"""Save current game session to disk as JSON file.
 	
 	Args:
 		name (str): Save file name (will be sanitized)
 		dungeon (Dungeon): Current dungeon state
-		explored (set): Set of explored tile coordinates
+		explored (np.ndarray): Boolean (w, h) mask of explored tiles
 		px (int): Player X coordinate
 		py (int): Player Y coordinate
 		levels (list, optional): List of level data. If None, creates from current dungeon
@@ -831,65 +1044,69 @@ def save_session(name: str, dungeon: 'Dungeon', explored: set, px: int, py: int,
 	os.makedirs(SAVE_DIR, exist_ok=True)
 	data = session_to_dict(dungeon, explored, px, py, levels=levels, current_index=current_index)
 	sanitized = sanitize_name(name)
-	path = os.path.join(SAVE_DIR, f"{sanitized}.json")
-	with open(path, 'w', encoding='utf-8') as f:
-		json.dump(data, f)
+	path = save_path(name)
+	write_save_atomic(path, dumps_save_json(data))
 	set_last_character_name(sanitized)
 	return path
 
 
-def load_session(name: str) -> tuple['Dungeon', set, int, int, list, int]:
+def load_session(name: str) -> tuple['Dungeon', np.ndarray, int, int, list, int]:
 	"""Load a game session from disk.
 	
 	Args:
 		name (str): Save file name (will be sanitized)
 		
 	Returns:
-		tuple: (dungeon, explored_set, player_x, player_y, levels_list, current_index)
+		tuple: (dungeon, explored_mask, player_x, player_y, levels_list, current_index)
 		
 	Raises:
 		FileNotFoundError: If save file doesn't exist
 		Exception: If save file is corrupted or invalid
 	"""
-	path = os.path.join(SAVE_DIR, f"{sanitize_name(name)}.json")
-	with open(path, 'r', encoding='utf-8') as f:
-		data = json.load(f)
+	path = save_path(name)
+	data = read_save_json(path)
 	return dict_to_session(data)
 
 
-def hydrate_levels_from_save(levels_payload: list[dict], current_index: int) -> tuple[list[dict], int, 'Dungeon', set[tuple[int, int]], int, int, set[tuple[int, int]], int, set[tuple[int, int]], set[tuple[int, int]], set[tuple[int, int]], int, int, list[dict]]:
+def hydrate_levels_from_save(levels_payload: list[dict], current_index: int) -> tuple[list[dict], int, 'Dungeon', np.ndarray, int, int, np.ndarray, int, np.ndarray, np.ndarray, np.ndarray, int, int, list[dict]]:
 	"""Convert serialized level payloads into live runtime structures."""
 	new_levels: list[dict] = []
 	for level in levels_payload:
-		dungeon_tiles = decode_tiles(level['tiles'])
+		dungeon_tiles = decode_tiles(level['tiles'], level.get('w', 0), level.get('h', 0))
 		dungeon_tiles = decode_materials(dungeon_tiles, level.get('materials', []))
-		explored = set(tuple(pt) for pt in level.get('explored', []))
+		w, h = dungeon_tiles.w, dungeon_tiles.h
+		explored = decode_mask(level.get('explored', []), w, h)
 		player_pos = level.get('player', [1, 1])
 		px = int(player_pos[0]) if player_pos else 1
 		py = int(player_pos[1]) if player_pos else 1
-		bricks = set(tuple(pt) for pt in level.get('bricks_touched', []))
-		total_bricks = int(level.get('total_bricks', count_total_bricks(dungeon_tiles)))
-		walls = set(tuple(pt) for pt in level.get('walls_touched', []))
-		floors = set(tuple(pt) for pt in level.get('floors_touched', []))
-		floors_stepped = set(tuple(pt) for pt in level.get('floors_stepped', []))
-		total_walls = int(level.get('total_walls', count_total_walls(dungeon_tiles)))
-		total_floors = int(level.get('total_floors', count_total_floors(dungeon_tiles)))
+		bricks = decode_mask(level.get('bricks_touched', []), w, h)
+		total_bricks = level.get('total_bricks')
+		if total_bricks is None:
+			total_bricks = count_total_bricks(dungeon_tiles)
+		walls = decode_mask(level.get('walls_touched', []), w, h)
+		floors = decode_mask(level.get('floors_touched', []), w, h)
+		floors_stepped = decode_mask(level.get('floors_stepped', []), w, h)
+		total_walls = level.get('total_walls')
+		if total_walls is None:
+			total_walls = count_total_walls(dungeon_tiles)
+		total_floors = level.get('total_floors')
+		if total_floors is None:
+			total_floors = count_total_floors(dungeon_tiles)
 		torch_payload = level.get('torches')
 		if torch_payload is None:
 			torch_payload = serialize_torches(generate_wall_torches(dungeon_tiles))
-		torches = deserialize_torches(torch_payload)
 		new_levels.append({
 			'dungeon': dungeon_tiles,
 			'explored': explored,
 			'player': (px, py),
 			'bricks_touched': bricks,
-			'total_bricks': total_bricks,
+			'total_bricks': int(total_bricks),
 			'walls_touched': walls,
 			'floors_touched': floors,
 			'floors_stepped': floors_stepped,
-			'total_walls': total_walls,
-			'total_floors': total_floors,
-			'torches': serialize_torches(torches),
+			'total_walls': int(total_walls),
+			'total_floors': int(total_floors),
+			'torches': normalize_torches(torch_payload),
 		})
 
 	if not new_levels:
@@ -924,10 +1141,8 @@ def list_saves() -> list[str]:
 	"""
 	if not os.path.isdir(SAVE_DIR):
 		return []
-	files = []
-	for fn in os.listdir(SAVE_DIR):
-		if fn.lower().endswith('.json'):
-			files.append(os.path.splitext(fn)[0])
+	with os.scandir(SAVE_DIR) as entries:
+		files = [os.path.splitext(entry.name)[0] for entry in entries if entry.name.lower().endswith('.json')]
 	files.sort()
 	return files
 
@@ -966,11 +1181,15 @@ def serialize_torches(torch_list: list[dict]) -> list[dict]:
 	return serialized
 
 
-def deserialize_torches(data: list[dict]) -> list[dict]:
-	"""Create runtime torch descriptors from serialized data."""
-	torches: list[dict] = []
+def normalize_torches(data: list[dict]) -> list[dict]:
+	"""Validate serialized torch entries into the form serialize_torches() writes.
+	
+	Equivalent to ``serialize_torches(deserialize_torches(data))`` without building
+	runtime descriptors or drawing a flicker phase for each torch.
+	"""
+	normalized: list[dict] = []
 	if not data:
-		return torches
+		return normalized
 	for entry in data:
 		if not isinstance(entry, dict):
 			continue
@@ -980,75 +1199,185 @@ def deserialize_torches(data: list[dict]) -> list[dict]:
 			continue
 		dir_raw = entry.get('dir') or entry.get('direction') or (0, 1)
 		if isinstance(dir_raw, (list, tuple)) and len(dir_raw) == 2:
-			dir_vec = (int(dir_raw[0]), int(dir_raw[1]))
+			dir_vec = [int(dir_raw[0]), int(dir_raw[1])]
 		else:
-			dir_vec = (0, 1)
-		torches.append(create_torch(int(x), int(y), dir_vec))
-	return torches
+			dir_vec = [0, 1]
+		if dir_vec == [0, 0]:
+			dir_vec = [0, 1]
+		normalized.append({'x': int(x), 'y': int(y), 'dir': dir_vec})
+	return normalized
+
+
+def deserialize_torches(data: list[dict]) -> list[dict]:
+	"""Create runtime torch descriptors from serialized data."""
+	return [create_torch(entry['x'], entry['y'], entry['dir']) for entry in normalize_torches(data)]
+
+
+def is_torch_candidate(tiles: list[list[int]], w: int, h: int, wx: int, wy: int, dx: int, dy: int) -> bool:
+	"""Check whether a wall tile can hold a torch facing into the room.
+	
+	Args:
+		tiles (list[list[int]]): Tile grid indexed [x][y], as nested lists
+		w (int): Map width in tiles
+		h (int): Map height in tiles
+		wx (int): Wall X coordinate
+		wy (int): Wall Y coordinate
+		dx (int): X component of the direction the torch faces
+		dy (int): Y component of the direction the torch faces
+		
+	Returns:
+		bool: True if the tile is a wall and the tile it faces is open floor
+	"""
+	ix, iy = wx + dx, wy + dy
+	if not (0 <= wx < w and 0 <= wy < h):
+		return False
+	if not (0 <= ix < w and 0 <= iy < h):
+		return False
+	if tiles[wx][wy] != TILE_WALL:
+		return False
+	interior_tile = tiles[ix][iy]
+	return interior_tile != TILE_WALL and interior_tile != TILE_DOOR
 
 
 def generate_wall_torches(dungeon: Dungeon, max_per_room: int = 2, placement_chance: float = 0.45) -> list[dict]:
 	"""Place decorative torches on select room walls."""
 	torches: list[dict] = []
-	occupied: set[tuple[int, int]] = set()
-
-	def is_near_existing(pos: tuple[int, int]) -> bool:
-		px, py = pos
-		for existing in torches:
-			ex, ey = existing['x'], existing['y']
-			if abs(ex - px) + abs(ey - py) <= 1:
-				return True
-		return False
+	# Tiles within one orthogonal step of a placed torch
+	near_torch: set[tuple[int, int]] = set()
+	# Plain nested lists make the per-cell border checks list lookups instead of ndarray scalar reads
+	tiles = dungeon.tiles.tolist()
+	w, h = dungeon.w, dungeon.h
+	rnd = random.random
 
 	for room in dungeon.rooms:
 		candidates: list[tuple[tuple[int, int], tuple[int, int]]] = []
 
-		def consider(wx: int, wy: int, direction: tuple[int, int]) -> None:
-			ix, iy = wx + direction[0], wy + direction[1]
-			if not (0 <= wx < dungeon.w and 0 <= wy < dungeon.h):
-				return
-			if not (0 <= ix < dungeon.w and 0 <= iy < dungeon.h):
-				return
-			tile = dungeon.tiles[wx][wy]
-			interior_tile = dungeon.tiles[ix][iy]
-			if tile != TILE_WALL:
-				return
-			if interior_tile == TILE_WALL or interior_tile == TILE_DOOR:
-				return
-			candidates.append(((wx, wy), direction))
-
 		# Room bounds minus corners to avoid exterior walls
 		for x in range(room.x1 + 1, room.x2 - 1):
-			consider(x, room.y1, (0, 1))      # top wall facing down
-			consider(x, room.y2 - 1, (0, -1))  # bottom wall facing up
+			if is_torch_candidate(tiles, w, h, x, room.y1, 0, 1):          # top wall facing down
+				candidates.append(((x, room.y1), (0, 1)))
+			if is_torch_candidate(tiles, w, h, x, room.y2 - 1, 0, -1):     # bottom wall facing up
+				candidates.append(((x, room.y2 - 1), (0, -1)))
 		for y in range(room.y1 + 1, room.y2 - 1):
-			consider(room.x1, y, (1, 0))       # left wall facing right
-			consider(room.x2 - 1, y, (-1, 0))  # right wall facing left
+			if is_torch_candidate(tiles, w, h, room.x1, y, 1, 0):          # left wall facing right
+				candidates.append(((room.x1, y), (1, 0)))
+			if is_torch_candidate(tiles, w, h, room.x2 - 1, y, -1, 0):     # right wall facing left
+				candidates.append(((room.x2 - 1, y), (-1, 0)))
 
 		if not candidates:
 			continue
 
-		random.shuffle(candidates)
 		room_w = max(1, room.x2 - room.x1 - 2)
 		room_h = max(1, room.y2 - room.y1 - 2)
 		room_capacity = 1 if min(room_w, room_h) < 4 else max_per_room
 		placed = 0
-		for (pos, direction) in candidates:
+		# Shuffle lazily (Fisher-Yates, one swap per visit) since the room usually fills after a few candidates
+		count = len(candidates)
+		for i in range(count):
 			if placed >= room_capacity:
 				break
-			if pos in occupied or is_near_existing(pos):
+			j = i + int(rnd() * (count - i))
+			candidates[i], candidates[j] = candidates[j], candidates[i]
+			pos, direction = candidates[i]
+			if pos in near_torch:
 				continue
-			if random.random() > placement_chance:
+			if rnd() > placement_chance:
 				continue
-			torch = create_torch(pos[0], pos[1], direction)
+			wx, wy = pos
+			torch = create_torch(wx, wy, direction)
 			torches.append(torch)
-			occupied.add(pos)
+			near_torch.update(((wx, wy), (wx - 1, wy), (wx + 1, wy), (wx, wy - 1), (wx, wy + 1)))
 			placed += 1
 
 	return torches
 
 
 # Field of View via symmetrical shadowcasting (8 octants)
+# Axis transforms (xx, xy, yx, yy) mapping octant-local offsets onto the map for the 8 octants
+FOV_OCTANTS = (
+	(1, 0, 0, 1),
+	(0, 1, 1, 0),
+	(0, -1, 1, 0),
+	(1, 0, 0, -1),
+	(-1, 0, 0, -1),
+	(0, -1, -1, 0),
+	(0, 1, -1, 0),
+	(-1, 0, 0, 1),
+)
+
+
+def cast_shadows(walls: list[list[bool]], w: int, h: int, visible: list[int], cx: int, cy: int, radius: int) -> None:
+	"""Shadowcast all 8 octants from a center position.
+	
+	Every octant and every wedge split off by a wall is a
+	``(row, start_num, start_den, end_num, end_den, xx, xy, yx, yy)`` frame on one explicit stack,
+	so the whole sweep is a single call with no recursion. Slopes are kept
+	as integer fractions with positive denominators and compared by cross-multiplication, so the
+	scan does no floating-point division.
+	
+	Args:
+		walls (list[list[bool]]): Light-blocking tiles indexed [x][y], from FOV.wall_grid()
+		w (int): Map width in tiles
+		h (int): Map height in tiles
+		visible (list[int]): Receives flat x-major indices (``x * h + y``) of lit tiles
+		cx (int): Center X coordinate
+		cy (int): Center Y coordinate
+		radius (int): Maximum visibility radius in tiles
+	"""
+	radius_sq = radius * radius
+	# Seeded in reverse so the octants are scanned in FOV_OCTANTS order, each finishing its own wedges first
+	stack = [(1, 1, 1, 0, 1, xx, xy, yx, yy) for xx, xy, yx, yy in reversed(FOV_OCTANTS)]
+	while stack:
+		row, start_num, start_den, end_num, end_den, xx, xy, yx, yy = stack.pop()
+		if start_num * end_den < end_num * start_den:
+			continue
+		for i in range(row, radius + 1):
+			dx = -i
+			dy = -i
+
+			blocked = False
+			new_start_num, new_start_den = start_num, start_den
+			# Cell edge slopes (dx -/+ 0.5) / (dy +/- 0.5), doubled and sign-flipped so the denominators are positive
+			l_den = 2 * i - 1
+			r_den = 2 * i + 1
+			while dx <= 0:
+				# Translate the dx,dy into map coordinates
+				X = cx + dx * xx + dy * xy
+				Y = cy + dx * yx + dy * yy
+				l_num = 1 - 2 * dx
+				r_num = -1 - 2 * dx
+
+				if X < 0 or Y < 0 or X >= w or Y >= h:
+					dx += 1
+					continue
+
+				if start_num * r_den < r_num * start_den:
+					dx += 1
+					continue
+				if end_num * l_den > l_num * end_den:
+					break
+
+				# within light radius? The octant transform only permutes and flips the axes, so
+				# this is the tile's squared distance from the centre and needs no sqrt
+				if dx * dx + dy * dy <= radius_sq:
+					visible.append(X * h + Y)
+
+				if blocked:
+					if walls[X][Y]:
+						new_start_num, new_start_den = r_num, r_den
+					else:
+						blocked = False
+						start_num, start_den = new_start_num, new_start_den
+				else:
+					if walls[X][Y] and i < radius:
+						blocked = True
+						stack.append((i + 1, start_num, start_den, l_num, l_den, xx, xy, yx, yy))
+						new_start_num, new_start_den = r_num, r_den
+				dx += 1
+			if blocked:
+				break
+
+
 class FOV:
 	"""Field of View calculator using symmetrical shadowcasting algorithm.
 	
@@ -1066,6 +1395,22 @@ class FOV:
 			dungeon (Dungeon): The dungeon object to calculate FOV for
 		"""
 		self.dungeon = dungeon
+		self._walls: list[list[bool]] = []
+		self._walls_version = -1
+
+	def wall_grid(self) -> list[list[bool]]:
+		"""Return the dungeon's light-blocking tiles as nested lists indexed [x][y].
+		
+		Plain list lookups are far cheaper than ndarray scalar reads in the
+		cell-by-cell shadowcast; the grid is rebuilt when the dungeon changes.
+		
+		Returns:
+			list[list[bool]]: True where the tile is a wall
+		"""
+		if self._walls_version != self.dungeon.version:
+			self._walls = (self.dungeon.tiles == TILE_WALL).tolist()
+			self._walls_version = self.dungeon.version
+		return self._walls
 
 	def compute(self, cx: int, cy: int, radius: int) -> set[tuple[int, int]]:
 		"""Compute field of view from a center position.
@@ -1078,79 +1423,45 @@ class FOV:
 		Returns:
 			set[tuple[int, int]]: Set of (x, y) coordinates of visible tiles
 		"""
-		visible = set()
-		visible.add((cx, cy))
-
-		def blocks_light(x, y):
-			return self.dungeon.is_wall(x, y)
-
-		def set_visible(x, y):
-			dx = x - cx
-			dy = y - cy
-			dist = math.sqrt(dx * dx + dy * dy)
-			if dist <= radius:
-				visible.add((x, y))
-
-		# Octant processing
-		def cast_shadows(row, start_slope, end_slope, xx, xy, yx, yy):
-			if start_slope < end_slope:
-				return
-			radius_sq = radius * radius
-			for i in range(row, radius + 1):
-				dx = -i
-				dy = -i
-
-				blocked = False
-				new_start = start_slope
-				while dx <= 0:
-					# Translate the dx,dy into map coordinates
-					X = cx + dx * xx + dy * xy
-					Y = cy + dx * yx + dy * yy
-					l_slope = (dx - 0.5) / (dy + 0.5)
-					r_slope = (dx + 0.5) / (dy - 0.5)
-
-					if X < 0 or Y < 0 or X >= self.dungeon.w or Y >= self.dungeon.h:
-						dx += 1
-						continue
-
-					if start_slope < r_slope:
-						dx += 1
-						continue
-					if end_slope > l_slope:
-						break
-
-					# within light radius?
-					if dx * dx + dy * dy <= radius_sq:
-						set_visible(X, Y)
-
-					if blocked:
-						if blocks_light(X, Y):
-							new_start = r_slope
-						else:
-							blocked = False
-							start_slope = new_start
-					else:
-						if blocks_light(X, Y) and i < radius:
-							blocked = True
-							cast_shadows(i + 1, start_slope, l_slope, xx, xy, yx, yy)
-							new_start = r_slope
-					dx += 1
-				if blocked:
-					break
+		visible = {(cx, cy)}
+		visible.update(map(divmod, self.lit_tiles(cx, cy, radius), repeat(self.dungeon.h)))
+		return visible
 
-		# Process the 8 octants
-		octants = [
-			(1, 0, 0, 1),
-			(0, 1, 1, 0),
-			(0, -1, 1, 0),
-			(1, 0, 0, -1),
-			(-1, 0, 0, -1),
-			(0, -1, -1, 0),
-			(0, 1, -1, 0),
-			(-1, 0, 0, 1),
-		]
-		for xx, xy, yx, yy in octants:
-			cast_shadows(1, 1.0, 0.0, xx, xy, yx, yy)
+	def compute_mask(self, cx: int, cy: int, radius: int) -> np.ndarray:
+		"""Compute field of view from a center position as a tile mask.
+		
+		Args:
+			cx (int): Center X coordinate
+			cy (int): Center Y coordinate
+			radius (int): Maximum visibility radius in tiles
+			
+		Returns:
+			np.ndarray: Boolean (w, h) mask of visible tiles
+		"""
+		d = self.dungeon
+		mask = np.zeros(d.w * d.h, dtype=np.bool_)
+		mask[self.lit_tiles(cx, cy, radius)] = True
+		mask = mask.reshape(d.w, d.h)
+		if 0 <= cx < d.w and 0 <= cy < d.h:
+			mask[cx, cy] = True
+		return mask
+
+	def lit_tiles(self, cx: int, cy: int, radius: int) -> list[int]:
+		"""Shadowcast from a center position and list the tiles it reaches.
+		
+		Args:
+			cx (int): Center X coordinate
+			cy (int): Center Y coordinate
+			radius (int): Maximum visibility radius in tiles
+			
+		Returns:
+			list[int]: Flat x-major indices (``x * h + y``) of the lit tiles in visiting
+			order, excluding the center; a tile may appear more than once
+		"""
+		visible: list[int] = []
+		walls = self.wall_grid()
+		w, h = self.dungeon.w, self.dungeon.h
+		cast_shadows(walls, w, h, visible, cx, cy, radius)
 
 		return visible
 
@@ -1187,47 +1498,45 @@ def move_cursor(row: int = 1, col: int = 1) -> None:
 	sys.stdout.write(f"{CSI}{row};{col}H")
 
 
-def build_frame(dungeon: Dungeon, px: int, py: int, visible_map: set, explored: set) -> str:
+def build_frame(dungeon: Dungeon, px: int, py: int, visible_map: np.ndarray) -> str:
 	"""Build ASCII frame for terminal display.
 	
 	Args:
 		dungeon (Dungeon): The dungeon to render
 		px (int): Player X coordinate
 		py (int): Player Y coordinate
-		visible_map (set): Set of visible tile coordinates
-		explored (set): Set of previously explored coordinates
+		visible_map (np.ndarray): Boolean (w, h) mask of visible tiles
 		
 	Returns:
 		str: Multi-line string representing the rendered dungeon frame
 	"""
-	# Terminal renderer: show player '@', walls '#', and empty floor as ' '.
+	return '\n'.join(map(''.join, frame_glyphs(dungeon, px, py, visible_map).T.tolist()))
 
-	w, h = dungeon.w, dungeon.h
-	lines = []
-	for y in range(h):
-		row_chars = []
-		for x in range(w):
-			tile = dungeon.tiles[x][y]
-			if (x, y) == (px, py):
-				row_chars.append(PLAYER_CH)
-				explored.add((x, y))
-				continue
 
-			if (x, y) in visible_map:
-				explored.add((x, y))
-				if tile == TILE_WALL:
-					row_chars.append(WALL_CH)
-				elif tile == TILE_DOOR:
-					# Render doors with a specific character
-					row_chars.append('+')  # Traditional door character
-				else:
-					# Floors render as configured floor character (may be space or '#')
-					row_chars.append(FLOOR_CH)
-			else:
-				# Complete darkness outside light radius
-				row_chars.append(DARK_CH)
-		lines.append(''.join(row_chars))
-	return '\n'.join(lines)
+def frame_glyphs(dungeon: Dungeon, px: int, py: int, visible_map: np.ndarray) -> np.ndarray:
+	"""Pick the terminal glyph shown for every tile.
+	
+	Args:
+		dungeon (Dungeon): The dungeon to render
+		px (int): Player X coordinate
+		py (int): Player Y coordinate
+		visible_map (np.ndarray): Boolean (w, h) mask of visible tiles
+		
+	Returns:
+		np.ndarray: String array of shape (w, h) with one glyph per tile
+	"""
+	# Terminal renderer: show player '@', walls '#', and empty floor as ' '.
+	# Floors render as the configured floor character (may be space or '#'), doors as the
+	# traditional '+', and everything outside the light radius as complete darkness
+	# Size the string dtype for every glyph, the player included, so a multi-character setting
+	# is not truncated when it is written into the grid
+	glyph_dtype = f'<U{max(len(ch) for ch in (WALL_CH, FLOOR_CH, PLAYER_CH, DARK_CH, "+"))}'
+	tiles = dungeon.tiles
+	glyphs = np.where(tiles == TILE_WALL, WALL_CH, np.where(tiles == TILE_DOOR, '+', FLOOR_CH))
+	glyphs = np.where(visible_map, glyphs, DARK_CH).astype(glyph_dtype, copy=False)
+	if 0 <= px < dungeon.w and 0 <= py < dungeon.h:
+		glyphs[px, py] = PLAYER_CH
+	return glyphs
 
 
 def read_input_nonblocking() -> str | None:
@@ -1237,11 +1546,11 @@ def read_input_nonblocking() -> str | None:
 		str | None: Character pressed, or None if no key was pressed
 		             Returns None on non-Windows platforms where msvcrt unavailable
 	"""
-	if msvcrt is None:
+	if _kbhit is None:
 		return None
-	if msvcrt.kbhit():
+	if _kbhit():
 		try:
-			c = msvcrt.getwch()
+			c = _getwch()
 		except Exception:
 			try:
 				c = msvcrt.getch().decode('utf-8', 'ignore')
@@ -1295,27 +1604,12 @@ def run_terminal() -> None:
 					break
 	else:
 		# fallback: find any floor
-		px = py = 1
-		for y in range(dungeon.h):
-			for x in range(dungeon.w):
-				if not dungeon.is_wall(x, y):
-					px, py = x, y
-					break
-			else:
-				continue
-			break
+		px, py = find_first_open_tile(dungeon)
 
 	fov = FOV(dungeon)
-	explored = set()
+	explored = new_tile_mask(dungeon)
 	# Bricks exploration tracking (per-level)
-	def count_total_bricks(d: Dungeon) -> int:
-		total = 0
-		for y in range(d.h):
-			for x in range(d.w):
-				if d.tiles[x][y] == TILE_WALL and d.materials[x][y] == MAT_BRICK:
-					total += 1
-		return total
-	bricks_touched = set()  # set[(x,y)] of brick walls that have been visible at least once
+	bricks_touched = new_tile_mask(dungeon)  # brick walls that have been visible at least once
 	total_bricks = count_total_bricks(dungeon)
 
 	hide_cursor()
@@ -1324,6 +1618,14 @@ def run_terminal() -> None:
 		accumulator = 0.0
 		frame_time = 1.0 / FPS
 
+		# The map is static here, so visibility only changes when the player moves
+		fov_key = None
+		visible = None
+		# Glyphs currently on screen; once painted, only changed cells are rewritten. That needs
+		# every glyph to fill exactly one column, otherwise each frame is repainted in full
+		drawn_glyphs = None
+		cell_glyphs = all(len(ch) == 1 for ch in (FLOOR_CH, WALL_CH, PLAYER_CH, DARK_CH))
+
 		running = True
 		while running:
 			now = time.perf_counter()
@@ -1354,21 +1656,42 @@ def run_terminal() -> None:
 			# Update and render at fixed FPS
 			if accumulator >= frame_time:
 				accumulator = 0.0
-				# Compute visibility
-				visible = fov.compute(px, py, LIGHT_RADIUS)
+				# Compute visibility, and mark what it reveals as explored, only after a move
+				if fov_key != (px, py):
+					fov_key = (px, py)
+					visible = fov.compute_mask(px, py, LIGHT_RADIUS)
+					explored |= visible
+					explored[px, py] = True
 
 				# Draw
-				clear_screen()
-				move_cursor(1, 1)
-				frame = build_frame(dungeon, px, py, visible, explored)
-				sys.stdout.write(frame)
-				# HUD on last line
-				move_cursor(dungeon.h + 1, 1)
-				sys.stdout.write(f"WASD to move, Q to quit | {dungeon.w}x{dungeon.h} | Light r={LIGHT_RADIUS}\n")
-				sys.stdout.flush()
-
-			# Small sleep to avoid 100% CPU
-			time.sleep(0.001)
+				glyphs = frame_glyphs(dungeon, px, py, visible)
+				# Each frame's escape sequences and text go out as one write and one flush
+				out = None
+				if drawn_glyphs is not None and cell_glyphs:
+					changed = np.argwhere(glyphs != drawn_glyphs).tolist()
+					if changed:
+						out = ''.join([f"{CSI}{y + 1};{x + 1}H{glyphs[x, y]}" for x, y in changed])
+						out += f"{CSI}{dungeon.h + 2};1H"
+				elif drawn_glyphs is None or not np.array_equal(glyphs, drawn_glyphs):
+					out = ''.join((
+						CSI, "2J", CSI, "H", CSI, "1;1H",
+						'\n'.join(map(''.join, glyphs.T.tolist())),
+						# HUD on last line
+						f"{CSI}{dungeon.h + 1};1H",
+						f"WASD to move, Q to quit | {dungeon.w}x{dungeon.h} | Light r={LIGHT_RADIUS}\n",
+					))
+				if out:
+					sys.stdout.write(out)
+					sys.stdout.flush()
+				drawn_glyphs = glyphs
+
+			# Sleep until the next frame is due or a key arrives, checking for keys every few ms
+			deadline = last_time + frame_time - accumulator
+			while True:
+				remaining = deadline - time.perf_counter()
+				if remaining <= 0 or (_kbhit is not None and _kbhit()):
+					break
+				time.sleep(min(remaining, INPUT_POLL_INTERVAL))
 
 	finally:
 		show_cursor()
@@ -1703,9 +2026,8 @@ def show_splash_screen(screen: Optional["pygame.Surface"] = None, clock: Optiona
 	
 	# Load Blocky Sketch font at 49pt
 	import os
-	font_path = os.path.join(os.path.dirname(__file__), "Blocky Sketch.ttf")
-	if os.path.isfile(font_path):
-		title_font = pygame.font.Font(font_path, 49)
+	if BLOCKY_FONT_PATH:
+		title_font = pygame.font.Font(BLOCKY_FONT_PATH, 49)
 	else:
 		# Fallback to system font
 		title_font = pygame.font.Font(None, 49)
@@ -1718,7 +2040,7 @@ def show_splash_screen(screen: Optional["pygame.Surface"] = None, clock: Optiona
 
 	# Start intro music (Title.mid) while the splash screen is visible
 	try:
-		title_music_path = os.path.join(os.path.dirname(__file__), 'resources', 'sounds', 'Title.mid')
+		title_music_path = os.path.join(BASE_DIR, 'resources', 'sounds', 'Title.mid')
 		if os.path.isfile(title_music_path):
 			intro_volume = SETTINGS.get('music_volume', 0.7)
 			music_player = get_music_player()
@@ -1824,10 +2146,9 @@ def prompt_load_last_character(name: str, last_played_ts: Optional[float] = None
 	overlay = pygame.Surface((win_w, win_h), pygame.SRCALPHA)
 	overlay.fill((0, 0, 0, 120))
 
-	font_path = os.path.join(os.path.dirname(__file__), "Blocky Sketch.ttf")
-	try:
-		title_font = pygame.font.Font(font_path, 34)
-	except Exception:
+	if BLOCKY_FONT_PATH:
+		title_font = pygame.font.Font(BLOCKY_FONT_PATH, 34)
+	else:
 		title_font = pygame.font.Font(None, 38)
 	text_font = pygame.font.Font(None, 24)
 	button_font = pygame.font.Font(None, 26)
@@ -1929,7 +2250,7 @@ def run_pygame():
 	screen = pygame.display.set_mode((win_w, win_h))
 	clock = pygame.time.Clock()
 
-	icon_path = os.path.join(os.path.dirname(__file__), 'resources', 'icons', 'dungeon_icon.bmp')
+	icon_path = os.path.join(BASE_DIR, 'resources', 'icons', 'dungeon_icon.bmp')
 	if sys.platform.startswith('win'):
 		try:
 			import ctypes
@@ -1951,7 +2272,7 @@ def run_pygame():
 
 	# Ensure dungeon music plays across character creator and gameplay scenes
 	music_player = None
-	dungeon_music_path = os.path.join(os.path.dirname(__file__), 'resources', 'sounds', 'Dungeon.mid')
+	dungeon_music_path = os.path.join(BASE_DIR, 'resources', 'sounds', 'Dungeon.mid')
 	try:
 		if not os.path.isfile(dungeon_music_path):
 			raise FileNotFoundError(dungeon_music_path)
@@ -2023,13 +2344,13 @@ def run_pygame():
 	using_loaded_save = False
 
 	dungeon: Optional[Dungeon] = None
-	explored: set[tuple[int, int]] = set()
+	explored: np.ndarray = np.zeros((0, 0), dtype=np.bool_)
 	px = py = 1
-	bricks_touched: set[tuple[int, int]] = set()
+	bricks_touched: np.ndarray = np.zeros((0, 0), dtype=np.bool_)
 	total_bricks = 0
-	walls_touched: set[tuple[int, int]] = set()
-	floors_touched: set[tuple[int, int]] = set()
-	floors_stepped: set[tuple[int, int]] = set()
+	walls_touched: np.ndarray = np.zeros((0, 0), dtype=np.bool_)
+	floors_touched: np.ndarray = np.zeros((0, 0), dtype=np.bool_)
+	floors_stepped: np.ndarray = np.zeros((0, 0), dtype=np.bool_)
 	total_walls = 0
 	total_floors = 0
 	torches: list[dict] = []
@@ -2080,20 +2401,12 @@ def run_pygame():
 					if found:
 						break
 		else:
-			px = py = 1
-			for y in range(dungeon.h):
-				for x in range(dungeon.w):
-					if not dungeon.is_wall(x, y):
-						px, py = x, y
-						break
-				else:
-					continue
-				break
-		explored = set()
-		bricks_touched = set()
-		walls_touched = set()
-		floors_touched = set()
-		floors_stepped = set()
+			px, py = find_first_open_tile(dungeon)
+		explored = new_tile_mask(dungeon)
+		bricks_touched = new_tile_mask(dungeon)
+		walls_touched = new_tile_mask(dungeon)
+		floors_touched = new_tile_mask(dungeon)
+		floors_stepped = new_tile_mask(dungeon)
 		torches = generate_wall_torches(dungeon)
 		torch_lookup = rebuild_torch_lookup(torches)
 		levels = []
@@ -2146,11 +2459,14 @@ def run_pygame():
 		(25, 5),   # 5% very hard
 	]
 	
-	# Generate secrets for floor tiles (1% chance)
-	for y in range(dungeon.h):
-		for x in range(dungeon.w):
-			if not dungeon.is_wall(x, y):  # Only floor tiles can have secrets
-				if random.random() < 0.01:  # 1% chance
+	# Generate secrets for floor tiles (1% chance). The wall grid and RNG are bound to locals
+	# since this visits every tile; the scan order, and so the RNG stream, is unchanged
+	wall_rows = (dungeon.tiles == TILE_WALL).T.tolist()
+	rnd = random.random
+	for y, wall_row in enumerate(wall_rows):
+		for x, is_wall_tile in enumerate(wall_row):
+			if not is_wall_tile:  # Only floor tiles can have secrets
+				if rnd() < 0.01:  # 1% chance
 					# Randomly assign difficulty based on weights
 					roll = random.randint(1, 100)
 					cumulative = 0
@@ -2171,22 +2487,22 @@ def run_pygame():
 
 	# Brick exploration tracking for pygame mode
 	if not using_loaded_save:
-		bricks_touched = set()
+		bricks_touched = new_tile_mask(dungeon)
 		total_bricks = count_total_bricks(dungeon)
 	else:
-		bricks_touched = set(bricks_touched)
+		bricks_touched = bricks_touched.copy()
 		if not total_bricks:
 			total_bricks = count_total_bricks(dungeon)
 
 	# Wall/floor exploration tracking for pygame mode
 	if not using_loaded_save:
-		walls_touched = set()
-		floors_touched = set()
-		floors_stepped = set()
+		walls_touched = new_tile_mask(dungeon)
+		floors_touched = new_tile_mask(dungeon)
+		floors_stepped = new_tile_mask(dungeon)
 	else:
-		walls_touched = set(walls_touched)
-		floors_touched = set(floors_touched)
-		floors_stepped = set(floors_stepped)
+		walls_touched = walls_touched.copy()
+		floors_touched = floors_touched.copy()
+		floors_stepped = floors_stepped.copy()
 
 	# Use reachable floors from player and exposed walls for fair totals
 	reachable = compute_reachable_floors(dungeon, px, py)
@@ -2209,9 +2525,11 @@ def run_pygame():
 	light_radius = LIGHT_RADIUS   # dynamic light radius for pygame mode
 
 	# Simple message log for bottom-left feedback
-	message_log: list[dict] = []  # { 't': float, 'text': str }
-	# One-run milestone tracker for exploration announcements
-	announced_milestones: set[int] = set()
+	message_log: deque[dict] = deque(maxlen=200)  # { 't': float, 'text': str }; oldest entries drop off
+	# One-run milestone tracker for exploration announcements: thresholds are announced in
+	# ascending order, so the index of the next unannounced one is all the state needed
+	exploration_milestones = (25, 50, 75, 100)
+	next_milestone = 0
 
 	def add_message(text: str) -> None:
 		"""Add a message to the message log with timestamp.
@@ -2221,13 +2539,11 @@ def run_pygame():
 		Args:
 			text (str): Message text to add to log
 		"""
-		# Keep log small to avoid memory growth
+		# Bounded deque keeps the log small without periodic trimming
 		message_log.append({'t': time.time(), 'text': str(text)})
-		if len(message_log) > 200:
-			del message_log[:50]
 
 	# Load prefab library
-	prefabs = load_prefabs(os.path.join(os.path.dirname(__file__), 'prefabs'))
+	prefabs = load_prefabs(PREFABS_DIR)
 
 	# Map style setting
 	map_style = (SETTINGS.get('map_style', 'parchment') or 'parchment').lower()
@@ -2255,11 +2571,10 @@ def run_pygame():
 		font_name = (SETTINGS.get('font_name') or '').strip()
 		candidates = []
 		# Always prioritize Blocky Sketch.ttf
-		blocky_sketch_path = os.path.join(os.path.dirname(__file__), "Blocky Sketch.ttf")
-		if os.path.isfile(blocky_sketch_path):
-			candidates.append(("file", blocky_sketch_path))
+		if BLOCKY_FONT_PATH:
+			candidates.append(("file", BLOCKY_FONT_PATH))
 		if font_file:
-			path = os.path.join(os.path.dirname(__file__), font_file)
+			path = os.path.join(BASE_DIR, font_file)
 			if os.path.isfile(path):
 				candidates.append(("file", path))
 		if font_name:
@@ -2273,10 +2588,10 @@ def run_pygame():
 				try:
 					f = pygame.font.Font(ident, size) if kind == "file" else pygame.font.SysFont(ident, size)
 					# Measure a wide sample to ensure width/height fit in cell
+					# (font.size measures without rasterizing a surface)
 					sample = "W#@"
-					surf = f.render(sample, False, (255, 255, 255))
-					gw = surf.get_width() // len(sample)
-					gh = surf.get_height()
+					sample_w, gh = f.size(sample)
+					gw = sample_w // len(sample)
 					if gw <= cell_w - 1 and gh <= cell_h - 1:
 						return f
 					# Track last font in case nothing fits; prefer Courier New
@@ -2313,7 +2628,8 @@ def run_pygame():
 			if surf is None:
 				if bold:
 					font_obj.set_bold(True)
-				surf = font_obj.render(ch, antialias, color)
+				# Convert to the display's alpha format once so repeated blits skip per-call conversion
+				surf = font_obj.render(ch, antialias, color).convert_alpha()
 				if bold:
 					font_obj.set_bold(False)
 				cache[key] = surf
@@ -2331,7 +2647,8 @@ def run_pygame():
 	# Use cell_w as grain_tile to align texture pattern with character grid
 	parchment_renderer = ParchmentRenderer(base_color=PARCHMENT_BG, ink_color=INK_DARK, enable_vignette=False, grain_tile=cell_w)
 	parchment_renderer.build_layers(win_w, win_h)
-	parchment_static = parchment_renderer.generate(win_w, win_h)
+	# Convert to the display format once so the per-frame background blits take SDL's fast path
+	parchment_static = parchment_renderer.generate(win_w, win_h).convert()
 	# Build glyph renderers for all fonts
 	# render_glyph: type ignore to work around nested function type inference issue
 	render_glyph = build_glyph_cache(font)  # type: ignore
@@ -2552,24 +2869,53 @@ def run_pygame():
 			else:
 				return ' ', (245, 235, 210)  # Nearly identical to parchment
 	
+	# (material, is_wall) -> base RGB lookup for whole-map colouring; unknown ids use the default colours
+	material_base_rgb = np.array(
+		[[get_material_ascii_char_and_color(m, is_wall)[1] for is_wall in (False, True)] for m in range(16)],
+		dtype=np.float64,
+	)
+	
+	# Door state -> base RGB (indexed by DOOR_CLOSED/DOOR_OPEN/DOOR_LOCKED) and ascii glyph lookups
+	door_base_rgb = np.array([(100, 65, 40), (120, 80, 50), (80, 50, 30)], dtype=np.float64)
+	door_glyphs = np.array(['+', "'", '+'])
+	material_glyphs = np.array(
+		[[get_material_ascii_char_and_color(m, is_wall)[0] for is_wall in (False, True)] for m in range(16)]
+	)
+	# Flat per-tile-code tables: code = material * 2 + is_wall for plain tiles, door_code_base + state
+	# for doors, so the base colour and glyph of a whole window are one gather each
+	door_code_base = material_base_rgb.shape[0] * 2
+	tile_base_rgb = np.concatenate([material_base_rgb.reshape(-1, 3), door_base_rgb])
+	tile_glyphs = np.concatenate([material_glyphs.reshape(-1), door_glyphs])
+	# Per-material texture overlays pre-cut to the 1px block inset, for one batched viewport blit
+	material_texture_atlas = [
+		texture_patterns[get_material_texture_name(m)].subsurface((1, 1, cell_w - 2, cell_h - 2))
+		for m in range(16)
+	]
+	
 	dither_pattern = build_dither_pattern(cell_w, cell_h)
 
 	# Minimap reveal buffers (progress + noise) for watercolor effect
-	mm_reveal = []  # type: list[list[float]]
-	mm_noise = []   # type: list[list[float]]
+	mm_reveal = np.zeros((0, 0), dtype=np.float32)
+	mm_noise = np.zeros((0, 0), dtype=np.float32)
 
 	# World FoW reveal buffers (progress + noise) similar to minimap
-	wr_reveal = []  # type: list[list[float]]
-	wr_noise = []   # type: list[list[float]]
+	wr_reveal = np.zeros((0, 0), dtype=np.float32)
+	wr_noise = np.zeros((0, 0), dtype=np.float32)
+
+	def build_reveal_noise(d: Dungeon) -> np.ndarray:
+		"""Static per-tile reveal noise in [-0.15, 0.15), drawn in a single call.
+		
+		The generator is seeded from ``random`` so a seeded run stays reproducible.
+		"""
+		rng = np.random.default_rng(random.getrandbits(64))
+		return (rng.random((d.w, d.h), dtype=np.float32) - 0.5) * 0.3
 
 	def build_minimap_buffers(d: Dungeon):
 		# progress 0..1 and static noise per tile
-		reveal = [[0.0 for _ in range(d.h)] for _ in range(d.w)]
-		noise = [[(random.random() * 0.3 - 0.15) for _ in range(d.h)] for _ in range(d.w)]
+		reveal = np.zeros((d.w, d.h), dtype=np.float32)
+		noise = build_reveal_noise(d)
 		# any already-explored tiles start fully revealed
-		for (ex, ey) in explored:
-			if 0 <= ex < d.w and 0 <= ey < d.h:
-				reveal[ex][ey] = 1.0
+		reveal[explored] = 1.0
 		return reveal, noise
 
 	# Minimap helper
@@ -2578,11 +2924,9 @@ def run_pygame():
 
 	def build_world_reveal_buffers(d: Dungeon):
 		# progress 0..1 and static noise per tile for world FoW
-		reveal = [[0.0 for _ in range(d.h)] for _ in range(d.w)]
-		noise = [[(random.random() * 0.3 - 0.15) for _ in range(d.h)] for _ in range(d.w)]
-		for (ex, ey) in explored:
-			if 0 <= ex < d.w and 0 <= ey < d.h:
-				reveal[ex][ey] = 1.0
+		reveal = np.zeros((d.w, d.h), dtype=np.float32)
+		noise = build_reveal_noise(d)
+		reveal[explored] = 1.0
 		return reveal, noise
 
 	wr_reveal, wr_noise = build_world_reveal_buffers(dungeon)
@@ -2626,7 +2970,7 @@ def run_pygame():
 		width_cells = max(10, min(34, map_w - 2))
 		if width_cells <= 0:
 			return
-		lines = [m['text'] for m in message_log[-max_lines:]]
+		lines = [m['text'] for m in islice(reversed(message_log), max_lines)][::-1]
 		height_cells = len(lines) + 2 if lines else 0
 		if height_cells <= 0:
 			return
@@ -2650,15 +2994,15 @@ def run_pygame():
 			'falloff': 'quadratic',
 			'is_torch': False,
 		}]
+		# Every torch comes from create_torch(), so its fields can be read directly
+		flicker_t = 0.006 * ticks
+		sin = math.sin
 		for torch in torch_list:
-			base = torch.get('base_intensity', TORCH_BASE_INTENSITY)
-			phase = torch.get('phase', 0.0)
-			flicker = 0.82 + 0.18 * math.sin(0.006 * ticks + phase)
-			intensity = base * flicker
+			intensity = torch['base_intensity'] * (0.82 + 0.18 * sin(flicker_t + torch['phase']))
 			torch['current_intensity'] = intensity
 			sources.append({
 				'pos': (torch['x'], torch['y']),
-				'radius': torch.get('radius', TORCH_LIGHT_RADIUS),
+				'radius': torch['radius'],
 				'intensity': intensity,
 				'falloff': 'quadratic',
 				'is_torch': True,
@@ -2698,9 +3042,79 @@ def run_pygame():
 				best_pos = (sx, sy)
 		return best_val, best_pos
 
+	# Falloff of a unit-intensity source over its (2r+1)^2 neighbourhood, per (radius, falloff);
+	# only a handful of distinct radii occur (player light radius, torch radius)
+	light_kernel_cache: dict[tuple[float, bool], tuple[np.ndarray, np.ndarray]] = {}
+
+	def get_light_kernel(radius: float, quadratic: bool) -> tuple[np.ndarray, np.ndarray]:
+		"""Return the cached falloff kernel for a light of the given radius.
+		
+		Args:
+			radius (float): Light radius in tiles
+			quadratic (bool): Quadratic falloff if True, linear otherwise
+			
+		Returns:
+			tuple[np.ndarray, np.ndarray]: (brightness, in_range) arrays centred on the source,
+			each of shape (2 * int(radius) + 1,) * 2
+		"""
+		key = (radius, quadratic)
+		kernel = light_kernel_cache.get(key)
+		if kernel is None:
+			reach = int(radius)
+			offsets = np.arange(-reach, reach + 1, dtype=np.float64)
+			dist = np.hypot(offsets[:, None], offsets[None, :])
+			norm = dist / radius
+			if quadratic:
+				norm = norm * norm
+			brightness = np.maximum(1.0 - norm, 0.0)
+			# The source's own tile is always fully lit
+			brightness[dist <= 0.5] = 1.0
+			kernel = (brightness, dist <= radius)
+			light_kernel_cache[key] = kernel
+		return kernel
+
+	def evaluate_light_field(sources: list[dict], bounds: tuple[int, int, int, int]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+		"""Vectorized evaluate_light_sources() over a window of tiles.
+		
+		Each source stamps its cached falloff kernel onto the part of the window it can reach,
+		so no distances are computed per frame.
+		
+		Args:
+			sources (list[dict]): Light sources from prepare_light_sources()
+			bounds (tuple[int, int, int, int]): (x0, x1, y0, y1) tile window to evaluate
+			
+		Returns:
+			tuple[np.ndarray, np.ndarray, np.ndarray]: Brightness of the strongest source per tile,
+			and that source's X and Y (NaN where no source reaches the tile)
+		"""
+		bx0, bx1, by0, by1 = bounds
+		shape = (bx1 - bx0, by1 - by0)
+		best_val = np.zeros(shape)
+		best_x = np.full(shape, np.nan)
+		best_y = np.full(shape, np.nan)
+		for src in sources:
+			radius = src['radius']
+			if radius <= 1e-6:
+				continue
+			sx, sy = src['pos']
+			reach = int(radius)
+			ax0, ax1 = max(bx0, sx - reach), min(bx1, sx + reach + 1)
+			ay0, ay1 = max(by0, sy - reach), min(by1, sy + reach + 1)
+			if ax0 >= ax1 or ay0 >= ay1:
+				continue
+			brightness, in_range = get_light_kernel(radius, src.get('is_torch') or src.get('falloff', 'quadratic') != 'linear')
+			kwin = (slice(ax0 - sx + reach, ax1 - sx + reach), slice(ay0 - sy + reach, ay1 - sy + reach))
+			bwin = (slice(ax0 - bx0, ax1 - bx0), slice(ay0 - by0, ay1 - by0))
+			val = brightness[kwin] * src['intensity']
+			take = in_range[kwin] & (val > best_val[bwin])
+			np.copyto(best_val[bwin], val, where=take)
+			np.copyto(best_x[bwin], sx, where=take)
+			np.copyto(best_y[bwin], sy, where=take)
+		return best_val, best_x, best_y
+
 	def draw_torch_overlay(cell_x: int, cell_y: int, torch: dict) -> None:
 		"""Render a small torch flame and sconce overlay in block mode."""
-		intensity = clamp(torch.get('current_intensity', TORCH_BASE_INTENSITY), 0.5, 1.1)
+		intensity = max(0.5, min(1.1, torch.get('current_intensity', TORCH_BASE_INTENSITY)))
 		dir_x, dir_y = torch.get('dir', (0, 1))
 		flame_height = max(4, int(cell_h * 0.45))
 		flame_width = max(2, int(cell_w * 0.3))
@@ -2721,37 +3135,30 @@ def run_pygame():
 
 	# Simple wall-normal helper for directional lighting on walls
 	def wall_normal(d: Dungeon, x: int, y: int):
-		if not d.is_wall(x, y):
+		if not (0 <= x < d.w and 0 <= y < d.h):
 			return 0.0, 0.0
-		nx, ny = 0.0, 0.0
-		for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1)):
-			x2, y2 = x + dx, y + dy
-			if 0 <= x2 < d.w and 0 <= y2 < d.h and not d.is_wall(x2, y2):
-				# normal points toward open space
-				nx += dx
-				ny += dy
-		# normalize
-		length = math.hypot(nx, ny)
-		if length > 1e-6:
-			return nx / length, ny / length
-		return 0.0, 0.0
-
-	def draw_minimap(surface: pygame.Surface, dungeon: Dungeon, explored_set: set, visible_set: set, px: int, py: int, win_w: int, win_h: int) -> None:
+		nx_arr, ny_arr = d.wall_normals()
+		return float(nx_arr[x, y]), float(ny_arr[x, y])
+
+	def draw_minimap(surface: pygame.Surface, dungeon: Dungeon, explored_mask: np.ndarray, visible_mask: np.ndarray, px: int, py: int, win_w: int, win_h: int) -> Optional[pygame.Rect]:
 		"""Draw minimap with fog-of-war and current visibility.
 		
 		Args:
 			surface (pygame.Surface): Surface to draw the minimap on
 			dungeon (Dungeon): Current dungeon to map
-			explored_set (set): Set of explored tile coordinates
-			visible_set (set): Set of currently visible tiles
+			explored_mask (np.ndarray): Boolean (w, h) mask of explored tiles
+			visible_mask (np.ndarray): Boolean (w, h) mask of currently visible tiles
 			px (int): Player X coordinate
 			py (int): Player Y coordinate
 			win_w (int): Window width in pixels
 			win_h (int): Window height in pixels
+			
+		Returns:
+			Optional[pygame.Rect]: Screen area covered by the minimap frame, or None if disabled
 		"""
 		mm = SETTINGS.get('minimap', {}) or {}
 		if not mm.get('enabled', True):
-			return
+			return None
 		t = int(mm.get('tile', 4))
 		margin = int(mm.get('margin', 8))
 		pos = (mm.get('position', 'top-right') or 'top-right').lower()
@@ -2808,121 +3215,108 @@ def run_pygame():
 			pygame.draw.rect(surface, inner, (left_x, sy_px, stud_w, stud_h))
 			pygame.draw.rect(surface, inner, (right_x, sy_px, stud_w, stud_h))
 
-		# Colors for minimap - use same lighting and colors as main game view
-		def mini_color(x, y, visible_now, alpha_reveal):
-			if 0 <= x < dungeon.w and 0 <= y < dungeon.h:
-				m = dungeon.materials[x][y]
-				tile = dungeon.tiles[x][y]
-				is_wall = (tile == TILE_WALL)
-				
-				# Get same base color as main game (respects wall vs floor distinction)
-				_, base = get_material_ascii_char_and_color(m, is_wall)
-				
-				if visible_now:
-					# Calculate lighting same as main game view
-					dx = x - px
-					dy = y - py
-					d = math.sqrt(dx * dx + dy * dy)
-					
-					# Same lighting calculation as main game
-					if d <= 1.0:
-						tval = 1.0
-					else:
-						normalized_distance = d / light_radius
-						tval = max(0.1, 1.0 - (normalized_distance * normalized_distance))
-					
-					# Apply lighting to base color (same as main game)
-					return scale_color(base, tval)
-				# FoW: much darker walls vs darker floors (match main game)
-				def fow_scale_for_material(m2: int, a: float) -> float:
-					a = clamp(a, 0.0, 1.0)
-					if m2 == MAT_BRICK or m2 == MAT_IRON:
-						s_min, s_max = 0.06, 0.15
-					else:
-						s_min, s_max = 0.15, 0.30
-					return s_min + a * (s_max - s_min)
-				s = fow_scale_for_material(m, alpha_reveal)
-				return scale_color(base, s)
-			return INK_DARK
-
-		def lerp(c1, c2, a):
-			ar = clamp(a, 0.0, 1.0)
-			return (
-				int(c1[0] + (c2[0] - c1[0]) * ar),
-				int(c1[1] + (c2[1] - c1[1]) * ar),
-				int(c1[2] + (c2[2] - c1[2]) * ar),
-			)
-		wall_boost = 30
-
-		for y in range(dungeon.h):
-			for x in range(dungeon.w):
-				rect = (ox + x * t, oy + y * t, t, t)
-				if (x, y) in explored_set or (x, y) in visible_set:
-					# watercolor-like reveal from parchment using per-tile progress and noise
-					prog = mm_reveal[x][y] if 0 <= x < dungeon.w and 0 <= y < dungeon.h else 1.0
-					noi = mm_noise[x][y] if 0 <= x < dungeon.w and 0 <= y < dungeon.h else 0.0
-					alpha = clamp(pow(clamp(prog + noi, 0.0, 1.0), 1.8), 0.0, 1.0)
-					c_target = mini_color(x, y, (x, y) in visible_set, alpha)
-					c = lerp(PARCHMENT_BG, c_target, alpha)
-					surface.fill(c, rect)
-		else:
-			# unseen stays black (implicit)
-			pass
+		# Colors for minimap - use same lighting and colors as main game view,
+		# composited for the whole map at once and blitted as a single scaled image
+		tiles_arr = dungeon.tiles
+		mats_arr = dungeon.materials
+		shown = explored_mask | visible_mask
+		if shown.any():
+			# watercolor-like reveal from parchment using per-tile progress and noise
+			alpha = np.clip(np.power(np.clip(mm_reveal + mm_noise, 0.0, 1.0), 1.8), 0.0, 1.0)
+			mat_idx = np.minimum(mats_arr, len(material_base_rgb) - 1)
+			base = material_base_rgb[mat_idx, (tiles_arr == TILE_WALL).astype(np.intp)]
+			# Visible tiles: same distance falloff as the main game view
+			dx = np.arange(dungeon.w, dtype=np.float64)[:, None] - px
+			dy = np.arange(dungeon.h, dtype=np.float64)[None, :] - py
+			dist = np.sqrt(dx * dx + dy * dy)
+			normalized_distance = dist / light_radius
+			tval = np.where(dist <= 1.0, 1.0, np.maximum(0.1, 1.0 - normalized_distance * normalized_distance))
+			# FoW: much darker walls vs darker floors (match main game)
+			dark_mat = (mats_arr == MAT_BRICK) | (mats_arr == MAT_IRON)
+			fow = np.where(dark_mat, 0.06 + alpha * (0.15 - 0.06), 0.15 + alpha * (0.30 - 0.15))
+			target = scale_color_array(base, np.where(visible_mask, tval, fow))
+			rgb = lerp_color_array(PARCHMENT_BG, target, alpha).astype(np.uint8)
+			# Unseen tiles are keyed out so the frame fill and studs show through
+			rgb[~shown] = TRANSPARENT_COLORKEY
+			tiles_surf = pygame.transform.scale(pygame.surfarray.make_surface(rgb), (w_px, h_px))
+			tiles_surf.set_colorkey(TRANSPARENT_COLORKEY)
+			surface.blit(tiles_surf, (ox, oy))
 
 		# === Gold glow for fully searched areas (outermost perimeter only) ===
 		# Light gold color (255, 215, 0) with transparency
 		gold_color = (255, 215, 0)
 		
 		# Find all tiles that are fully searched (illumination >= 1.0)
-		# Draw glow on ANY tile (wall or floor) that borders an unsearched area
-		for y in range(dungeon.h):
-			for x in range(dungeon.w):
-				if tile_illumination_source.get((x, y)) == 'player' and tile_illumination_alpha.get((x, y), 0.0) >= 1.0:
-					# Check which sides of this tile face unsearched areas
-					# Draw glow lines only on those outer edges
-					px = ox + x * t
-					py = oy + y * t
-					
-					glow_surf = pygame.Surface((t, t), pygame.SRCALPHA)
-					
-					# Check each cardinal direction
-					# Top
-					if (x, y-1) not in tile_illumination_alpha or tile_illumination_alpha.get((x, y-1), 0.0) < 1.0:
-						for i in range(2):
-							alpha = 100 - (i * 35)  # 100, 65
-							glow_color_alpha = (*gold_color, alpha)
-							offset = i
-							pygame.draw.line(glow_surf, glow_color_alpha, (0, offset), (t, offset), 1)
-					# Bottom
-					if (x, y+1) not in tile_illumination_alpha or tile_illumination_alpha.get((x, y+1), 0.0) < 1.0:
-						for i in range(2):
-							alpha = 100 - (i * 35)
-							glow_color_alpha = (*gold_color, alpha)
-							offset = i
-							pygame.draw.line(glow_surf, glow_color_alpha, (0, t-1-offset), (t, t-1-offset), 1)
-					# Left
-					if (x-1, y) not in tile_illumination_alpha or tile_illumination_alpha.get((x-1, y), 0.0) < 1.0:
-						for i in range(2):
-							alpha = 100 - (i * 35)
-							glow_color_alpha = (*gold_color, alpha)
-							offset = i
-							pygame.draw.line(glow_surf, glow_color_alpha, (offset, 0), (offset, t), 1)
-					# Right
-					if (x+1, y) not in tile_illumination_alpha or tile_illumination_alpha.get((x+1, y), 0.0) < 1.0:
-						for i in range(2):
-							alpha = 100 - (i * 35)
-							glow_color_alpha = (*gold_color, alpha)
-							offset = i
-							pygame.draw.line(glow_surf, glow_color_alpha, (t-1-offset, 0), (t-1-offset, t), 1)
-					
-					surface.blit(glow_surf, (px, py))
+		# Draw glow on ANY tile (wall or floor) that borders an unsearched area.
+		# Only tiles with an illumination source can qualify, so walk that dict
+		# rather than the whole map.
+		for (x, y), source in tile_illumination_source.items():
+			if source == 'player' and tile_illumination_alpha.get((x, y), 0.0) >= 1.0:
+				if not (0 <= x < dungeon.w and 0 <= y < dungeon.h):
+					continue
+				# Check which sides of this tile face unsearched areas
+				# Draw glow lines only on those outer edges
+				glow_x = ox + x * t
+				glow_y = oy + y * t
+				
+				glow_surf = pygame.Surface((t, t), pygame.SRCALPHA)
+				
+				# Check each cardinal direction
+				# Top
+				if (x, y-1) not in tile_illumination_alpha or tile_illumination_alpha.get((x, y-1), 0.0) < 1.0:
+					for i in range(2):
+						alpha = 100 - (i * 35)  # 100, 65
+						glow_color_alpha = (*gold_color, alpha)
+						offset = i
+						pygame.draw.line(glow_surf, glow_color_alpha, (0, offset), (t, offset), 1)
+				# Bottom
+				if (x, y+1) not in tile_illumination_alpha or tile_illumination_alpha.get((x, y+1), 0.0) < 1.0:
+					for i in range(2):
+						alpha = 100 - (i * 35)
+						glow_color_alpha = (*gold_color, alpha)
+						offset = i
+						pygame.draw.line(glow_surf, glow_color_alpha, (0, t-1-offset), (t, t-1-offset), 1)
+				# Left
+				if (x-1, y) not in tile_illumination_alpha or tile_illumination_alpha.get((x-1, y), 0.0) < 1.0:
+					for i in range(2):
+						alpha = 100 - (i * 35)
+						glow_color_alpha = (*gold_color, alpha)
+						offset = i
+						pygame.draw.line(glow_surf, glow_color_alpha, (offset, 0), (offset, t), 1)
+				# Right
+				if (x+1, y) not in tile_illumination_alpha or tile_illumination_alpha.get((x+1, y), 0.0) < 1.0:
+					for i in range(2):
+						alpha = 100 - (i * 35)
+						glow_color_alpha = (*gold_color, alpha)
+						offset = i
+						pygame.draw.line(glow_surf, glow_color_alpha, (t-1-offset, 0), (t-1-offset, t), 1)
+				
+				surface.blit(glow_surf, (glow_x, glow_y))
 
 		# Player marker (bright green) - draw last so it's on top
 		pr = (ox + px * t, oy + py * t, t, t)
 		surface.fill(PLAYER_GREEN, pr)
+		return pygame.Rect(frame_x, frame_y, frame_w, frame_h)
 
 	# No resize in fixed-window mode
 
+	def present_frame(rects: list[pygame.Rect]) -> None:
+		"""Push the finished frame to the display.
+		
+		Updates only the dirty rectangles, with repeats dropped, unless they add
+		up to the whole window; then a single full flip does the same copy.
+		
+		Args:
+			rects (list[pygame.Rect]): Screen areas drawn this frame or last frame
+		"""
+		# Most rects repeat between consecutive frames, so copy each area once
+		unique = list({tuple(r): r for r in rects}.values())
+		dirty_area = sum(r.width * r.height for r in unique)
+		if dirty_area < win_w * win_h:
+			pygame.display.update(unique)
+		else:
+			pygame.display.flip()
+
 	# Centering offsets (updated each frame based on current sizes)
 	def compute_offsets():
 		vw = cell_w * grid_w
@@ -2976,24 +3370,83 @@ def run_pygame():
 		screen.fill(color, (px, py, pw, ph))
 		
 		if with_dither:
-			# Use material-specific texture pattern
-			pattern = texture_patterns.get(material_type, dither_pattern)
-			if pattern is not None:
-				try:
-					# Use a clipped blit to match inset, but ensure we don't exceed pattern bounds
-					if inset > 0 and inset * 2 < min(pattern.get_width(), pattern.get_height()):
-						# Create a subsurface that fits within both the pattern and target rectangle
-						clip_w = min(pw, pattern.get_width() - inset)
-						clip_h = min(ph, pattern.get_height() - inset)
-						if clip_w > 0 and clip_h > 0:
-							src = pattern.subsurface((inset, inset, clip_w, clip_h))
-							screen.blit(src, (px, py))
-					else:
-						# No inset or inset too large, use full pattern
-						screen.blit(pattern, (px, py), (0, 0, pw, ph))
-				except pygame.error:
-					# Fallback: just skip the texture if there's an issue
-					pass
+			draw_block_texture(cell_x, cell_y, inset, material_type)
+
+	def draw_block_texture(cell_x: int, cell_y: int, inset: int = 0, material_type: str = 'default') -> None:
+		"""Overlay a material texture on an already filled block.
+		
+		Args:
+			cell_x (int): X coordinate in cell units
+			cell_y (int): Y coordinate in cell units
+			inset (int): Pixel inset from cell edges, as passed to draw_block_at()
+			material_type (str): Type of material texture to apply
+		"""
+		px = off_x + cell_x * cell_w + inset
+		py = off_y + cell_y * cell_h + inset
+		pw = max(0, cell_w - inset * 2)
+		ph = max(0, cell_h - inset * 2)
+		if pw <= 0 or ph <= 0:
+			return
+		# Use material-specific texture pattern
+		pattern = texture_patterns.get(material_type, dither_pattern)
+		if pattern is not None:
+			try:
+				# Use a clipped blit to match inset, but ensure we don't exceed pattern bounds
+				if inset > 0 and inset * 2 < min(pattern.get_width(), pattern.get_height()):
+					# Create a subsurface that fits within both the pattern and target rectangle
+					clip_w = min(pw, pattern.get_width() - inset)
+					clip_h = min(ph, pattern.get_height() - inset)
+					if clip_w > 0 and clip_h > 0:
+						src = pattern.subsurface((inset, inset, clip_w, clip_h))
+						screen.blit(src, (px, py))
+				else:
+					# No inset or inset too large, use full pattern
+					screen.blit(pattern, (px, py), (0, 0, pw, ph))
+			except pygame.error:
+				# Fallback: just skip the texture if there's an issue
+				pass
+
+	# Gold edge-glow overlays keyed by (render_mode, top, bottom, left, right)
+	glow_edge_cache: dict[tuple[str, bool, bool, bool, bool], Optional[pygame.Surface]] = {}
+
+	def get_glow_edge_surface(top: bool, bottom: bool, left: bool, right: bool) -> Optional[pygame.Surface]:
+		"""Return the cell-sized gold glow overlay for the given set of glowing edges.
+		
+		Block mode draws two 2px lines per edge, ascii mode two 1px lines, fading inward.
+		
+		Args:
+			top (bool): Glow along the top edge
+			bottom (bool): Glow along the bottom edge
+			left (bool): Glow along the left edge
+			right (bool): Glow along the right edge
+			
+		Returns:
+			Optional[pygame.Surface]: SRCALPHA overlay, or None when no edge glows
+		"""
+		key = (render_mode, top, bottom, left, right)
+		if key in glow_edge_cache:
+			return glow_edge_cache[key]
+		glow_surf = None
+		if top or bottom or left or right:
+			gold_color = (255, 215, 0)
+			width, step = (2, 2) if render_mode == 'blocks' else (1, 1)
+			glow_surf = pygame.Surface((cell_w, cell_h), pygame.SRCALPHA)
+			# Edge by edge (later lines overwrite earlier ones at the corners)
+			shades = [((*gold_color, 100 - (i * 35)), i * step) for i in range(2)]
+			if top:
+				for glow_color_alpha, offset in shades:
+					pygame.draw.line(glow_surf, glow_color_alpha, (0, offset), (cell_w, offset), width)
+			if bottom:
+				for glow_color_alpha, offset in shades:
+					pygame.draw.line(glow_surf, glow_color_alpha, (0, cell_h-1-offset), (cell_w, cell_h-1-offset), width)
+			if left:
+				for glow_color_alpha, offset in shades:
+					pygame.draw.line(glow_surf, glow_color_alpha, (offset, 0), (offset, cell_h), width)
+			if right:
+				for glow_color_alpha, offset in shades:
+					pygame.draw.line(glow_surf, glow_color_alpha, (cell_w-1-offset, 0), (cell_w-1-offset, cell_h), width)
+		glow_edge_cache[key] = glow_surf
+		return glow_surf
 
 	def draw_overlay_at(cell_x, cell_y, color, alpha, inset=0):
 		# Alpha-blended rectangle on top of parchment/world for subtle fades
@@ -3003,7 +3456,7 @@ def run_pygame():
 		ph = max(0, cell_h - inset * 2)
 		if pw <= 0 or ph <= 0:
 			return
-		alpha = clamp(alpha, 0.0, 1.0)
+		alpha = max(0.0, min(1.0, alpha))
 		if alpha <= 0.0:
 			return
 		s = pygame.Surface((pw, ph), pygame.SRCALPHA)
@@ -3024,14 +3477,48 @@ def run_pygame():
 		else:
 			s = pygame.Surface((rw, rh), pygame.SRCALPHA)
 			r, g, b = color
-			s.fill((r, g, b, int(255 * clamp(alpha, 0.0, 1.0))))
+			s.fill((r, g, b, int(255 * max(0.0, min(1.0, alpha)))))
 			screen.blit(s, (px, py))
 
-	def draw_text_line(cell_x, cell_y, text, color=(180, 180, 180), max_len=None, use_ui_font=False, use_title_font=False, bold=False):
+	# Laid-out glyphs per (text, color, font, bold): list of (surface, (dx, dy)) relative to the line origin.
+	# Kept in least-recently-used order: HUD strings embed live numbers, so stale lines are evicted
+	# while the fixed labels drawn every frame stay cached.
+	text_line_cache: OrderedDict[tuple, list[tuple[pygame.Surface, tuple[int, int]]]] = OrderedDict()
+	text_line_cache_limit = 1024
+
+	def draw_text_line(cell_x, cell_y, text, color=(180, 180, 180), max_len=None, use_ui_font=False, use_title_font=False, bold=False, target=None):
 		if max_len is None:
 			max_len = len(text)
-		for i, ch in enumerate(text[:max_len]):
-			draw_char_at(cell_x + i, cell_y, ch, color, use_ui_font=use_ui_font, use_title_font=use_title_font, bold=bold)
+		text = text[:max_len]
+		key = (text, color, use_ui_font, use_title_font, bold)
+		layout = text_line_cache.get(key)
+		if layout is not None:
+			text_line_cache.move_to_end(key)
+		else:
+			if use_title_font:
+				glyph_fn = render_title_glyph
+			elif use_ui_font:
+				glyph_fn = render_ui_glyph
+			else:
+				glyph_fn = render_glyph
+			layout = []
+			for i, ch in enumerate(text):
+				if ch == ' ':
+					continue
+				surf = glyph_fn(ch, color, bold)
+				layout.append((surf, (i * cell_w + (cell_w - surf.get_width()) // 2, (cell_h - surf.get_height()) // 2)))
+			if len(text_line_cache) >= text_line_cache_limit:
+				text_line_cache.popitem(last=False)
+			text_line_cache[key] = layout
+		if target is None:
+			# Cell coordinates are relative to the centred grid on screen, or to the target surface itself
+			target = screen
+			ox = off_x + cell_x * cell_w
+			oy = off_y + cell_y * cell_h
+		else:
+			ox = cell_x * cell_w
+			oy = cell_y * cell_h
+		target.blits([(surf, (ox + dx, oy + dy)) for surf, (dx, dy) in layout], doreturn=False)
 
 	# Session state: multi-level support
 	if not using_loaded_save:
@@ -3041,13 +3528,13 @@ def run_pygame():
 	def snapshot_current():
 		return {
 			'dungeon': dungeon,
-			'explored': set(explored),
+			'explored': explored.copy(),
 			'player': (px, py),
-			'bricks_touched': set(bricks_touched),
+			'bricks_touched': bricks_touched.copy(),
 			'total_bricks': int(total_bricks),
-			'walls_touched': set(walls_touched),
-			'floors_touched': set(floors_touched),
-			'floors_stepped': set(floors_stepped),
+			'walls_touched': walls_touched.copy(),
+			'floors_touched': floors_touched.copy(),
+			'floors_stepped': floors_stepped.copy(),
 			'total_walls': int(total_walls),
 			'total_floors': int(total_floors),
 			'torches': serialize_torches(torches),
@@ -3059,36 +3546,29 @@ def run_pygame():
 			d = lvl['dungeon']
 			exp = lvl['explored']
 			pxx, pyy = lvl['player']
-			bt = lvl.get('bricks_touched', set())
-			tb = lvl.get('total_bricks')
-			if tb is None:
-				tb = count_total_bricks(d)
-			wt = lvl.get('walls_touched', set())
-			ft = lvl.get('floors_touched', set())
-			fs = lvl.get('floors_stepped', set())
-			tw = lvl.get('total_walls')
-			tf = lvl.get('total_floors')
-			if tw is None or tf is None:
-				# compute fair totals based on reachability from saved player pos
-				pf_x, pf_y = int(pxx), int(pyy)
-				rf = compute_reachable_floors(d, pf_x, pf_y)
-				tf = len(rf)
-				tw = count_total_exposed_walls(d, rf)
+			bt = lvl.get('bricks_touched')
+			wt = lvl.get('walls_touched')
+			ft = lvl.get('floors_touched')
+			fs = lvl.get('floors_stepped')
+			# Totals are recorded whenever a level is created, loaded or stamped
+			tb = lvl['total_bricks']
+			tw = lvl['total_walls']
+			tf = lvl['total_floors']
 			out.append({
 				'w': d.w,
 				'h': d.h,
 				'tiles': encode_tiles(d),
 				'materials': encode_materials(d),
-				'explored': list(sorted(exp)),
+				'explored': encode_mask(exp),
 				'player': [pxx, pyy],
-				'bricks_touched': list(sorted(bt)),
+				'bricks_touched': encode_mask(bt if bt is not None else new_tile_mask(d)),
 				'total_bricks': int(tb),
-				'walls_touched': list(sorted(wt)),
-				'floors_touched': list(sorted(ft)),
-				'floors_stepped': list(sorted(fs)),
+				'walls_touched': encode_mask(wt if wt is not None else new_tile_mask(d)),
+				'floors_touched': encode_mask(ft if ft is not None else new_tile_mask(d)),
+				'floors_stepped': encode_mask(fs if fs is not None else new_tile_mask(d)),
 				'total_walls': int(tw),
 				'total_floors': int(tf),
-				'torches': serialize_torches(deserialize_torches(lvl.get('torches', []))),
+				'torches': normalize_torches(lvl.get('torches', [])),
 			})
 		return out
 
@@ -3125,32 +3605,31 @@ def run_pygame():
 			
 			# Ensure player starts on a floor tile within the room
 			if nd.is_wall(pxn, pyn):
-				# Search for a floor tile within the room bounds
-				found = False
+				# Search the room interior around the centre for a non-wall tile; argwhere
+				# yields hits in the same x-then-y order as a nested dx/dy scan
 				room_w = room.x2 - room.x1
 				room_h = room.y2 - room.y1
-				for dx in range(-(room_w//2), room_w//2 + 1):
-					for dy in range(-(room_h//2), room_h//2 + 1):
-						x, y = pxn + dx, pyn + dy
-						if (room.x1 < x < room.x2 - 1 and room.y1 < y < room.y2 - 1 and 
-							not nd.is_wall(x, y)):
-							pxn, pyn = x, y
-							found = True
-							break
-					if found:
-						break
+				sx0 = max(0, room.x1 + 1, pxn - room_w // 2)
+				sx1 = min(nd.w, room.x2 - 1, pxn + room_w // 2 + 1)
+				sy0 = max(0, room.y1 + 1, pyn - room_h // 2)
+				sy1 = min(nd.h, room.y2 - 1, pyn + room_h // 2 + 1)
+				if sx0 < sx1 and sy0 < sy1:
+					sub = nd.tiles[sx0:sx1, sy0:sy1]
+					hits = np.argwhere(sub != TILE_WALL)
+					if len(hits):
+						pxn, pyn = sx0 + int(hits[0][0]), sy0 + int(hits[0][1])
 		else:
 			pxn, pyn = 1, 1
 		# switch to new level
 		dungeon = nd
 		fov = FOV(dungeon)
-		explored = set()
+		explored = new_tile_mask(dungeon)
 		px, py = pxn, pyn
-		bricks_touched = set()
+		bricks_touched = new_tile_mask(dungeon)
 		total_bricks = count_total_bricks(dungeon)
-		walls_touched = set()
-		floors_touched = set()
-		floors_stepped = set()
+		walls_touched = new_tile_mask(dungeon)
+		floors_touched = new_tile_mask(dungeon)
+		floors_stepped = new_tile_mask(dungeon)
 		# fair totals for new level
 		rf = compute_reachable_floors(dungeon, px, py)
 		total_floors = len(rf)
@@ -3200,8 +3679,8 @@ def run_pygame():
 	wr_reveal, wr_noise = build_world_reveal_buffers(dungeon)
 
 	# Mark starting tile as stepped if it's a floor (new games only)
-	if not using_loaded_save and 0 <= px < dungeon.w and 0 <= py < dungeon.h and dungeon.tiles[px][py] == TILE_FLOOR:
-		floors_stepped.add((px, py))
+	if not using_loaded_save and 0 <= px < dungeon.w and 0 <= py < dungeon.h and dungeon.tiles[px, py] == TILE_FLOOR:
+		floors_stepped[px, py] = True
 		levels[current_level_index]['floors_stepped'] = floors_stepped
 	levels[current_level_index]['torches'] = serialize_torches(torches)
 
@@ -3276,9 +3755,44 @@ def run_pygame():
 			wpx = box_w * cell_w
 			hpx = box_h * cell_h
 			menu_parch_renderer.build_layers(wpx, hpx, seed=42)  # Fixed seed for consistency
-			menu_parchment = menu_parch_renderer.generate(wpx, hpx)
+			menu_parchment = menu_parch_renderer.generate(wpx, hpx).convert()
 		return menu_parchment
 
+	# Static menu chrome (parchment, border, banner), drawn once and reused every menu frame
+	menu_frame = None
+	def get_menu_frame():
+		nonlocal menu_frame
+		if menu_frame is None:
+			box_w = 58
+			box_h = 24
+			frame_col = MARBLE_WHITE
+			title_col = WALL_LIGHT
+			dim_col = scale_color(MARBLE_WHITE, 0.5)
+			frame = get_menu_parchment().copy()
+
+			# Border (clean, high-contrast, no noisy fill)
+			# Top and bottom
+			edge = '+' + '=' * (box_w - 2) + '+'
+			draw_text_line(0, 0, edge, frame_col, target=frame)
+			draw_text_line(0, box_h - 1, edge, frame_col, target=frame)
+			# Sides
+			for y in range(1, box_h - 1):
+				draw_text_line(0, y, '|', frame_col, target=frame)
+				draw_text_line(box_w - 1, y, '|', frame_col, target=frame)
+			# Interior left blank (background already filled)
+
+			# Large title text at 3x size
+			title_text = "DUNGEON MENU"
+			# Calculate position to center the title (accounting for 3x font size taking more space)
+			# With 3x font, each character takes approximately 3 cells of width
+			title_width_cells = len(title_text) * 3
+			draw_text_line((box_w - title_width_cells) // 2, 2, title_text, title_col, use_title_font=True, target=frame)
+
+			# Decorative border under title (using regular font)
+			draw_text_line(3, 5, "=" * (box_w - 6), dim_col, target=frame)
+			menu_frame = frame
+		return menu_frame
+
 	def draw_menu():
 		# DnD-style ASCII menu frame + banner
 		box_w = 58
@@ -3287,44 +3801,15 @@ def run_pygame():
 		y0 = (grid_h - box_h) // 2
 
 		# Colors - light text on dark granite parchment
-		frame_col = MARBLE_WHITE
 		title_col = WALL_LIGHT  # Golden brown for titles
 		text_col = MARBLE_WHITE
 		dim_col = scale_color(MARBLE_WHITE, 0.5)
 
-		# Blit dark granite parchment background behind the menu
+		# Blit the pre-drawn granite frame, then only the option text on top
 		off_x, off_y = compute_offsets()
 		px = off_x + x0 * cell_w
 		py = off_y + y0 * cell_h
-		wpx = box_w * cell_w
-		hpx = box_h * cell_h
-		menu_bg = get_menu_parchment()
-		screen.blit(menu_bg, (px, py))
-
-		# Border (clean, high-contrast, no noisy fill)
-		# Top and bottom
-		for x in range(box_w):
-			ch = '=' if 0 < x < box_w - 1 else '+'
-			draw_char_at(x0 + x, y0, ch, frame_col)
-			draw_char_at(x0 + x, y0 + box_h - 1, ch, frame_col)
-		# Sides
-		for y in range(1, box_h - 1):
-			draw_char_at(x0, y0 + y, '|', frame_col)
-			draw_char_at(x0 + box_w - 1, y0 + y, '|', frame_col)
-		# Interior left blank (background already filled)
-
-		# Large title text at 3x size
-		title_text = "DUNGEON MENU"
-		# Calculate position to center the title (accounting for 3x font size taking more space)
-		# With 3x font, each character takes approximately 3 cells of width
-		title_width_cells = len(title_text) * 3
-		title_x = x0 + (box_w - title_width_cells) // 2
-		title_y = y0 + 2
-		draw_text_line(title_x, title_y, title_text, title_col, use_title_font=True)
-		
-		# Decorative border under title (using regular font)
-		border_line = "=" * (box_w - 6)
-		draw_text_line(x0 + 3, y0 + 5, border_line, dim_col)
+		screen.blit(get_menu_frame(), (px, py))
 
 		def draw_opts(opts, sel_idx, ystart):
 			for i, text in enumerate(opts):
@@ -3409,7 +3894,7 @@ def run_pygame():
 				speckle_count=600
 			)
 			inv_parch_renderer.build_layers(win_w, win_h, seed=123)  # Fixed seed for consistency
-			inventory_parchment = inv_parch_renderer.generate(win_w, win_h)
+			inventory_parchment = inv_parch_renderer.generate(win_w, win_h).convert()
 		return inventory_parchment
 
 	def draw_inventory_slotbased():
@@ -3705,6 +4190,118 @@ def run_pygame():
 
 	running = True
 	frame_count = 0
+	# Screen areas drawn last frame; the whole window starts dirty
+	dirty_rects_prev: list[pygame.Rect] = [screen.get_rect()]
+	# Walls bordering the reachable floor region, rebuilt when the map or that region changes
+	wall_border_mask: Optional[np.ndarray] = None
+	wall_border_source: tuple = (None, None)
+	# Player view and wall border the exploration metrics were last updated for
+	metrics_visible: Optional[set[tuple[int, int]]] = None
+	metrics_border: Optional[np.ndarray] = None
+	# Exposed brick walls and how many are touched; recounted when the wall border or the touched
+	# mask is replaced, and kept up to date as the player touches new bricks in between
+	exposed_bricks_total = 0
+	exposed_bricks_touched = 0
+	exposed_bricks_key: tuple = (None, None)
+	# Inputs the cached visibility sets were computed from
+	fov_cache_key: Optional[tuple] = None
+	# Debug panel door count lines; doors only change through Dungeon helpers, which bump its version
+	door_count_lines: tuple[str, ...] = ()
+	door_counts_key: Optional[tuple] = None
+	# Debug readout entries and the player/level/door state they were built for
+	debug_lines: list[tuple[int, str, tuple[int, int, int]]] = []
+	debug_blocks: list[tuple[int, pygame.Surface]] = []
+	debug_lines_key: Optional[tuple] = None
+	# UI panel colours and fixed labels, built once and shared by every frame's panel draw
+	ui_color = scale_color(WALL_LIGHT, 0.95)
+	section_color = scale_color(WALL_LIGHT, 1.0)
+	dim_color = scale_color(WALL_LIGHT, 0.7)
+	# The fixed labels all fit within UI_COLS; variable lines are clipped when the panel layer draws them
+	ui_character_header = "== CHARACTER =="
+	ui_explorer_header = "== EXPLORER =="
+	ui_dungeon_header = "== DUNGEON =="
+	ui_shortcuts_header = "== SHORTCUTS =="
+	ui_debug_header = "== DEBUG =="
+	ui_attr_labels = ("STR DEX CON", "INT WIS CHA")
+	ui_shortcut_lines = ("I: Inventory", "C: Character", "M: Map", "Esc: Menu")
+	ui_debug_key_lines = ("F4/F5 Lr", "N NewLvl", "P Stamp", "Ctrl+D dbg")
+	# Panel rows of the debug readout; lines past the bottom of the panel would be clipped anyway
+	ui_debug_rows = range(14, grid_h)
+	ui_debug_commands = (
+		"---",
+		"Commands:",
+		"  R: Reveal/Unreveal",
+		"  L: Level up",
+		"  K: Level down",
+		"  P: Regen level",
+		"  S: Save session",
+		"  O: Load session",
+	)
+
+	def render_ui_block(lines):
+		"""Lay out fixed panel lines once onto a transparent surface.
+
+		Args:
+			lines: Sequence of (text, color) pairs, one per panel row.
+
+		Returns:
+			A per-pixel-alpha surface UI_COLS cells wide and one cell per line tall.
+		"""
+		block = pygame.Surface((UI_COLS * cell_w, len(lines) * cell_h), pygame.SRCALPHA)
+		for row, (text, color) in enumerate(lines):
+			draw_text_line(0, row, text, color, UI_COLS, use_ui_font=True, target=block)
+		return block
+
+	# Sections that never change during a session, blitted as one surface per frame
+	ui_shortcuts_block = render_ui_block([(ui_shortcuts_header, section_color)] + [(label, ui_color) for label in ui_shortcut_lines])
+	ui_debug_keys_block = render_ui_block([(label, ui_color) for label in ui_debug_key_lines])
+	ui_debug_commands_block = render_ui_block([(line, ui_color) for line in ui_debug_commands])
+	# Section separator: a one-pixel rule across the panel instead of a row of dash glyphs
+	ui_separator_block = pygame.Surface((UI_COLS * cell_w, cell_h), pygame.SRCALPHA)
+	ui_separator_block.fill(dim_color, (0, cell_h // 2, UI_COLS * cell_w, 1))
+
+	def new_ui_layer() -> dict:
+		"""Create an empty cached text layer covering the UI panel.
+
+		The layer has a one-cell margin on every side so glyph overhang is kept.
+		"""
+		surf = pygame.Surface(((UI_COLS + 2) * cell_w, (grid_h + 2) * cell_h), pygame.SRCALPHA)
+		return {'surf': surf, 'lines': None, 'blocks': None}
+
+	def draw_ui_layer(layer: dict, lines: list, blocks: list) -> bool:
+		"""Blit a cached UI layer, redrawing it first if its content changed.
+
+		Args:
+			layer: Layer created by new_ui_layer().
+			lines: (row, text, color) entries drawn with the UI font.
+			blocks: (row, surface) entries for pre-rendered panel sections.
+
+		Returns:
+			True if the layer's content changed since the previous call.
+		"""
+		changed = lines != layer['lines'] or blocks != layer['blocks']
+		if changed:
+			surf = layer['surf']
+			surf.fill((0, 0, 0, 0))
+			for row, text, color in lines:
+				draw_text_line(1, row + 1, text, color, UI_COLS, use_ui_font=True, target=surf)
+			for row, block in blocks:
+				surf.blit(block, (cell_w, (row + 1) * cell_h))
+			layer['lines'] = lines
+			layer['blocks'] = blocks
+		screen.blit(layer['surf'], (off_x - cell_w, off_y - cell_h))
+		return changed
+
+	# Panel text, and the debug readout drawn over it; each is redrawn only when its content changes.
+	# Glyphs that overlap are blended differently on a transparent layer, so the two are kept apart.
+	ui_panel_layer = new_ui_layer()
+	ui_debug_layer = new_ui_layer()
+	# Bottom HUD line, re-rendered only when its text changes
+	hud_rendered_text: Optional[str] = None
+	hud_surf: Optional[pygame.Surface] = None
+	hud_rect: Optional[pygame.Rect] = None
+	# What was composited over the UI panel last frame; while it repeats, the panel is not presented
+	ui_panel_present_key: Optional[tuple] = None
 	while running:
 		# Input
 		for event in pygame.event.get():
@@ -3725,22 +4322,18 @@ def run_pygame():
 						continue
 					if event.key == pygame.K_F2:
 						# Action: reveal all tiles (FoW)
-						explored = set((x, y) for x in range(dungeon.w) for y in range(dungeon.h))
+						explored = np.ones((dungeon.w, dungeon.h), dtype=np.bool_)
 						# push reveal progress to done
-						for x in range(dungeon.w):
-							for y in range(dungeon.h):
-								mm_reveal[x][y] = 1.0
-								wr_reveal[x][y] = 1.0
+						mm_reveal.fill(1.0)
+						wr_reveal.fill(1.0)
 						# mark all current walls/floors/brick as touched
-						bricks_touched = set((x, y) for x in range(dungeon.w) for y in range(dungeon.h)
-										     if dungeon.tiles[x][y] == TILE_WALL and dungeon.materials[x][y] == MAT_BRICK)
-						walls_touched = set((x, y) for x in range(dungeon.w) for y in range(dungeon.h)
-									    if dungeon.tiles[x][y] == TILE_WALL)
-						floors_touched = set((x, y) for x in range(dungeon.w) for y in range(dungeon.h)
-								    if dungeon.tiles[x][y] == TILE_FLOOR)
+						tiles_arr = dungeon.tiles
+						walls_touched = tiles_arr == TILE_WALL
+						bricks_touched = walls_touched & (dungeon.materials == MAT_BRICK)
+						floors_touched = tiles_arr == TILE_FLOOR
 						# For debug reveal, consider all reachable floors as stepped
 						reachable = compute_reachable_floors(dungeon, px, py)
-						floors_stepped = set(reachable)
+						floors_stepped = dungeon.floor_region_mask(reachable)
 						# keep level snapshot in sync if present
 						if levels and 0 <= current_level_index < len(levels):
 							levels[current_level_index]['bricks_touched'] = bricks_touched
@@ -3826,24 +4419,19 @@ def run_pygame():
 						x0 = max(0, px - pf.width // 2)
 						y0 = max(0, py - pf.height // 2)
 						dungeon.stamp_prefab(x0, y0, pf.cells, pf.legend)
-						# refresh FOV
+						# refresh FOV and the exposed-wall mask
 						fov = FOV(dungeon)
+						wall_border_mask = None
 						# update totals (dungeon changed)
 						total_bricks = count_total_bricks(dungeon)
 						reachable = compute_reachable_floors(dungeon, px, py)
 						total_floors = len(reachable)
 						total_walls = count_total_exposed_walls(dungeon, reachable)
 						# reconcile touched sets against current dungeon state
-						bricks_touched = set((x, y) for (x, y) in bricks_touched
-							if 0 <= x < dungeon.w and 0 <= y < dungeon.h and
-							   dungeon.tiles[x][y] == TILE_WALL and dungeon.materials[x][y] == MAT_BRICK)
-						walls_touched = set((x, y) for (x, y) in walls_touched
-							if 0 <= x < dungeon.w and 0 <= y < dungeon.h and any(
-								0 <= x+dx < dungeon.w and 0 <= y+dy < dungeon.h and dungeon.tiles[x+dx][y+dy] == TILE_FLOOR and ((x+dx, y+dy) in reachable)
-								for dx in (-1,0,1) for dy in (-1,0,1) if not (dx==0 and dy==0)
-							))
-						floors_touched = set((x, y) for (x, y) in floors_touched
-							if 0 <= x < dungeon.w and 0 <= y < dungeon.h and dungeon.tiles[x][y] == TILE_FLOOR)
+						tiles_arr = dungeon.tiles
+						bricks_touched = bricks_touched & (tiles_arr == TILE_WALL) & (dungeon.materials == MAT_BRICK)
+						walls_touched = walls_touched & adjacent_to_mask(dungeon.floor_region_mask(reachable))
+						floors_touched = floors_touched & (tiles_arr == TILE_FLOOR)
 						if 0 <= current_level_index < len(levels):
 							levels[current_level_index]['total_bricks'] = total_bricks
 							levels[current_level_index]['total_walls'] = total_walls
@@ -3852,8 +4440,7 @@ def run_pygame():
 							levels[current_level_index]['walls_touched'] = walls_touched
 							levels[current_level_index]['floors_touched'] = floors_touched
 							# Reconcile stepped floors to valid floors
-							floors_stepped = set((x, y) for (x, y) in floors_stepped
-												if 0 <= x < dungeon.w and 0 <= y < dungeon.h and dungeon.tiles[x][y] == TILE_FLOOR)
+							floors_stepped = floors_stepped & (tiles_arr == TILE_FLOOR)
 							levels[current_level_index]['floors_stepped'] = floors_stepped
 					continue
 
@@ -4140,7 +4727,7 @@ def run_pygame():
 								add_message(f"Game saved as '{nm}'.")
 						else:
 							ch = event.unicode
-							if ch and re.match(r"[A-Za-z0-9_-]", ch):
+							if ch and SAVE_NAME_CHAR_RE.match(ch):
 								if len(save_name) < 40:
 									save_name += ch
 						continue
@@ -4204,69 +4791,61 @@ def run_pygame():
 							if debug_noclip or not dungeon.is_wall(nx, ny):
 								px, py = nx, ny
 								# Track floors stepped-on
-								if dungeon.tiles[px][py] == TILE_FLOOR and (px, py) not in floors_stepped:
-									floors_stepped.add((px, py))
+								if dungeon.tiles[px, py] == TILE_FLOOR and not floors_stepped[px, py]:
+									floors_stepped[px, py] = True
 									if levels and 0 <= current_level_index < len(levels):
 										levels[current_level_index]['floors_stepped'] = floors_stepped
 
-		# Update visibility after input
+		# Update visibility after input. The sets feed the per-tile illumination and search
+		# bookkeeping; the renderers read the matching (w, h) masks
 		player_visible: set[tuple[int, int]]
 		torch_lit_tiles: set[tuple[int, int]]
-		if debug_show_all_visible:
-			visible = {(x, y) for x in range(dungeon.w) for y in range(dungeon.h)}
-			los_visible = set(visible)
-			player_visible = set(visible)
-			torch_lit_tiles = set()
-		else:
-			base_radius = max(1, int(light_radius - 0.5))
-			extra_reach = 0.0
-			if torches:
+		visible_mask: np.ndarray
+		player_mask: np.ndarray
+		# FoV only changes when the player, light radius, level or map changes; reuse it otherwise
+		fov_key = (dungeon, dungeon.version, torches, px, py, light_radius, debug_show_all_visible)
+		if fov_key != fov_cache_key:
+			fov_cache_key = fov_key
+			if debug_show_all_visible:
+				visible_mask = np.ones((dungeon.w, dungeon.h), dtype=np.bool_)
+				player_mask = visible_mask
+				player_visible = points_from_mask(visible_mask)
+				torch_lit_tiles = set()
+			else:
+				base_radius = max(1, int(light_radius - 0.5))
+				extra_reach = 0.0
+				if torches:
+					for torch in torches:
+						tx, ty = torch['x'], torch['y']
+						dist = math.hypot(tx - px, ty - py)
+						torch_radius = torch.get('radius', TORCH_LIGHT_RADIUS)
+						extra_reach = max(extra_reach, dist + torch_radius)
+				extended_radius = max(base_radius, int(math.ceil(extra_reach)))
+				# Shadowcast once to the farthest reach, then cut the player's and torches' light
+				# circles out of it with precomputed disc stencils
+				los_mask = fov.compute_mask(px, py, extended_radius)
+				player_mask = np.zeros_like(los_mask)
+				stamp_disc(player_mask, px, py, base_radius, base_radius * base_radius)
+				player_mask &= los_mask
+				torch_mask = np.zeros_like(los_mask)
 				for torch in torches:
 					tx, ty = torch['x'], torch['y']
-					dist = math.hypot(tx - px, ty - py)
+					if not (0 <= tx < dungeon.w and 0 <= ty < dungeon.h and los_mask[tx, ty]):
+						continue
 					torch_radius = torch.get('radius', TORCH_LIGHT_RADIUS)
-					extra_reach = max(extra_reach, dist + torch_radius)
-			extended_radius = max(base_radius, int(math.ceil(extra_reach)))
-			los_visible = fov.compute(px, py, extended_radius)
-			visible = set()
-			player_visible = set()
-			torch_lit_tiles = set()
-			base_radius_sq = base_radius * base_radius
-			for (vx, vy) in los_visible:
-				dx = vx - px
-				dy = vy - py
-				if dx * dx + dy * dy <= base_radius_sq:
-					visible.add((vx, vy))
-					player_visible.add((vx, vy))
-			for torch in torches:
-				tx, ty = torch['x'], torch['y']
-				if (tx, ty) not in los_visible:
-					continue
-				torch_radius = torch.get('radius', TORCH_LIGHT_RADIUS)
-				torch_radius_sq = torch_radius * torch_radius
-				reach = int(math.ceil(torch_radius))
-				for dy in range(-reach, reach + 1):
-					for dx in range(-reach, reach + 1):
-						x = tx + dx
-						y = ty + dy
-						if not (0 <= x < dungeon.w and 0 <= y < dungeon.h):
-							continue
-						if dx * dx + dy * dy > torch_radius_sq + 1e-6:
-							continue
-						if (x, y) in los_visible:
-							visible.add((x, y))
-							torch_lit_tiles.add((x, y))
+					stamp_disc(torch_mask, tx, ty, int(math.ceil(torch_radius)), torch_radius * torch_radius + 1e-6)
+				torch_mask &= los_mask
+				player_visible = points_from_mask(player_mask)
+				torch_lit_tiles = points_from_mask(torch_mask)
+				visible_mask = player_mask | torch_mask
 
 		# Animate minimap reveal
 		dt = clock.get_time() / 1000.0
 		reveal_rate = 2.0
-		for (ex, ey) in explored:
-			if 0 <= ex < dungeon.w and 0 <= ey < dungeon.h:
-				if mm_reveal[ex][ey] < 1.0:
-					mm_reveal[ex][ey] = clamp(mm_reveal[ex][ey] + dt * reveal_rate, 0.0, 1.0)
-				# Animate world FoW reveal similarly
-				if wr_reveal[ex][ey] < 1.0:
-					wr_reveal[ex][ey] = clamp(wr_reveal[ex][ey] + dt * reveal_rate, 0.0, 1.0)
+		# Explored tiles (minimap and world FoW alike) fade in toward fully revealed, in place
+		for reveal_buf in (mm_reveal, wr_reveal):
+			np.add(reveal_buf, dt * reveal_rate, out=reveal_buf, where=explored)
+			np.minimum(reveal_buf, 1.0, out=reveal_buf)
 
 		# Update dungeon fade-in
 		if not dungeon_fade_complete:
@@ -4389,15 +4968,24 @@ def run_pygame():
 
 		# Compute reachable floors once per frame for exploration logic
 		reachable_this_frame = compute_reachable_floors(dungeon, px, py)
+		if wall_border_mask is None or wall_border_source[0] is not dungeon or wall_border_source[1] is not reachable_this_frame:
+			wall_border_mask = exposed_wall_mask(dungeon, reachable_this_frame)
+			wall_border_source = (dungeon, reachable_this_frame)
+		if exposed_bricks_key[0] is not wall_border_mask or exposed_bricks_key[1] is not bricks_touched:
+			exposed_bricks_total, exposed_bricks_touched = count_exposed_bricks(dungeon, bricks_touched, exposed=wall_border_mask)
+			exposed_bricks_key = (wall_border_mask, bricks_touched)
 
 		# Render
-		# Static parchment background (no spiral/animation)
-		screen.blit(parchment_static, (0, 0))
+		# Static parchment background (no spiral/animation), restored only where last frame drew
+		for rect in dirty_rects_prev:
+			screen.blit(parchment_static, rect, rect)
 		off_x, off_y = compute_offsets()
 
 		# Camera centered on player; viewport size is map_w x grid_h
 		view_w = map_w
 		view_h = grid_h
+		# UI panel, border and map viewport are redrawn every frame
+		dirty_rects_this_frame = [pygame.Rect(off_x, off_y, (UI_COLS + 1 + view_w) * cell_w, view_h * cell_h)]
 		# Always center camera on player; allow camera to go out-of-bounds
 		cam_x = px - view_w // 2
 		cam_y = py - view_h // 2
@@ -4434,324 +5022,179 @@ def run_pygame():
 
 		ticks = pygame.time.get_ticks()
 		light_sources = prepare_light_sources(px, py, light_radius, torches, ticks)
-		torch_only_sources = [src for src in light_sources if src.get('is_torch')]
-
-		# Draw tiles in viewport window
-		for sy in range(view_h):
-			wy = cam_y + sy
-			for sx in range(view_w):
-				wx = cam_x + sx
-				draw_ch = ' '
-				color = INK_DARK
-				block_color = None
-				mat = MAT_BRICK  # Default material for out-of-bounds areas
-				if 0 <= wx < dungeon.w and 0 <= wy < dungeon.h:
-					# In-bounds tiles
-					tile = dungeon.tiles[wx][wy]
-					mat = dungeon.materials[wx][wy]
-					world_pos = (wx, wy)
-					
-					if world_pos in visible:
-						visible_by_player = world_pos in player_visible
-						if visible_by_player:
-							if world_pos not in explored:
-								explored.add(world_pos)
-							if 0 <= wx < dungeon.w and 0 <= wy < dungeon.h:
-								if mm_reveal and mm_reveal[wx][wy] < 1.0:
-									mm_reveal[wx][wy] = 1.0
-								if wr_reveal and wr_reveal[wx][wy] < 1.0:
-									wr_reveal[wx][wy] = 1.0
-						light_value, primary_source = evaluate_light_sources(light_sources, wx, wy)
-						tval = max(0.1, min(light_value, 1.0))
-						# Get material-specific character and color
-						is_wall = (tile == TILE_WALL)
-						is_door = (tile == TILE_DOOR)
-						
-						if is_door:
-							# Doors get special rendering
-							door_state = dungeon.doors[wx][wy] if 0 <= wx < dungeon.w and 0 <= wy < dungeon.h else -1
-							if door_state == DOOR_OPEN:
-								draw_ch = "'"  # Open door
-								base_color = (120, 80, 50)  # Medium brown
-							elif door_state == DOOR_LOCKED:
-								draw_ch = "+"  # Locked door (solid)
-								base_color = (80, 50, 30)   # Dark brown
-							else:  # DOOR_CLOSED or default
-								draw_ch = "+"  # Closed door
-								base_color = (100, 65, 40)  # Brown
-						else:
-							draw_ch, base_color = get_material_ascii_char_and_color(mat, is_wall)
-						
-						# Ensure floors don't render characters
-						if tile == TILE_FLOOR:
-							draw_ch = ' '
-						
-						# Apply lighting to the material color
-						color = scale_color(base_color, tval)
-						torch_here = torch_lookup.get(world_pos)
-						if torch_only_sources:
-							torch_light, _ = evaluate_light_sources(torch_only_sources, wx, wy)
-							if torch_light > 0.0:
-								warmth = min(60, int(80 * torch_light))
-								color = (
-									min(255, color[0] + warmth),
-									min(255, color[1] + warmth // 2),
-									color[2]
-								)
-						if torch_here and render_mode != 'blocks':
-							flame_scale = clamp(torch_here.get('current_intensity', TORCH_BASE_INTENSITY), 0.6, 1.0)
-							draw_ch = '†'
-							color = (
-								min(255, int(TORCH_FLAME_COLOR[0] * flame_scale)),
-								min(255, int(TORCH_FLAME_COLOR[1] * flame_scale)),
-								min(255, int(TORCH_FLAME_COLOR[2] * flame_scale)),
-							)
-						
-						# Apply gradual illumination - tiles start dim and brighten over time
-						if (wx, wy) in tile_illumination_alpha:
-							illum_alpha = tile_illumination_alpha[(wx, wy)]
-							# Start at 20% brightness, fade up to 100% over search time
-							min_brightness = 0.2
-							illum_multiplier = min_brightness + (1.0 - min_brightness) * illum_alpha
-							color = scale_color(color, illum_multiplier)
-						
-						# Apply search progress visual enhancement (for tiles with secrets)
-						if (wx, wy) in tile_search_alpha:
-							search_alpha = tile_search_alpha[(wx, wy)]
-							if search_alpha > 0.0:
-								# Gradually brighten and add a subtle golden tint as search progresses
-								# Boost brightness by up to 40% at full search
-								brightness_boost = 1.0 + (0.4 * search_alpha)
-								color = scale_color(color, brightness_boost)
-								
-								# Add subtle golden tint (more pronounced as search progresses)
-								gold_tint = int(30 * search_alpha)  # Up to +30 to red/green channels
-								color = (
-									min(255, color[0] + gold_tint),
-									min(255, color[1] + int(gold_tint * 0.8)),  # Slightly less green for gold
-									color[2]  # No blue boost
-								)
-						
-						# Enhanced directional boost for walls: stronger effect
-						if tile == TILE_WALL:
-							wnx, wny = wall_normal(dungeon, wx, wy)
-							light_origin = primary_source if primary_source else (px, py)
-							lx = light_origin[0] - wx
-							ly = light_origin[1] - wy
-							llen = math.hypot(lx, ly)
-							if llen > 1e-6:
-								lx /= llen
-								ly /= llen
-							# Only apply if we have a meaningful normal
-							ndotl = max(0.0, wnx * lx + wny * ly)
-							if ndotl > 0.0:
-								# Stronger boost for walls facing the player
-								boost = 0.5 * ndotl * tval  # Scale by distance too
-								color = scale_color(color, 1.0 + boost)
-						
-						# Track exploration metrics only when the player truly reveals the tile
-						if visible_by_player:
-							# - Brick-specific subset
-							if tile == TILE_WALL and mat == MAT_BRICK:
-								bricks_touched.add((wx, wy))
-							# - Combined wall/floor sets
-							if tile == TILE_WALL:
-								# Only count walls that border a reachable floor tile
-								for dx in (-1,0,1):
-									for dy in (-1,0,1):
-										if dx==0 and dy==0:
-											continue
-										nx, ny = wx+dx, wy+dy
-										if 0 <= nx < dungeon.w and 0 <= ny < dungeon.h and dungeon.tiles[nx][ny] == TILE_FLOOR and (nx, ny) in reachable_this_frame:
-											walls_touched.add((wx, wy))
-											break
-							else:
-								floors_touched.add((wx, wy))
-						
-						block_color = color
-					# Explored but not currently visible: dimmed FoW rendering with INVERTED lighting
-					elif (wx, wy) in explored:
-						prog = wr_reveal[wx][wy]
-						noi = wr_noise[wx][wy]
-						alpha = clamp(pow(clamp(prog + noi, 0.0, 1.0), 1.8), 0.0, 1.0)
-						
-						# Calculate distance for INVERTED lighting in FoW
-						dx = wx - px
-						dy = wy - py
-						d = math.sqrt(dx * dx + dy * dy)
-						
-						# INVERTED lighting: distant areas are brighter in FoW (darker overall)
-						if d <= 1.0:
-							# Areas immediately next to player are darkest in FoW
-							fow_brightness = 0.08
-						else:
-							# Distant areas get progressively brighter, maxing at edge of light radius
-							normalized_distance = min(d / light_radius, 1.0)
-							fow_brightness = 0.08 + (0.22 * normalized_distance)  # Range: 0.08 to 0.30
-						if torch_only_sources:
-							torch_light_fow, _ = evaluate_light_sources(torch_only_sources, wx, wy)
-							if torch_light_fow > 0.0:
-								fow_brightness = max(fow_brightness, 0.10 + 0.35 * torch_light_fow)
-						
-						# Get material-specific character and color for FOG OF WAR
-						is_wall = (tile == TILE_WALL)
-						is_door = (tile == TILE_DOOR)
-						
-						if is_door:
-							# Doors in fog of war
-							door_state = dungeon.doors[wx][wy] if 0 <= wx < dungeon.w and 0 <= wy < dungeon.h else -1
-							if door_state == DOOR_OPEN:
-								draw_ch = "'"  # Open door
-								base_color = (120, 80, 50)  # Medium brown
-							elif door_state == DOOR_LOCKED:
-								draw_ch = "+"  # Locked door (solid)
-								base_color = (80, 50, 30)   # Dark brown
-							else:  # DOOR_CLOSED or default
-								draw_ch = "+"  # Closed door
-								base_color = (100, 65, 40)  # Brown
-						else:
-							draw_ch, base_color = get_material_ascii_char_and_color(mat, is_wall)
-						
-						if is_wall:
-							# FoW walls: Use denser character and apply inverted lighting
-							draw_ch = '▓'  # Dense dither for FoW walls
-							color = scale_color(base_color, fow_brightness)
-						elif is_door:
-							# FoW doors: Keep door character but dim the color
-							color = scale_color(base_color, fow_brightness)
-						else:
-							# FoW floors: Use blank space (invisible, blends with parchment)
-							draw_ch = ' '  # Blank for FoW floors (invisible, blends with parchment)
-							floor_brightness = fow_brightness * 0.5  # Make floors much darker than walls
-							color = scale_color(base_color, floor_brightness)
-							if torch_only_sources:
-								torch_warm, _ = evaluate_light_sources(torch_only_sources, wx, wy)
-								if torch_warm > 0.0:
-									warm_boost = min(45, int(70 * torch_warm))
-									color = (
-										min(255, color[0] + warm_boost),
-										min(255, color[1] + warm_boost // 2),
-										color[2]
-									)
-						
-						# Ensure floors don't render characters
-						if tile == TILE_FLOOR:
-							draw_ch = ' '
-						block_color = color
-				# else: out-of-bounds rendering
-				else:
-					# DARKNESS: Unexplored areas - leave as pure parchment (no character)
-					draw_ch = ' '
-					block_color = None
-
-				# Render according to mode
-				if render_mode == 'blocks':
-					if block_color is not None:
-						# Fill the map cell rectangle (offset by UI columns)
-						cell_x = UI_COLS + 1 + sx
-						cell_y = sy
-						# Slight inset for crisp borders
-						inset = 1
-						# Use material-specific texture
-						material_texture_name = get_material_texture_name(mat)
-						draw_block_at(cell_x, cell_y, block_color, inset=inset, with_dither=True, material_type=material_texture_name)
-						if torch_lookup and (wx, wy) in torch_lookup:
-							draw_torch_overlay(cell_x, cell_y, torch_lookup[(wx, wy)])
-				else:
+		torch_only_sources = light_sources[1:]  # the player's light is always first
+
+		# Draw tiles in viewport window: shade the on-map part of the view as whole arrays
+		x0, x1 = max(0, cam_x), min(dungeon.w, cam_x + view_w)
+		y0, y1 = max(0, cam_y), min(dungeon.h, cam_y + view_h)
+		if x0 < x1 and y0 < y1:
+			# Only visible or explored tiles are drawn (the rest stays parchment), so shrink the
+			# window to their bounding box before any per-tile shading
+			content = visible_mask[x0:x1, y0:y1] | explored[x0:x1, y0:y1]
+			content_cols = np.flatnonzero(content.any(axis=1))
+			content_rows = np.flatnonzero(content.any(axis=0))
+			if content_cols.size:
+				x0, x1 = x0 + int(content_cols[0]), x0 + int(content_cols[-1]) + 1
+				y0, y1 = y0 + int(content_rows[0]), y0 + int(content_rows[-1]) + 1
+			else:
+				x1 = x0
+		if x0 < x1 and y0 < y1:
+			win = (slice(x0, x1), slice(y0, y1))
+			tiles_w = dungeon.tiles[win].astype(np.int16)
+			mats_w = dungeon.materials[win].astype(np.int16)
+			doors_w = dungeon.doors[win].astype(np.int16)
+			vis_w = visible_mask[win]
+			pvis_w = player_mask[win]
+			xs = np.arange(x0, x1, dtype=np.float64)[:, None]
+			ys = np.arange(y0, y1, dtype=np.float64)[None, :]
+			is_wall = tiles_w == TILE_WALL
+			is_door = tiles_w == TILE_DOOR
+			is_floor = tiles_w == TILE_FLOOR
+			mat_idx = np.minimum(mats_w, len(material_base_rgb) - 1)
+			door_idx = np.where((doors_w == DOOR_OPEN) | (doors_w == DOOR_LOCKED), doors_w, DOOR_CLOSED)
+			# Material colour, or the door colour for its open/closed/locked state
+			tile_code = np.where(is_door, door_code_base + door_idx, mat_idx * 2 + is_wall)
+			base = tile_base_rgb[tile_code]
+			# The player light comes first in light_sources, so a torch only wins where strictly brighter
+			torch_light, torch_ox, torch_oy = evaluate_light_field(torch_only_sources, (x0, x1, y0, y1))
+			light_val, light_ox, light_oy = evaluate_light_field(light_sources[:1], (x0, x1, y0, y1))
+			torch_wins = torch_light > light_val
+			light_val = np.where(torch_wins, torch_light, light_val)
+			light_ox = np.where(torch_wins, torch_ox, light_ox)
+			light_oy = np.where(torch_wins, torch_oy, light_oy)
+			torch_lit = torch_light > 0.0
+
+			# Visible tiles: lighting, torch warmth, illumination/search fades, wall boost
+			tval = np.clip(light_val, 0.1, 1.0)
+			lit = scale_color_array(base, tval)
+			warmth = np.where(torch_lit, np.minimum(60, np.floor(80 * torch_light)), 0.0)
+			lit[..., 0] = np.minimum(255, lit[..., 0] + warmth)
+			lit[..., 1] = np.minimum(255, lit[..., 1] + warmth // 2)
+			glyphs = None
+			if render_mode != 'blocks':
+				glyphs = tile_glyphs[tile_code]
+				glyphs[is_floor] = ' '
+				for (tx, ty), torch_here in torch_lookup.items():
+					if x0 <= tx < x1 and y0 <= ty < y1 and vis_w[tx - x0, ty - y0]:
+						flame_scale = max(0.6, min(1.0, torch_here.get('current_intensity', TORCH_BASE_INTENSITY)))
+						glyphs[tx - x0, ty - y0] = '†'
+						lit[tx - x0, ty - y0] = [min(255, int(c * flame_scale)) for c in TORCH_FLAME_COLOR]
+			# Gradual illumination (20% -> 100%) and search progress, looked up for visible tiles only
+			illum = np.ones(tiles_w.shape)
+			search = np.zeros(tiles_w.shape)
+			min_brightness = 0.2
+			vis_x, vis_y = np.nonzero(vis_w)
+			vis_keys = list(zip((vis_x + x0).tolist(), (vis_y + y0).tolist()))
+			illum_vals = np.array([tile_illumination_alpha.get(key, np.nan) for key in vis_keys], dtype=float)
+			search_vals = np.array([tile_search_alpha.get(key, 0.0) for key in vis_keys], dtype=float)
+			illum[vis_x, vis_y] = np.where(np.isnan(illum_vals), 1.0, min_brightness + (1.0 - min_brightness) * illum_vals)
+			search[vis_x, vis_y] = np.maximum(0.0, search_vals)
+			lit = scale_color_array(lit, illum)
+			# Brighten by up to 40% and add a subtle golden tint as search progresses
+			lit = scale_color_array(lit, 1.0 + 0.4 * search)
+			gold_tint = np.floor(30 * search)
+			lit[..., 0] = np.minimum(255, lit[..., 0] + gold_tint)
+			lit[..., 1] = np.minimum(255, lit[..., 1] + np.trunc(gold_tint * 0.8))
+			# Directional boost for walls facing their strongest light (or the player)
+			wnx, wny = dungeon.wall_normals()
+			lx = np.where(np.isnan(light_ox), px, light_ox) - xs
+			ly = np.where(np.isnan(light_oy), py, light_oy) - ys
+			llen = np.hypot(lx, ly)
+			safe_len = np.where(llen > 1e-6, llen, 1.0)
+			ndotl = np.maximum(0.0, wnx[win] * (lx / safe_len) + wny[win] * (ly / safe_len))
+			lit = scale_color_array(lit, np.where(is_wall & (ndotl > 0.0), 1.0 + 0.5 * ndotl * tval, 1.0))
+
+			# Explored but not currently visible: dimmed FoW with INVERTED lighting
+			# (areas next to the player are darkest, distant ones brighten up to the light radius)
+			dxp = xs - px
+			dyp = ys - py
+			d = np.sqrt(dxp * dxp + dyp * dyp)
+			fow_brightness = np.where(d <= 1.0, 0.08, 0.08 + 0.22 * np.minimum(d / light_radius, 1.0))
+			fow_brightness = np.where(torch_lit, np.maximum(fow_brightness, 0.10 + 0.35 * torch_light), fow_brightness)
+			# FoW floors are much darker than walls/doors but pick up torch warmth
+			solid = is_wall | is_door
+			fog = scale_color_array(base, np.where(solid, fow_brightness, fow_brightness * 0.5))
+			warm_boost = np.where(~solid & torch_lit, np.minimum(45, np.floor(70 * torch_light)), 0.0)
+			fog[..., 0] = np.minimum(255, fog[..., 0] + warm_boost)
+			fog[..., 1] = np.minimum(255, fog[..., 1] + warm_boost // 2)
+
+			# Track exploration metrics only when the player truly reveals the tile. The updates are
+			# idempotent, so frames where neither the player's view nor the wall border changed skip them
+			if player_visible != metrics_visible or wall_border_mask is not metrics_border:
+				metrics_visible = player_visible
+				metrics_border = wall_border_mask
+				explored[win] |= pvis_w
+				new_bricks = pvis_w & is_wall & (mats_w == MAT_BRICK) & ~bricks_touched[win]
+				bricks_touched[win] |= new_bricks
+				exposed_bricks_touched += int(np.count_nonzero(new_bricks & wall_border_mask[win]))
+				floors_touched[win] |= pvis_w & ~is_wall
+				# Only count walls that border a reachable floor tile
+				walls_touched[win] |= pvis_w & wall_border_mask[win]
+				mm_reveal[win][pvis_w] = 1.0
+				wr_reveal[win][pvis_w] = 1.0
+
+			drawn = vis_w | explored[win]
+			colors = np.where(vis_w[..., None], lit, fog).astype(np.uint8)
+			# Visit drawn cells in row-major order so overlapping glyphs stack as before
+			drawn_cells = np.argwhere(drawn.T).tolist()
+			vx0 = x0 - cam_x
+			vy0 = y0 - cam_y
+			if render_mode == 'blocks':
+				# Flat fills go straight into the screen pixels in one store, then all textures in one
+				# batch. Only interiors of drawn cells are written, so the parchment stays visible in
+				# undrawn cells and the 1px inset gaps.
+				cells_px = off_x + (UI_COLS + 1 + vx0) * cell_w + 1
+				cells_py = off_y + vy0 * cell_h + 1
+				drawn_x, drawn_y = np.nonzero(drawn)
+				screen_px = pygame.surfarray.pixels3d(screen)
+				win_cells = screen_px[cells_px - 1:cells_px - 1 + (x1 - x0) * cell_w, cells_py - 1:cells_py - 1 + (y1 - y0) * cell_h]
+				win_cells = win_cells.reshape(x1 - x0, cell_w, y1 - y0, cell_h, 3)
+				win_cells[drawn_x, 1:cell_w - 1, drawn_y, 1:cell_h - 1] = colors[drawn_x, drawn_y][:, None, None, :]
+				# Release the pixel view so the surface is unlocked for the blits below
+				del screen_px, win_cells
+				screen.blits(
+					[(material_texture_atlas[mat_idx[tx, ty]], (cells_px + tx * cell_w, cells_py + ty * cell_h))
+					 for ty, tx in drawn_cells],
+					doreturn=False,
+				)
+				for (tx, ty), torch_here in torch_lookup.items():
+					if x0 <= tx < x1 and y0 <= ty < y1 and drawn[tx - x0, ty - y0]:
+						draw_torch_overlay(UI_COLS + 1 + vx0 + tx - x0, vy0 + ty - y0, torch_here)
+			else:
+				glyphs = np.where(vis_w, glyphs, np.where(is_wall, '▓', np.where(is_door, tile_glyphs[tile_code], ' ')))
+				glyph_blits = []
+				for ty, tx in drawn_cells:
+					draw_ch = glyphs[tx, ty]
 					if draw_ch != ' ':
-						surf = render_glyph(draw_ch, color)
-						gx = off_x + (UI_COLS + 1 + sx) * cell_w + (cell_w - surf.get_width()) // 2
-						gy = off_y + sy * cell_h + (cell_h - surf.get_height()) // 2
-						screen.blit(surf, (gx, gy))
+						surf = render_glyph(draw_ch, tuple(colors[tx, ty].tolist()))
+						gx = off_x + (UI_COLS + 1 + vx0 + tx) * cell_w + (cell_w - surf.get_width()) // 2
+						gy = off_y + (vy0 + ty) * cell_h + (cell_h - surf.get_height()) // 2
+						glyph_blits.append((surf, (gx, gy)))
+				screen.blits(glyph_blits, doreturn=False)
 
 		# === Gold glow for fully searched tiles in main view (outermost perimeter, persists in FoW) ===
-		gold_color = (255, 215, 0)
-		for sy in range(view_h):
-			wy = cam_y + sy
-			for sx in range(view_w):
-				wx = cam_x + sx
-				if 0 <= wx < dungeon.w and 0 <= wy < dungeon.h:
-					# Check if this tile is fully searched and explored (not just visible - persist in FoW)
-					# Draw glow on ANY tile (wall or floor) that borders unsearched area
-					if tile_illumination_source.get((wx, wy)) == 'player' and tile_illumination_alpha.get((wx, wy), 0.0) >= 1.0 and (wx, wy) in explored:
-						# Draw gold glow on outer edges only
-						cell_x = UI_COLS + 1 + sx
-						cell_y = sy
-						
-						if render_mode == 'blocks':
-							# Block mode: draw glow lines on outer edges
-							glow_surf = pygame.Surface((cell_w, cell_h), pygame.SRCALPHA)
-							
-							# Check each cardinal direction for unsearched neighbors
-							# Top
-							if (wx, wy-1) not in tile_illumination_alpha or tile_illumination_alpha.get((wx, wy-1), 0.0) < 1.0:
-								for i in range(2):
-									alpha = 100 - (i * 35)
-									glow_color_alpha = (*gold_color, alpha)
-									offset = i * 2
-									pygame.draw.line(glow_surf, glow_color_alpha, (0, offset), (cell_w, offset), 2)
-							# Bottom
-							if (wx, wy+1) not in tile_illumination_alpha or tile_illumination_alpha.get((wx, wy+1), 0.0) < 1.0:
-								for i in range(2):
-									alpha = 100 - (i * 35)
-									glow_color_alpha = (*gold_color, alpha)
-									offset = i * 2
-									pygame.draw.line(glow_surf, glow_color_alpha, (0, cell_h-1-offset), (cell_w, cell_h-1-offset), 2)
-							# Left
-							if (wx-1, wy) not in tile_illumination_alpha or tile_illumination_alpha.get((wx-1, wy), 0.0) < 1.0:
-								for i in range(2):
-									alpha = 100 - (i * 35)
-									glow_color_alpha = (*gold_color, alpha)
-									offset = i * 2
-									pygame.draw.line(glow_surf, glow_color_alpha, (offset, 0), (offset, cell_h), 2)
-							# Right
-							if (wx+1, wy) not in tile_illumination_alpha or tile_illumination_alpha.get((wx+1, wy), 0.0) < 1.0:
-								for i in range(2):
-									alpha = 100 - (i * 35)
-									glow_color_alpha = (*gold_color, alpha)
-									offset = i * 2
-									pygame.draw.line(glow_surf, glow_color_alpha, (cell_w-1-offset, 0), (cell_w-1-offset, cell_h), 2)
-							
-							gx = off_x + cell_x * cell_w
-							gy = off_y + cell_y * cell_h
-							screen.blit(glow_surf, (gx, gy))
-						else:
-							# ASCII mode: draw glow lines on outer edges
-							glow_surf = pygame.Surface((cell_w, cell_h), pygame.SRCALPHA)
-							
-							# Check each cardinal direction for unsearched neighbors
-							# Top
-							if (wx, wy-1) not in tile_illumination_alpha or tile_illumination_alpha.get((wx, wy-1), 0.0) < 1.0:
-								for i in range(2):
-									alpha = 100 - (i * 35)
-									glow_color_alpha = (*gold_color, alpha)
-									offset = i
-									pygame.draw.line(glow_surf, glow_color_alpha, (0, offset), (cell_w, offset), 1)
-							# Bottom
-							if (wx, wy+1) not in tile_illumination_alpha or tile_illumination_alpha.get((wx, wy+1), 0.0) < 1.0:
-								for i in range(2):
-									alpha = 100 - (i * 35)
-									glow_color_alpha = (*gold_color, alpha)
-									offset = i
-									pygame.draw.line(glow_surf, glow_color_alpha, (0, cell_h-1-offset), (cell_w, cell_h-1-offset), 1)
-							# Left
-							if (wx-1, wy) not in tile_illumination_alpha or tile_illumination_alpha.get((wx-1, wy), 0.0) < 1.0:
-								for i in range(2):
-									alpha = 100 - (i * 35)
-									glow_color_alpha = (*gold_color, alpha)
-									offset = i
-									pygame.draw.line(glow_surf, glow_color_alpha, (offset, 0), (offset, cell_h), 1)
-							# Right
-							if (wx+1, wy) not in tile_illumination_alpha or tile_illumination_alpha.get((wx+1, wy), 0.0) < 1.0:
-								for i in range(2):
-									alpha = 100 - (i * 35)
-									glow_color_alpha = (*gold_color, alpha)
-									offset = i
-									pygame.draw.line(glow_surf, glow_color_alpha, (cell_w-1-offset, 0), (cell_w-1-offset, cell_h), 1)
-							
-							gx = off_x + cell_x * cell_w
-							gy = off_y + cell_y * cell_h
-							screen.blit(glow_surf, (gx, gy))
+		# Only tiles the player illuminated can glow, so walk those instead of every view cell
+		illum_alpha = tile_illumination_alpha
+		view_x1 = cam_x + view_w
+		view_y1 = cam_y + view_h
+		glow_px0 = off_x + (UI_COLS + 1 - cam_x) * cell_w  # screen x of world column 0
+		glow_py0 = off_y - cam_y * cell_h  # screen y of world row 0
+		dw, dh = dungeon.w, dungeon.h
+		for (wx, wy), illum_src in tile_illumination_source.items():
+			if illum_src != 'player' or not (cam_x <= wx < view_x1 and cam_y <= wy < view_y1):
+				continue
+			# Check if this tile is fully searched and explored (not just visible - persist in FoW)
+			# Draw glow on ANY tile (wall or floor) that borders unsearched area
+			if 0 <= wx < dw and 0 <= wy < dh and illum_alpha.get((wx, wy), 0.0) >= 1.0 and explored[wx, wy]:
+				# Gold glow lines on the outer edges only (those with an unsearched neighbour)
+				glow_surf = get_glow_edge_surface(
+					illum_alpha.get((wx, wy - 1), 0.0) < 1.0,
+					illum_alpha.get((wx, wy + 1), 0.0) < 1.0,
+					illum_alpha.get((wx - 1, wy), 0.0) < 1.0,
+					illum_alpha.get((wx + 1, wy), 0.0) < 1.0,
+				)
+				if glow_surf is not None:
+					screen.blit(glow_surf, (glow_px0 + wx * cell_w, glow_py0 + wy * cell_h))
 
 		# Draw player at the center of the viewport
 		pcx = int(clamp(view_w // 2, 0, view_w - 1))
@@ -4800,182 +5243,174 @@ def run_pygame():
 		# HUD (optional)
 		if SETTINGS.get('hud_text', True) and not menu_open:
 			hud_text = f"WASD move, Esc/Q quit | {dungeon.w}x{dungeon.h} | r={light_radius}"
-			hud_surf = font.render(hud_text, False, scale_color(WALL_LIGHT, 1.0))
-			screen.blit(hud_surf, (4, win_h - hud_surf.get_height() - 4))
+			if hud_text != hud_rendered_text:
+				hud_rendered_text = hud_text
+				hud_surf = font.render(hud_text, False, scale_color(WALL_LIGHT, 1.0))
+			hud_rect = screen.blit(hud_surf, (4, win_h - hud_surf.get_height() - 4))
+			dirty_rects_this_frame.append(hud_rect)
+		else:
+			hud_rect = None
 
 		# Bottom-left feedback area (message log) over the map
 		if not menu_open:
 			draw_message_log()
 
 		# UI panel content (draw after world so it overlays if needed)
-		# Enhanced organized UI with sections
-		ui_color = scale_color(WALL_LIGHT, 0.95)
-		section_color = scale_color(WALL_LIGHT, 1.0)
-		dim_color = scale_color(WALL_LIGHT, 0.7)
-		
+		# Enhanced organized UI with sections, collected as (row, text, color) lines and (row, surface) blocks
 		line_y = 0
+		ui_lines: list[tuple[int, str, tuple[int, int, int]]] = []
+		ui_blocks: list[tuple[int, pygame.Surface]] = []
 		
 		if player_character:
 			# === CHARACTER SECTION ===
-			draw_text_line(0, line_y, "== CHARACTER =="[:UI_COLS], section_color, UI_COLS, use_ui_font=True)
+			ui_lines.append((line_y, ui_character_header, section_color))
 			line_y += 1
-			name_short = player_character.name[:UI_COLS]
-			draw_text_line(0, line_y, name_short, section_color, UI_COLS, use_ui_font=True)
+			ui_lines.append((line_y, player_character.name, section_color))
 			line_y += 1
-			race_class = f"{player_character.race} {player_character.char_class}"[:UI_COLS]
-			draw_text_line(0, line_y, race_class, ui_color, UI_COLS, use_ui_font=True)
+			race_class = f"{player_character.race} {player_character.char_class}"
+			ui_lines.append((line_y, race_class, ui_color))
 			line_y += 1
-			level_xp = f"Level 1  XP:{player_character.xp}"[:UI_COLS]
-			draw_text_line(0, line_y, level_xp, ui_color, UI_COLS, use_ui_font=True)
+			level_xp = f"Level 1  XP:{player_character.xp}"
+			ui_lines.append((line_y, level_xp, ui_color))
 			line_y += 1
-			draw_text_line(0, line_y, "-"*UI_COLS, dim_color, UI_COLS, use_ui_font=True)
+			ui_blocks.append((line_y, ui_separator_block))
 			line_y += 1
 			
 			# === VITALS SECTION ===
-			hp_text = f"HP: {player_character.current_hp}/{player_character.max_hp}"[:UI_COLS]
-			draw_text_line(0, line_y, hp_text, ui_color, UI_COLS, use_ui_font=True)
+			hp_text = f"HP: {player_character.current_hp}/{player_character.max_hp}"
+			ui_lines.append((line_y, hp_text, ui_color))
 			line_y += 1
-			ac_text = f"AC: {player_character.armor_class}"[:UI_COLS]
-			draw_text_line(0, line_y, ac_text, ui_color, UI_COLS, use_ui_font=True)
+			ac_text = f"AC: {player_character.armor_class}"
+			ui_lines.append((line_y, ac_text, ui_color))
 			line_y += 1
-			thac0_text = f"THAC0: {player_character.thac0}"[:UI_COLS]
-			draw_text_line(0, line_y, thac0_text, ui_color, UI_COLS, use_ui_font=True)
+			thac0_text = f"THAC0: {player_character.thac0}"
+			ui_lines.append((line_y, thac0_text, ui_color))
 			line_y += 1
-			draw_text_line(0, line_y, "-"*UI_COLS, dim_color, UI_COLS, use_ui_font=True)
+			ui_blocks.append((line_y, ui_separator_block))
 			line_y += 1
 			
 			# === ATTRIBUTES SECTION ===
-			draw_text_line(0, line_y, "STR DEX CON"[:UI_COLS], dim_color, UI_COLS, use_ui_font=True)
+			ui_lines.append((line_y, ui_attr_labels[0], dim_color))
 			line_y += 1
-			stats = f"{player_character.strength:>3} {player_character.dexterity:>3} {player_character.constitution:>3}"[:UI_COLS]
-			draw_text_line(0, line_y, stats, ui_color, UI_COLS, use_ui_font=True)
+			stats = f"{player_character.strength:>3} {player_character.dexterity:>3} {player_character.constitution:>3}"
+			ui_lines.append((line_y, stats, ui_color))
 			line_y += 1
-			draw_text_line(0, line_y, "INT WIS CHA"[:UI_COLS], dim_color, UI_COLS, use_ui_font=True)
+			ui_lines.append((line_y, ui_attr_labels[1], dim_color))
 			line_y += 1
-			stats2 = f"{player_character.intelligence:>3} {player_character.wisdom:>3} {player_character.charisma:>3}"[:UI_COLS]
-			draw_text_line(0, line_y, stats2, ui_color, UI_COLS, use_ui_font=True)
+			stats2 = f"{player_character.intelligence:>3} {player_character.wisdom:>3} {player_character.charisma:>3}"
+			ui_lines.append((line_y, stats2, ui_color))
 			line_y += 1
-			draw_text_line(0, line_y, "-"*UI_COLS, dim_color, UI_COLS, use_ui_font=True)
+			ui_blocks.append((line_y, ui_separator_block))
 			line_y += 1
 			
 			# === INVENTORY/GOLD ===
-			gold_text = f"Gold: {player_character.gold}gp"[:UI_COLS]
-			draw_text_line(0, line_y, gold_text, ui_color, UI_COLS, use_ui_font=True)
+			gold_text = f"Gold: {player_character.gold}gp"
+			ui_lines.append((line_y, gold_text, ui_color))
 			line_y += 1
-			equip_count = len(player_character.equipment) if hasattr(player_character, 'equipment') else 0
-			inv_text = f"Items: {equip_count}"[:UI_COLS]
-			draw_text_line(0, line_y, inv_text, ui_color, UI_COLS, use_ui_font=True)
+			# Every player character is a char_gui.Character, which always defines equipment
+			inv_text = f"Items: {len(player_character.equipment)}"
+			ui_lines.append((line_y, inv_text, ui_color))
 			line_y += 1
-			draw_text_line(0, line_y, "-"*UI_COLS, dim_color, UI_COLS, use_ui_font=True)
+			ui_blocks.append((line_y, ui_separator_block))
 			line_y += 1
 		else:
 			# === BASIC INFO (no character) ===
-			draw_text_line(0, line_y, "== EXPLORER =="[:UI_COLS], section_color, UI_COLS, use_ui_font=True)
+			ui_lines.append((line_y, ui_explorer_header, section_color))
 			line_y += 1
-			draw_text_line(0, line_y, f"Pos: ({px},{py})"[:UI_COLS], ui_color, UI_COLS, use_ui_font=True)
+			ui_lines.append((line_y, f"Pos: ({px},{py})", ui_color))
 			line_y += 1
-			draw_text_line(0, line_y, f"Dungeon: {dungeon.w}x{dungeon.h}"[:UI_COLS], ui_color, UI_COLS, use_ui_font=True)
+			ui_lines.append((line_y, f"Dungeon: {dungeon.w}x{dungeon.h}", ui_color))
 			line_y += 1
-			draw_text_line(0, line_y, f"Light: {light_radius}"[:UI_COLS], ui_color, UI_COLS, use_ui_font=True)
+			ui_lines.append((line_y, f"Light: {light_radius}", ui_color))
 			line_y += 1
-			draw_text_line(0, line_y, "-"*UI_COLS, dim_color, UI_COLS, use_ui_font=True)
+			ui_blocks.append((line_y, ui_separator_block))
 			line_y += 1
 		
 		# === DUNGEON INFO SECTION ===
-		draw_text_line(0, line_y, "== DUNGEON =="[:UI_COLS], section_color, UI_COLS, use_ui_font=True)
+		ui_lines.append((line_y, ui_dungeon_header, section_color))
 		line_y += 1
-		draw_text_line(0, line_y, f"Level: {current_level_index + 1}"[:UI_COLS], ui_color, UI_COLS, use_ui_font=True)
+		ui_lines.append((line_y, f"Level: {current_level_index + 1}", ui_color))
 		line_y += 1
 		
 		# Exploration percent: floors stepped + exposed brick walls illuminated
-		exposed_bricks_total = count_total_exposed_bricks(dungeon, reachable_this_frame)
 		floors_total = max(0, total_floors or 0)
 		combined_total = max(1, floors_total + exposed_bricks_total)
-		exposed_bricks_touched = count_exposed_bricks_touched(dungeon, bricks_touched, reachable_this_frame)
-		combined_touched = len(floors_stepped)
+		combined_touched = int(np.count_nonzero(floors_stepped))
 		combined_touched = min(combined_touched, floors_total)
 		combined_touched += min(exposed_bricks_touched, exposed_bricks_total)
-		ratio = 0.0 if combined_total <= 0 else (combined_touched / combined_total)
-		ratio = max(0.0, min(1.0, ratio))
-		pct = int(round(ratio * 100))
-		if exposed_bricks_touched < exposed_bricks_total and pct == 100:
+		# Both counts are capped by their totals, so this is already within 0..100; halves round up
+		pct = (combined_touched * 100 + combined_total // 2) // combined_total
+		if pct == 100 and exposed_bricks_touched < exposed_bricks_total:
 			pct = 99
-		draw_text_line(0, line_y, f"Explored: {pct}%"[:UI_COLS], ui_color, UI_COLS, use_ui_font=True)
+		ui_lines.append((line_y, f"Explored: {pct}%", ui_color))
 		line_y += 1
-		draw_text_line(0, line_y, "-"*UI_COLS, dim_color, UI_COLS, use_ui_font=True)
+		ui_blocks.append((line_y, ui_separator_block))
 		line_y += 1
 		
 		# === SHORTCUTS SECTION ===
-		draw_text_line(0, line_y, "== SHORTCUTS =="[:UI_COLS], section_color, UI_COLS, use_ui_font=True)
-		line_y += 1
-		draw_text_line(0, line_y, "I: Inventory"[:UI_COLS], ui_color, UI_COLS, use_ui_font=True)
-		line_y += 1
-		draw_text_line(0, line_y, "C: Character"[:UI_COLS], ui_color, UI_COLS, use_ui_font=True)
-		line_y += 1
-		draw_text_line(0, line_y, "M: Map"[:UI_COLS], ui_color, UI_COLS, use_ui_font=True)
-		line_y += 1
-		draw_text_line(0, line_y, "Esc: Menu"[:UI_COLS], ui_color, UI_COLS, use_ui_font=True)
-		line_y += 1
+		ui_blocks.append((line_y, ui_shortcuts_block))
+		line_y += 1 + len(ui_shortcut_lines)
 
 		# Milestone messages for combined exploration
-		for threshold in (25, 50, 75, 100):
-			if pct >= threshold and threshold not in announced_milestones:
-				add_message(f"Exploration {threshold}% uncovered.")
-				announced_milestones.add(threshold)
+		while next_milestone < len(exploration_milestones) and pct >= exploration_milestones[next_milestone]:
+			add_message(f"Exploration {exploration_milestones[next_milestone]}% uncovered.")
+			next_milestone += 1
 
 		# Debug UI pane additions
 		if debug_mode:
 			line_y += 1
-			draw_text_line(0, line_y, "== DEBUG =="[:UI_COLS], scale_color(WALL_LIGHT, 1.0), UI_COLS, use_ui_font=True)
-			line_y += 1
-			draw_text_line(0, line_y, f"F1 Vis:{'On' if debug_show_all_visible else 'Off'}"[:UI_COLS], ui_color, UI_COLS, use_ui_font=True)
-			line_y += 1
-			draw_text_line(0, line_y, "F2 Reveal"[:UI_COLS], ui_color, UI_COLS, use_ui_font=True)
-			line_y += 1
-			draw_text_line(0, line_y, f"F3 Clip:{'Off' if debug_noclip else 'On'}"[:UI_COLS], ui_color, UI_COLS, use_ui_font=True)
+			ui_lines.append((line_y, ui_debug_header, section_color))
 			line_y += 1
-			draw_text_line(0, line_y, "F4/F5 Lr"[:UI_COLS], ui_color, UI_COLS, use_ui_font=True)
+			ui_lines.append((line_y, f"F1 Vis:{'On' if debug_show_all_visible else 'Off'}", ui_color))
 			line_y += 1
-			draw_text_line(0, line_y, "N NewLvl"[:UI_COLS], ui_color, UI_COLS, use_ui_font=True)
+			ui_lines.append((line_y, "F2 Reveal", ui_color))
 			line_y += 1
-			draw_text_line(0, line_y, "P Stamp"[:UI_COLS], ui_color, UI_COLS, use_ui_font=True)
+			ui_lines.append((line_y, f"F3 Clip:{'Off' if debug_noclip else 'On'}", ui_color))
 			line_y += 1
-			draw_text_line(0, line_y, "Ctrl+D dbg"[:UI_COLS], ui_color, UI_COLS, use_ui_font=True)
-
-			door_counts = count_doors(dungeon)
-			debug_text = [
-				f"Player: ({px}, {py})",
-				f"Level: {current_level_index + 1}",
-				f"Size: {dungeon.w}x{dungeon.h}",
-				"---",
-				"Doors:",
-				f"  Total: {door_counts['total']}",
-				f"  Open: {door_counts['open']}",
-				f"  Closed: {door_counts['closed']}",
-				f"  Locked: {door_counts['locked']}",
-				f"  Unlocked: {door_counts['unlocked']}",
-				"---",
-				"Commands:",
-				"  R: Reveal/Unreveal",
-				"  L: Level up",
-				"  K: Level down",
-				"  P: Regen level",
-				"  S: Save session",
-				"  O: Load session",
-			]
-			for i, line in enumerate(debug_text):
-				draw_text_line(0, 14 + i, line, ui_color, UI_COLS, use_ui_font=True)
+			ui_blocks.append((line_y, ui_debug_keys_block))
+			line_y += len(ui_debug_key_lines)
+
+			if door_counts_key != (dungeon, dungeon.version):
+				door_counts_key = (dungeon, dungeon.version)
+				door_counts = count_doors(dungeon)
+				door_count_lines = (
+					"---",
+					"Doors:",
+					f"  Total: {door_counts.total}",
+					f"  Open: {door_counts.open}",
+					f"  Closed: {door_counts.closed}",
+					f"  Locked: {door_counts.locked}",
+					f"  Unlocked: {door_counts.unlocked}",
+				)
+			# Only the player position, level and door counts vary; rebuild the entries when they do
+			if debug_lines_key != (px, py, current_level_index, door_counts_key):
+				debug_lines_key = (px, py, current_level_index, door_counts_key)
+				debug_text = (
+					f"Player: ({px}, {py})",
+					f"Level: {current_level_index + 1}",
+					f"Size: {dungeon.w}x{dungeon.h}",
+				) + door_count_lines
+				debug_lines = list(zip(ui_debug_rows, debug_text, repeat(ui_color)))
+				debug_blocks = [(ui_debug_rows.start + len(debug_text), ui_debug_commands_block)]
+
+		ui_panel_changed = draw_ui_layer(ui_panel_layer, ui_lines, ui_blocks)
+		if debug_mode:
+			ui_panel_changed |= draw_ui_layer(ui_debug_layer, debug_lines, debug_blocks)
 
 		# Minimap (after UI/world)
 		if not menu_open and not inventory_open:
-			draw_minimap(screen, dungeon, explored, visible, px, py, win_w, win_h)
+			minimap_rect = draw_minimap(screen, dungeon, explored, visible_mask, px, py, win_w, win_h)
+			if minimap_rect is not None:
+				dirty_rects_this_frame.append(minimap_rect)
 
 		# Draw inventory if open
 		if inventory_open:
 			draw_inventory_slotbased()
+			dirty_rects_this_frame.append(screen.get_rect())
 		# Draw menu last if open
 		elif menu_open:
 			draw_menu()
+			dirty_rects_this_frame.append(screen.get_rect())
 
 		# Apply dungeon fade-in overlay (fade from black to transparent)
 		if not dungeon_fade_complete:
@@ -4983,9 +5418,24 @@ def run_pygame():
 			fade_overlay.fill((0, 0, 0))
 			fade_alpha = int(255 * (1.0 - dungeon_fade_alpha))  # Invert: start at 255 (opaque black), end at 0 (transparent)
 			fade_overlay.set_alpha(fade_alpha)
-			screen.blit(fade_overlay, (0, 0))
-
-		pygame.display.flip()
+			dirty_rects_this_frame.append(screen.blit(fade_overlay, (0, 0)))
+
+		# The panel is redrawn every frame, but its pixels only differ from the previous frame when its
+		# layers, the HUD line or the offsets changed, or another overlay touched it this frame or last
+		present_rects = dirty_rects_prev + dirty_rects_this_frame
+		panel_rect = pygame.Rect(off_x, off_y, UI_COLS * cell_w, view_h * cell_h)
+		panel_key = (off_x, off_y, debug_mode, hud_surf if hud_rect is not None else None)
+		overlays = dirty_rects_prev[1:] + dirty_rects_this_frame[1:]
+		if (
+			not ui_panel_changed
+			and panel_key == ui_panel_present_key
+			and not any(r != hud_rect and r.colliderect(panel_rect) for r in overlays)
+		):
+			map_rect = pygame.Rect(panel_rect.right, off_y, (1 + view_w) * cell_w, view_h * cell_h)
+			present_rects = [map_rect] + overlays
+		ui_panel_present_key = panel_key
+		present_frame(present_rects)
+		dirty_rects_prev = dirty_rects_this_frame
 		clock.tick(FPS)
 		frame_count += 1
 
@@ -4994,31 +5444,25 @@ def run_pygame():
 		drip_sfx.stop()
 
 
-def count_doors(dungeon):
+class DoorCounts(NamedTuple):
+    """Door totals by state, as shown in the debug panel."""
+    total: int
+    closed: int
+    open: int
+    locked: int
+    unlocked: int
+
+
+def count_doors(dungeon) -> DoorCounts:
     """Counts doors by state in the given dungeon."""
-    total = 0
-    closed = 0
-    open_doors = 0
-    locked = 0
-    for y in range(dungeon.h):
-        for x in range(dungeon.w):
-            door_state = dungeon.doors[x][y]
-            if door_state != -1:
-                total += 1
-                if door_state == DOOR_CLOSED:
-                    closed += 1
-                elif door_state == DOOR_OPEN:
-                    open_doors += 1
-                elif door_state == DOOR_LOCKED:
-                    locked += 1
+    # One counting pass over the grid; shifting by one puts "no door" (-1) in bin 0
+    counts = np.bincount((dungeon.doors + 1).ravel(), minlength=DOOR_LOCKED + 2)
+    closed = int(counts[DOOR_CLOSED + 1])
+    open_doors = int(counts[DOOR_OPEN + 1])
+    locked = int(counts[DOOR_LOCKED + 1])
+    total = closed + open_doors + locked
     unlocked = total - locked
-    return {
-        "total": total,
-        "closed": closed,
-        "open": open_doors,
-        "locked": locked,
-        "unlocked": unlocked,
-    }
+    return DoorCounts(total, closed, open_doors, locked, unlocked)
 
 
 def main():